@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Admission control
+  Decides when a new game may start, so a rush of players waits in line
+  instead of forking interpreters until the kernel's OOM killer takes
+  everyone's game down.
+
+  The budget is memory: a new game is admitted while what the machine (or
+  its cgroup) still has available, less a reserve, covers one more game at
+  the measured cost of the ones already running.  Games admitted in the
+  last SETTLE_S seconds are charged in full on top, since their memory has
+  not shown up yet.  An optional hard cap on games applies as well, and
+  starts are rate-limited, overall and per client address.
+
+  Anyone who cannot start yet queues, first come first served, and is told
+  their place in line as it changes.  Each address may hold only so many
+  places and games at once; beyond that it is turned away.
+
+  Resumed games are not admitted again (they already exist), but their
+  connections count towards their address's share.
+"""
+
+import collections
+import threading
+import time
+
+# Seconds a newly admitted game is charged for before its own memory counts.
+SETTLE_S = 3.0
+# How often the per-game cost is re-measured.
+MEASURE_S = 5.0
+
+
+def mem_available():
+    """Bytes this machine can still give out: MemAvailable, or the cgroup's headroom."""
+    available = None
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    break
+    except OSError:
+        pass
+    try:
+        with open("/sys/fs/cgroup/memory.max") as f:
+            limit = f.read().strip()
+        with open("/sys/fs/cgroup/memory.current") as f:
+            used = int(f.read())
+        if limit != "max":
+            headroom = int(limit) - used
+            available = headroom if available is None else min(available, headroom)
+    except (OSError, ValueError):
+        pass
+    return available
+
+
+class Bucket:
+    """A token bucket: `rate` tokens a second, up to `burst` saved up."""
+
+    def __init__(self, rate, burst):
+        self.rate   = rate
+        self.burst  = burst
+        self.tokens = burst
+        self.stamp  = time.monotonic()
+
+    def ready(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        return self.tokens >= 1
+
+    def take(self):
+        self.tokens -= 1
+
+    def wait(self):
+        """Seconds until the next token."""
+        return max(0.0, (1 - self.tokens) / self.rate) if self.rate > 0 else 1.0
+
+
+class _Ticket:
+    __slots__ = ("ip",)
+
+    def __init__(self, ip):
+        self.ip = ip
+
+
+class Admission:
+    """
+    enter() blocks the calling connection until its game may start;
+    spawned() follows once that game is counted by games() (or failed to
+    start), and leave() when a connection that entered or join()ed ends.
+
+    games() is the number of games running now and costs() the memory, in
+    bytes, of each measurable one.  session_bytes is the cost assumed while
+    nothing can be measured, reserve what is never handed out.  0 turns a
+    limit off, except per_ip which must be at least 1 when set.
+    """
+
+    def __init__(self, games, costs, max_games=0, reserve=32 << 20,
+                 session_bytes=16 << 20, per_ip=0, rate=0.0, ip_rate=0.0,
+                 queue_max=0):
+        self.games     = games
+        self.costs     = costs
+        self.max_games = max_games
+        self.reserve   = reserve
+        self.session_bytes = session_bytes
+        self.per_ip    = per_ip
+        self.queue_max = queue_max
+        self.rate      = Bucket(rate, max(1.0, rate)) if rate > 0 else None
+        self.ip_rate   = ip_rate          # starts per minute per address
+        self._buckets  = {}               # ip → Bucket
+        self._cond     = threading.Condition()
+        self._waiting  = []               # tickets in arrival order
+        self._recent   = collections.deque()   # admit times within SETTLE_S
+        self._spawning = 0                # admitted, not yet in games()
+        self._playing  = collections.Counter() # ip → connections in play
+        self._cost     = None
+        self._measured = 0.0
+        self.results   = collections.Counter()  # admitted, queued, rejected_*, abandoned
+
+    # ── budget ───────────────────────────────────────────────────────────────
+    def cost(self):
+        """Bytes one more game is expected to take."""
+        now = time.monotonic()
+        if now - self._measured >= MEASURE_S:
+            costs = [c for c in self.costs() if c]
+            self._cost = sum(costs) / len(costs) if costs else None
+            self._measured = now
+        return self._cost or self.session_bytes
+
+    def budget(self):
+        """Games that fit right now, counting the ones already running."""
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > SETTLE_S:
+            self._recent.popleft()
+        games = self.games() + self._spawning
+        fit = None
+        available = mem_available()
+        if available is not None:
+            # Recent admits have not shown all their memory yet: charge them.
+            headroom = int((available - self.reserve) // self.cost())
+            fit = games + max(0, headroom - len(self._recent))
+        if self.max_games:
+            fit = self.max_games if fit is None else min(fit, self.max_games)
+        return fit
+
+    # ── connections ──────────────────────────────────────────────────────────
+    def enter(self, ip, notify, alive):
+        """
+        Wait for a game slot for a connection from ip.  notify(place, total)
+        is called with its place in line whenever that changes (0 when
+        admitted); alive() going false abandons the wait.  Returns
+        "admitted", or why not: "ip" (too many from ip), "full" (the line
+        is full) or "abandoned".
+        """
+        ticket = _Ticket(ip)
+        with self._cond:
+            queued = sum(1 for t in self._waiting if t.ip == ip)
+            if self.per_ip and self._playing[ip] + queued >= self.per_ip:
+                self.results["rejected_ip"] += 1
+                return "ip"
+            if self.queue_max and len(self._waiting) >= self.queue_max:
+                self.results["rejected_full"] += 1
+                return "full"
+            self._waiting.append(ticket)
+            shown = None
+            try:
+                while True:
+                    wait = self._turn(ticket)
+                    if wait is None:
+                        break
+                    place = self._waiting.index(ticket) + 1
+                    if place != shown:
+                        if shown is None:
+                            self.results["queued"] += 1
+                        shown = place
+                        self._cond.release()
+                        try:
+                            notify(place, len(self._waiting))
+                        finally:
+                            self._cond.acquire()
+                        continue
+                    if not alive():
+                        self.results["abandoned"] += 1
+                        return "abandoned"
+                    self._cond.wait(wait)
+            finally:
+                if ticket in self._waiting:
+                    self._waiting.remove(ticket)
+                    self._cond.notify_all()
+            self._recent.append(time.monotonic())
+            self._spawning += 1
+            if self.rate:
+                self.rate.take()
+            if self.ip_rate > 0:
+                self._bucket(ip).take()
+            self._playing[ip] += 1
+            self.results["admitted"] += 1
+        if shown is not None:
+            notify(0, 0)
+        return "admitted"
+
+    def spawned(self):
+        """An admitted game is running, or never will: games() has it now."""
+        with self._cond:
+            self._spawning -= 1
+
+    def join(self, ip):
+        """A connection from ip resumed a game: count it, but never queue it."""
+        with self._cond:
+            self._playing[ip] += 1
+
+    def leave(self, ip):
+        """A connection that entered or joined has ended."""
+        with self._cond:
+            self._playing[ip] -= 1
+            if self._playing[ip] <= 0:
+                del self._playing[ip]
+            self._cond.notify_all()
+
+    def blocked(self):
+        """Whether someone is waiting only because there is no room."""
+        with self._cond:
+            return bool(self._waiting) and not self._has_room()
+
+    def wake(self):
+        """Games ended or memory freed up: let the line move."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def _bucket(self, ip):
+        bucket = self._buckets.get(ip)
+        if bucket is None:
+            if len(self._buckets) > 4096:
+                now = time.monotonic()
+                # Forget addresses whose buckets have refilled.
+                for key in [k for k, b in self._buckets.items()
+                            if b.ready(now) and b.tokens >= b.burst]:
+                    del self._buckets[key]
+            # Half a minute's starts may be used at once.
+            bucket = self._buckets[ip] = Bucket(self.ip_rate / 60, max(1.0, self.ip_rate / 2))
+        return bucket
+
+    def _turn(self, ticket):
+        """
+        None if ticket may start now, else how long to wait before looking
+        again.  Lock held.  The first waiter that is allowed goes: one whose
+        address has used up its start rate does not hold up the others.
+        """
+        now = time.monotonic()
+        if not self._has_room():
+            return 1.0
+        if self.rate and not self.rate.ready(now):
+            return self.rate.wait()
+        for t in self._waiting:
+            if self.ip_rate > 0 and not self._bucket(t.ip).ready(now):
+                if t is ticket:
+                    return self._bucket(t.ip).wait()
+                continue
+            return None if t is ticket else 1.0
+        return 1.0
+
+    def _has_room(self):
+        fit = self.budget()
+        return fit is None or self.games() + self._spawning < fit
+
+    # ── reports ──────────────────────────────────────────────────────────────
+    def stats(self):
+        with self._cond:
+            fit = self.budget()
+            return {
+                "budget": fit, "running": self.games(),
+                "spawning": self._spawning, "settling": len(self._recent), "waiting": len(self._waiting),
+                "mem_available": mem_available(), "reserve": self.reserve,
+                "session_bytes": round(self.cost()),
+                "max_games": self.max_games, "per_ip": self.per_ip,
+                "rate": self.rate.rate if self.rate else 0,
+                "ip_rate": self.ip_rate, "queue_max": self.queue_max,
+                "addresses": len(self._playing),
+                **self.results,
+            }
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — asyncio Web Server
+  Same page and /ws protocol as server.py, but every session is a couple of
+  coroutines on one event loop: the PTY master is registered with
+  loop.add_reader() instead of getting its own reader threads.
+  Games are spawned exactly as server.py does (pool, exec or zygote); they
+  always run on PTYs here, DUNGEON_HOSTING=inproc is server.py only.
+  Usage: python3 aserver.py [port]
+"""
+
+import asyncio
+import codecs
+import json
+import os
+import sys
+from urllib.parse import parse_qs
+
+import assets
+import keepalive
+import server
+import wslite
+
+
+# pid → proc of attached games, shared with server.memory_report().
+SESSIONS = server.GAMES
+
+# Pause reading a PTY while this much output is queued for a slow client.
+WRITE_HIGH_WATER = 256 * 1024
+
+# Keepalive pings sent, and connections closed for leaving
+# server.PING_MISSES of them unanswered.
+KEEPALIVE = {"pings": 0, "missed": 0, "reaped": 0}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Game session
+# ─────────────────────────────────────────────────────────────────────────────
+
+async def first_resize(reader, writer, deflate=None):
+    """The browser's first RESIZE as (cols, rows), or 80x24 after 3 s."""
+    try:
+        op, data = await asyncio.wait_for(
+            wslite.read_message(reader, writer, deflate=deflate), timeout=3)
+        text = data.decode("utf-8", "replace")
+        if op == wslite.OP_TEXT and text.startswith("\x00RESIZE:"):
+            _, c, r = text.split(":")
+            return int(c), int(r)
+    except (asyncio.TimeoutError, ValueError):
+        pass
+    return 80, 24
+
+
+async def game_session(reader, writer, binary=False, deflate=None):
+    """
+    Bridge one WebSocket to one game: PTY → browser, browser → PTY.
+    With binary=True PTY bytes are framed as they are, otherwise they are
+    decoded incrementally so a character split between reads survives.
+    deflate is the connection's PerMessageDeflate, if one was negotiated.
+    """
+    loop = asyncio.get_running_loop()
+    if deflate:
+        server.DEFLATE["negotiated"] += 1
+        if server.PRIME:
+            writer.write(wslite.encode_frame(
+                wslite.OP_TEXT, server.PRIME.encode(), deflate=deflate))
+            server.DEFLATE["primed"] += 1
+    warm = server.POOL.acquire() if server.POOL else None
+    if warm:
+        proc, master_fd = warm
+    else:
+        cols, rows = await first_resize(reader, writer, deflate)
+        proc, master_fd = await loop.run_in_executor(
+            None, server.spawn_game, cols, rows)
+    SESSIONS[proc.pid] = proc
+    os.set_blocking(master_fd, False)
+    game_over = loop.create_future()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def pty_readable():
+        try:
+            data = os.read(master_fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            loop.remove_reader(master_fd)
+            if not game_over.done():
+                game_over.set_result(None)
+            return
+        if binary:
+            writer.write(wslite.encode_frame(wslite.OP_BINARY, data, deflate=deflate))
+        else:
+            text = decoder.decode(data)
+            if text:
+                writer.write(wslite.encode_frame(
+                    wslite.OP_TEXT, text.encode(), deflate=deflate))
+        if writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+            # Slow client: stop reading the PTY until the socket drains, so
+            # the game blocks on its own writes instead of us buffering.
+            loop.remove_reader(master_fd)
+            loop.create_task(resume_after_drain())
+
+    async def resume_after_drain():
+        try:
+            await writer.drain()
+        except ConnectionError:
+            return
+        if not game_over.done():
+            loop.add_reader(master_fd, pty_readable)
+
+    answered = [True]
+
+    def pong():
+        answered[0] = True
+
+    async def pings():
+        """Return once the browser has left PING_MISSES pings unanswered."""
+        missed = 0
+        while True:
+            await asyncio.sleep(server.PING_INTERVAL)
+            if answered[0]:
+                missed = 0
+            else:
+                missed += 1
+                KEEPALIVE["missed"] += 1
+                if missed >= server.PING_MISSES:
+                    KEEPALIVE["reaped"] += 1
+                    writer.transport.abort()
+                    return
+            answered[0] = False
+            writer.write(keepalive.PING)
+            KEEPALIVE["pings"] += 1
+
+    async def keystrokes():
+        while True:
+            op, data = await wslite.read_message(reader, writer, deflate=deflate,
+                                                 on_pong=pong)
+            if op == wslite.OP_CLOSE:
+                return
+            text = data.decode("utf-8", "replace")
+            if text.startswith("\x00RESIZE:"):
+                _, c, r = text.split(":")
+                server.resize_game(proc, master_fd, int(r), int(c))
+            else:
+                os.write(master_fd, text.encode())
+
+    loop.add_reader(master_fd, pty_readable)
+    keys = loop.create_task(keystrokes())
+    tasks = {keys, game_over}
+    if server.PING_INTERVAL > 0:
+        tasks.add(loop.create_task(pings()))
+    code = b"\x03\xe8"                      # 1000: normal closure
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            if task is not game_over:
+                task.cancel()
+        if keys.done() and not keys.cancelled() \
+                and isinstance(keys.exception(), wslite.ProtocolError):
+            code = b"\x03\xea"                  # 1002: protocol error
+        loop.remove_reader(master_fd)
+        SESSIONS.pop(proc.pid, None)
+        await loop.run_in_executor(None, server.stop_game, proc, master_fd)
+        try:
+            writer.write(wslite.encode_frame(wslite.OP_CLOSE, code))
+        except Exception:
+            pass
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HTTP
+# ─────────────────────────────────────────────────────────────────────────────
+
+def http_response(status, body, content_type="text/html; charset=utf-8"):
+    return (
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode() + body
+
+
+def asset_response(asset, headers):
+    """A page or static file, compressed and cached as server.py sends it."""
+    status, out, body = assets.respond(asset, {k.title(): v for k, v in headers.items()})
+    lines = [f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Modified'}"]
+    lines += [f"{k}: {v}" for k, v in out.items()]
+    lines += [f"Content-Length: {len(body)}", "Connection: close", "", ""]
+    return "\r\n".join(lines).encode() + body
+
+
+async def handle(reader, writer):
+    try:
+        request, headers = await wslite.read_headers(reader)
+        parts = request.split()
+        target = parts[1] if len(parts) > 1 else "/"
+        path, _, query = target.partition("?")
+
+        if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+            frames  = parse_qs(query).get("frames", [server.FRAMES])[0]
+            deflate = wslite.negotiate_deflate(headers.get("sec-websocket-extensions", ""))
+            writer.write(wslite.handshake_response(headers["sec-websocket-key"], deflate))
+            await game_session(reader, writer, binary=frames == "binary",
+                               deflate=deflate)
+        elif path == "/":
+            writer.write(asset_response(server.PAGE, headers))
+        elif path.startswith("/static/") and server.STATIC.get(path[8:]):
+            writer.write(asset_response(server.STATIC.get(path[8:]), headers))
+        elif path == "/healthz":
+            # Answered by the event loop itself: if it can reply, it serves.
+            writer.write(http_response("200 OK", b"ok\n", "text/plain"))
+        elif path == "/stats":
+            body = json.dumps({
+                "server": "asyncio",
+                "sessions": len(SESSIONS),
+                "deflate": server.DEFLATE,
+                "keepalive": KEEPALIVE,
+                "memory": server.memory_report(),
+            }).encode()
+            writer.write(http_response("200 OK", body, "application/json"))
+        else:
+            writer.write(http_response("404 Not Found", b"Not Found", "text/plain"))
+        await writer.drain()
+    except wslite.ProtocolError:
+        try:
+            writer.write(wslite.encode_frame(wslite.OP_CLOSE, b"\x03\xea"))   # 1002
+            await writer.drain()
+        except ConnectionError:
+            pass
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+            ConnectionError, KeyError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(port):
+    if server.ZYGOTE:
+        server.ZYGOTE.start()
+    if server.POOL:
+        server.POOL.start()
+    srv = await asyncio.start_server(handle, "0.0.0.0", port)
+    async with srv:
+        await srv.serve_forever()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Entry point
+# ─────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    port = int(os.environ.get("PORT", sys.argv[1] if len(sys.argv) > 1 else 5000))
+    print("\n  Dungeon of the Forgotten King — asyncio Web Server")
+    print("  ─────────────────────────────────────────")
+    print(f"  Local:   http://localhost:{port}")
+    print(f"  Pool:    {server.POOL_SIZE} warm game(s), spawn mode: {server.SPAWN_MODE}")
+    print("\n  Press Ctrl+C to stop.\n")
+    try:
+        asyncio.run(serve(port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server.POOL:
+            server.POOL.shutdown()
+        if server.ZYGOTE:
+            server.ZYGOTE.shutdown()
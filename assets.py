@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Static assets
+  The page and the vendored xterm.js files (static/), held in memory and
+  compressed once at startup: every response is a dict lookup, never a
+  disk read or a per-request gzip.
+
+  Each asset has a strong ETag per encoding and a fingerprinted URL
+  (/static/xterm.1a2b3c4d.js) that is cached as immutable; the plain name
+  and the page itself are served with no-cache, so a repeat visit is one
+  conditional GET answered 304.  Brotli is used when the brotli package is
+  installed, gzip always.
+
+  Framework-neutral: respond() takes the request headers and returns
+  (status, headers, body) for Flask and aserver alike.
+"""
+
+import copy
+import gzip
+import hashlib
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+TYPES = {
+    ".css":  "text/css; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+    ".js":   "text/javascript; charset=utf-8",
+    ".mjs":  "text/javascript; charset=utf-8",
+}
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Appended to the ETag of each encoded body.
+_SUFFIX = {"br": "-br", "gzip": "-gz", "identity": ""}
+
+
+class Asset:
+    """One body in every encoding worth sending, with its validators."""
+
+    def __init__(self, body, content_type, cache=REVALIDATE):
+        self.content_type = content_type
+        self.cache        = cache
+        self.digest       = hashlib.sha256(body).hexdigest()
+        self.bodies       = {"identity": body}
+        if brotli:
+            self.bodies["br"] = brotli.compress(body, quality=11)
+        self.bodies["gzip"] = gzip.compress(body, 9, mtime=0)
+        for enc in ("br", "gzip"):
+            if enc in self.bodies and len(self.bodies[enc]) >= len(body):
+                del self.bodies[enc]
+
+    def etag(self, encoding):
+        # Strong validators differ per encoding (RFC 9110 8.8.3).
+        return f'"{self.digest[:32]}{_SUFFIX[encoding]}"'
+
+    def cached_as(self, cache):
+        """The same bodies under another Cache-Control."""
+        twin = copy.copy(self)
+        twin.cache = cache
+        return twin
+
+    def sizes(self):
+        return {enc: len(b) for enc, b in self.bodies.items()}
+
+
+def accepted(header):
+    """Accept-Encoding as {coding: q}."""
+    out = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for p in params.split(";"):
+            key, _, value = p.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name:
+            out[name.strip().lower()] = q
+    return out
+
+
+def choose_encoding(asset, header):
+    prefs = accepted(header)
+    star = prefs.get("*", 0.0)
+    for enc in ("br", "gzip"):
+        if enc in asset.bodies and prefs.get(enc, star) > 0:
+            return enc
+    return "identity"
+
+
+def not_modified(asset, header):
+    """True if If-None-Match names any representation of asset."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return any(asset.etag(enc) in tags for enc in asset.bodies)
+
+
+def respond(asset, headers):
+    """
+    (status, headers, body) for a GET of asset, where headers is a mapping
+    of the request headers.  Status is 200 or 304.
+    """
+    enc = choose_encoding(asset, headers.get("Accept-Encoding"))
+    out = {
+        "Content-Type":  asset.content_type,
+        "Cache-Control": asset.cache,
+        "ETag":          asset.etag(enc),
+        "Vary":          "Accept-Encoding",
+    }
+    if not_modified(asset, headers.get("If-None-Match")):
+        return 304, out, b""
+    if enc != "identity":
+        out["Content-Encoding"] = enc
+    return 200, out, asset.bodies[enc]
+
+
+class Bundle:
+    """
+    Every file in a directory, reachable by its plain name (revalidated)
+    and by a fingerprinted name (immutable).  url(name) gives the latter.
+    """
+
+    def __init__(self, directory=STATIC_DIR, prefix="/static/"):
+        self.prefix = prefix
+        self.assets = {}
+        self.urls   = {}
+        for path in sorted(Path(directory).iterdir()):
+            kind = TYPES.get(path.suffix)
+            if not kind:
+                continue
+            body = path.read_bytes()
+            plain = Asset(body, kind)
+            fingerprinted = f"{path.stem}.{plain.digest[:8]}{path.suffix}"
+            self.assets[path.name] = plain
+            self.assets[fingerprinted] = plain.cached_as(IMMUTABLE)
+            self.urls[path.name] = prefix + fingerprinted
+
+    def url(self, name):
+        return self.urls[name]
+
+    def get(self, name):
+        return self.assets.get(name)
+
+    def link(self, text):
+        """text with every prefix+name replaced by its fingerprinted URL."""
+        for name, url in self.urls.items():
+            text = text.replace(self.prefix + name, url)
+        return text
+
+    def report(self):
+        return {name: self.assets[name].sizes() for name in self.urls}
@@ -0,0 +1,1188 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Benchmarks
+  Usage: python3 bench.py <benchmark> [options]
+         python3 bench.py --help
+"""
+
+import argparse
+import asyncio
+import codecs
+import collections
+import json
+import re
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import server
+import vterm
+import wslite
+
+HERE = Path(__file__).parent
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+def self_rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def read_until(fd, marker, timeout=15):
+    """Drain a PTY master until `marker` shows up; returns bytes read."""
+    import select
+    seen = b""
+    deadline = time.monotonic() + timeout
+    while marker not in seen and time.monotonic() < deadline:
+        r, _, _ = select.select([fd], [], [], 0.1)
+        if r:
+            seen += os.read(fd, 65536)
+    return seen
+
+
+def proc_status(pid):
+    """Thread count and context switches summed over all of a process's threads."""
+    threads = switches = 0
+    for tid in os.listdir(f"/proc/{pid}/task"):
+        try:
+            with open(f"/proc/{pid}/task/{tid}/status") as f:
+                for line in f:
+                    if "ctxt_switches" in line:
+                        switches += int(line.split()[1])
+        except OSError:
+            continue   # thread exited while we were looking
+        threads += 1
+    return threads, switches
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+# Every client here comes from 127.0.0.1, so the servers started here lift
+# the per-address limits (DUNGEON_IP_SESSIONS would otherwise stop a run at
+# four players).  A server given to --external needs the same settings.
+ONE_ADDRESS = {"DUNGEON_IP_SESSIONS": "0", "DUNGEON_IP_SPAWN_RATE": "0"}
+
+
+def start_server(script, port, env=None):
+    proc = subprocess.Popen(
+        [sys.executable, str(HERE / script), str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        env={**os.environ, **ONE_ADDRESS, **(env or {})},
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            import urllib.request
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/stats", timeout=1)
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"{script} did not come up on port {port}")
+
+
+def stop_server(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+class Client:
+    """One scripted browser: a WebSocket plus everything it has received."""
+
+    def __init__(self):
+        self.reader = self.writer = None
+        self.screen = ""
+        self.term   = vterm.Screen(100, 40)   # what the page would show
+        self.received = 0          # payload bytes, text and binary alike
+        self.control = []          # NUL-prefixed messages for the page
+        self.log = None            # [(arrival time, message)] when set to a list
+        self.arrived = asyncio.Event()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    async def open(self, port, path="/ws"):
+        self.reader, self.writer = await wslite.connect("127.0.0.1", port, path)
+        self.send("\x00RESIZE:100:40")
+        asyncio.get_running_loop().create_task(self._pump())
+
+    def send(self, text):
+        self.writer.write(wslite.encode_frame(wslite.OP_TEXT, text.encode(), mask=True))
+
+    async def _pump(self):
+        while True:
+            op, data = await wslite.read_message(self.reader, self.writer, mask=True)
+            if op == wslite.OP_CLOSE:
+                break
+            self.received += len(data)
+            if self.log is not None:
+                self.log.append((time.monotonic(), data))
+            if data[:1] == b"\x00":
+                self.control.append(data.decode("utf-8", "replace"))
+                continue          # control message for the page, not output
+            text = self._decoder.decode(data)
+            self.screen += text
+            self.term.feed(text)
+            self.arrived.set()
+
+    async def wait_for(self, marker, timeout=15):
+        deadline = time.monotonic() + timeout
+        while marker not in self.screen:
+            self.arrived.clear()
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise asyncio.TimeoutError(marker)
+            await asyncio.wait_for(self.arrived.wait(), left)
+
+    async def round_trip(self, key):
+        """Seconds from sending one key to the first byte that comes back."""
+        self.arrived.clear()
+        t0 = time.monotonic()
+        self.send(key)
+        await asyncio.wait_for(self.arrived.wait(), 10)
+        return time.monotonic() - t0
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+
+
+def table(rows, headers):
+    widths = [max(len(str(x)) for x in col) for col in zip(headers, *rows)]
+    line = "  ".join(f"{{:>{w}}}" for w in widths)
+    print(line.format(*headers))
+    for row in rows:
+        print(line.format(*row))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# hosting: one process per player vs games inside the server
+# ─────────────────────────────────────────────────────────────────────────────
+
+ROOM_MARKER = "Commands:"
+
+
+def bench_pty(n):
+    """Start n games on PTYs and walk each one to the first room."""
+    t0 = time.monotonic()
+    games = [server.spawn_game(80, 24) for _ in range(n)]
+    for _, fd in games:
+        os.write(fd, b"Bench\r\r")
+    for _, fd in games:
+        read_until(fd, ROOM_MARKER.encode())
+    elapsed = time.monotonic() - t0
+    mem = [server.proc_memory(proc.pid) for proc, _ in games]
+    mem = [m for m in mem if m]
+    for game in games:
+        server.stop_game(*game)
+    return {
+        "seconds":  elapsed,
+        "rss_kb":   sum(m["rss_kb"] for m in mem),
+        "pss_kb":   sum(m["pss_kb"] for m in mem),
+        # request thread + pty_reader + ws_reader per session
+        "threads":  3 * n,
+    }
+
+
+def bench_inproc(n):
+    """Run n Games on WebConsoles in this process up to the first room."""
+    before_rss     = self_rss_kb()
+    before_threads = threading.active_count()
+    t0 = time.monotonic()
+    consoles, arrived = [], []
+    for _ in range(n):
+        reached = threading.Event()
+
+        def send(text, reached=reached):
+            if ROOM_MARKER in text:
+                reached.set()
+
+        con = server.WebConsole(send)
+        threading.Thread(target=server.run_inproc, args=(con,), daemon=True).start()
+        con.feed("Bench\r\r")
+        consoles.append(con)
+        arrived.append(reached)
+    for reached in arrived:
+        reached.wait(timeout=15)
+    elapsed = time.monotonic() - t0
+    rss     = self_rss_kb() - before_rss
+    # game threads measured, plus the request thread that feeds each one
+    threads = threading.active_count() - before_threads + n
+    for con in consoles:
+        con.hangup()
+    return {"seconds": elapsed, "rss_kb": rss, "pss_kb": rss, "threads": threads}
+
+
+def cmd_hosting(args):
+    rows = []
+    for n in args.sessions:
+        for mode, fn in (("pty", bench_pty), ("inproc", bench_inproc)):
+            r = fn(n)
+            rows.append((mode, n, f"{r['seconds']:.2f}",
+                         r["rss_kb"] // 1024, r["pss_kb"] // 1024,
+                         round(r["pss_kb"] / n), r["threads"]))
+    table(rows, ("mode", "sessions", "to room s", "RSS MB", "PSS MB",
+                 "kB/session", "threads"))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# servers: Flask thread-per-session bridge vs asyncio event loop
+# ─────────────────────────────────────────────────────────────────────────────
+
+NAME_PROMPT = "hero's name"
+
+
+async def load_server(port, n, keys=20):
+    """
+    Hold n sessions open at the name prompt, then measure keystroke echo
+    round trips while they are all attached.
+    """
+    clients = [Client() for _ in range(n)]
+
+    async def attach(c):
+        await c.open(port)
+        await c.wait_for(NAME_PROMPT)
+
+    results = await asyncio.gather(*(attach(c) for c in clients),
+                                   return_exceptions=True)
+    live = [c for c, r in zip(clients, results) if r is None]
+    rtts = []
+    for _ in range(keys):
+        async def one(c):
+            rtt = await c.round_trip("a")
+            await c.round_trip("\x7f")
+            return rtt
+        got = await asyncio.gather(*(one(c) for c in live), return_exceptions=True)
+        rtts += [r for r in got if isinstance(r, float)]
+    return clients, live, rtts
+
+
+def cmd_servers(args):
+    rows = []
+    env = {"DUNGEON_POOL_SIZE": "0", "DUNGEON_SPAWN": args.spawn,
+           "DUNGEON_RESUME_GRACE": "0"}
+    for name, script in (("threaded", "server.py"), ("asyncio", "aserver.py")):
+        port = args.port
+        srv = start_server(script, port, env)
+        try:
+            for n in args.sessions:
+                threads, idle_cs, live, rtts = asyncio.run(
+                    _servers_step(port, n, srv.pid))
+                rows.append((name, n, len(live),
+                             f"{percentile(rtts, 50) * 1000:.1f}",
+                             f"{percentile(rtts, 99) * 1000:.1f}",
+                             threads, idle_cs))
+        finally:
+            stop_server(srv)
+    table(rows, ("server", "sessions", "attached", "rtt p50 ms",
+                 "rtt p99 ms", "threads", "idle cs/s"))
+
+
+async def _servers_step(port, n, pid):
+    clients, live, rtts = await load_server(port, n)
+    threads, cs0 = proc_status(pid)
+    await asyncio.sleep(2)
+    _, cs1 = proc_status(pid)
+    for c in clients:
+        c.close()
+    await asyncio.sleep(1)   # let the server reap before the next step
+    return threads, (cs1 - cs0) // 2, live, rtts
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# frames: per-read decoding vs incremental decoding vs raw binary frames
+# ─────────────────────────────────────────────────────────────────────────────
+
+# (screen, keys that bring it up) — a room, the map, help, the journal and
+# the inventory, each left with Enter, which redraws the room; then the
+# armory next door.
+SCREENS = [("title", b""), ("intro", b"Bench\r"), ("room", b"\r")] + [
+    step for _ in range(3)
+    for step in (("map", b"m\r"), ("room", b"\r"), ("help", b"?\r"), ("room", b"\r"),
+                 ("journal", b"j\r"), ("room", b"\r"), ("inventory", b"i\r"),
+                 ("room", b"\r"))
+] + [("room", b"e\r")]
+
+
+def read_screen(fd, bufsize=4096, quiet=0.4):
+    """PTY reads, as the server made them, until output pauses."""
+    import select
+    chunks = []
+    while select.select([fd], [], [], quiet)[0]:
+        try:
+            chunks.append(os.read(fd, bufsize))
+        except OSError:
+            break
+    return chunks
+
+
+def capture_session():
+    """Play through SCREENS on a real PTY; returns [(step, screen, read), ...]."""
+    proc, fd = server.spawn_game(100, 40)
+    reads = []
+    try:
+        for step, (name, keys) in enumerate(SCREENS):
+            if keys:
+                os.write(fd, keys)
+            reads += [(step, name, chunk) for chunk in read_screen(fd)]
+    finally:
+        server.stop_game(proc, fd)
+    return reads
+
+
+def capture_screens():
+    """capture_session() grouped as {screen: [reads]}."""
+    screens = {}
+    for _, name, chunk in capture_session():
+        screens.setdefault(name, []).append(chunk)
+    return screens
+
+
+def _per_read(chunks):
+    return [c.decode("utf-8", "replace").encode() for c in chunks]
+
+
+def _incremental(chunks):
+    dec = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    return [dec.decode(c).encode() for c in chunks]
+
+
+def _binary(chunks):
+    return list(chunks)
+
+
+def _cost_us(fn, chunks, repeat=200):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(chunks)
+    return (time.perf_counter() - t0) / repeat * 1e6
+
+
+def cmd_frames(args):
+    screens = capture_screens()
+    rows = []
+    for name, chunks in screens.items():
+        raw = b"".join(chunks)
+        lost = sum(p.count("\ufffd".encode()) for p in _per_read(chunks))
+        kept = sum(p.count("\ufffd".encode()) for p in _incremental(chunks))
+        rows.append((name, len(raw), len(chunks), lost, kept,
+                     f"{_cost_us(_per_read, chunks):.1f}",
+                     f"{_cost_us(_incremental, chunks):.1f}",
+                     f"{_cost_us(_binary, chunks):.1f}"))
+    table(rows, ("screen", "bytes", "reads", "U+FFFD per-read", "U+FFFD incr",
+                 "per-read us", "incr us", "binary us"))
+    print()
+
+    rows = []
+    env = {"DUNGEON_POOL_SIZE": "0", "DUNGEON_SPAWN": "zygote",
+           "DUNGEON_RESUME_GRACE": "0"}
+    for name, script in (("threaded", "server.py"), ("asyncio", "aserver.py")):
+        srv = start_server(script, args.port, env)
+        try:
+            for frames in ("text", "binary"):
+                r = asyncio.run(_frames_step(args.port, srv.pid, args.sessions,
+                                             args.rounds, frames))
+                rows.append((name, frames, r["rooms"], r["bytes"] // 1024,
+                             f"{r['cpu_s'] * 1000:.0f}",
+                             f"{r['cpu_s'] * 1e6 / max(r['bytes'], 1) * 1024:.1f}",
+                             r["fffd"]))
+        finally:
+            stop_server(srv)
+    table(rows, ("server", "frames", "room draws", "kB", "server CPU ms",
+                 "CPU us/kB", "U+FFFD"))
+
+
+async def _frames_step(port, pid, n, rounds, frames):
+    """n players each redraw their room `rounds` times; server CPU meanwhile."""
+    clients = [Client() for _ in range(n)]
+
+    async def enter(c):
+        await c.open(port, f"/ws?frames={frames}")
+        await c.wait_for(NAME_PROMPT)
+        c.send("Bench\r")
+        await c.wait_for("Press Enter")
+        c.send("\r")
+        await c.wait_for(ROOM_MARKER)
+
+    fffd = [0]
+
+    async def redraw(c):
+        for _ in range(rounds):
+            c.screen = ""
+            c.send("\r")                 # unknown command …
+            await c.wait_for("Press Enter")
+            c.screen = ""
+            c.send("\r")                 # … and back to the room
+            await c.wait_for(ROOM_MARKER)
+            fffd[0] += c.screen.count("\ufffd")
+
+    await asyncio.gather(*(enter(c) for c in clients))
+    received0 = sum(c.received for c in clients)
+    cpu0 = server.proc_cpu_seconds(pid)
+    await asyncio.gather(*(redraw(c) for c in clients))
+    cpu = server.proc_cpu_seconds(pid) - cpu0
+    received = sum(c.received for c in clients) - received0
+    for c in clients:
+        c.close()
+    await asyncio.sleep(1)
+    return {"rooms": n * rounds, "bytes": received, "cpu_s": cpu, "fffd": fffd[0]}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# deflate: what permessage-deflate saves per screen type
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _deflated(messages, takeover=True, prime=None, zdict=None):
+    """Wire bytes per message under permessage-deflate, in order."""
+    import zlib
+    if takeover:
+        pmd = wslite.PerMessageDeflate()
+        if prime:
+            pmd.compress(prime)
+        return [len(pmd.compress(m)) for m in messages]
+    sizes = []
+    for m in messages:
+        c = zlib.compressobj(6, zlib.DEFLATED, -15, **({"zdict": zdict} if zdict else {}))
+        sizes.append(len(c.compress(m) + c.flush(zlib.Z_SYNC_FLUSH)) - 4)
+    return sizes
+
+
+def cmd_deflate(args):
+    session  = capture_session()
+    steps    = [step for step, _, _ in session]
+    names    = [name for _, name, _ in session]
+    messages = [chunk for _, _, chunk in session]
+    prime    = ("\x00PRIME\n" + server.deflate_dictionary()).encode()
+    dictionary = prime[-32 * 1024:]
+    columns = {
+        "raw":         [len(m) for m in messages],
+        "per-message": _deflated(messages, takeover=False),
+        "takeover":    _deflated(messages),
+        "primed":      _deflated(messages, prime=prime),
+        "preset dict": _deflated(messages, takeover=False, zdict=dictionary),
+    }
+    prime_cost = len(wslite.PerMessageDeflate().compress(prime))
+
+    def row(label, pick):
+        sums = {k: sum(v[i] for i in pick) for k, v in columns.items()}
+        return (label, len(pick), *(sums[k] for k in columns),
+                f"{sums['raw'] / max(sums['takeover'], 1):.1f}x")
+
+    rows  = [row(name, [i for i, n in enumerate(names) if n == name])
+             for name in dict.fromkeys(names)]
+    # The first time each screen is shown: nothing to back-reference yet
+    # unless the connection was primed.
+    first_step = {}
+    for step, name in zip(steps, names):
+        first_step.setdefault(name, step)
+    first = [i for i, step in enumerate(steps) if step in first_step.values()]
+    rows.append(row("first views", first))
+    rows.append(row("session", range(len(names))))
+    table(rows, ("screen", "frames", *columns, "ratio"))
+    print(f"\nprime message: {len(prime)} bytes raw, {prime_cost} on the wire "
+          f"(paid once per connection; not included above)")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# vterm: screen model cost, and repaint vs replaying the output log
+# ─────────────────────────────────────────────────────────────────────────────
+
+def cmd_vterm(args):
+    import tracemalloc
+    session = capture_session()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    chunks  = [(step, name, decoder.decode(chunk)) for step, name, chunk in session]
+
+    # What a page reconnecting after each screen would be sent.
+    rows, screen, log = [], vterm.Screen(100, 40), 0
+    for i, (step, name, text) in enumerate(chunks):
+        screen.feed(text)
+        log += len(text.encode())
+        if i + 1 == len(chunks) or chunks[i + 1][0] != step:
+            rows.append((step, name, log, len(screen.repaint().encode())))
+    seen = set()
+    rows = [r for r in rows if not (r[1] in seen or seen.add(r[1]))]
+    table(rows, ("step", "screen", "log bytes", "repaint bytes"))
+    print()
+
+    rows = []
+    for n in args.sessions:
+        screens = [vterm.Screen(100, 40) for _ in range(n)]
+        t0 = time.perf_counter()
+        for _, _, text in chunks:          # interleaved, as the hub sees it
+            for sc in screens:
+                sc.feed(text)
+        elapsed = time.perf_counter() - t0
+        kchars = sum(sc.fed for sc in screens) / 1000
+        t0 = time.perf_counter()
+        for sc in screens:
+            sc.repaint()
+        paint = (time.perf_counter() - t0) / n
+        # Memory on a separate pass: tracing would distort the timings.
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        screens = [vterm.Screen(100, 40) for _ in range(n)]
+        for _, _, text in chunks:
+            for sc in screens:
+                sc.feed(text)
+        mem = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        rows.append((n, f"{mem / n / 1024:.1f}", f"{elapsed * 1e6 / kchars:.0f}",
+                     f"{elapsed * 1000:.0f}", f"{paint * 1000:.2f}"))
+    table(rows, ("sessions", "kB/session", "us/kchar", "parse ms total",
+                 "repaint ms"))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# load: scripted players against a server, ramping up concurrency
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Commands typed at the room prompt.  Everything in between (pause()
+# Enters, combat targets and attacks, take menus) is answered by
+# Player.reply(), so a script survives locked exits and lost fights.
+PLAYTHROUGHS = {
+    "explorer": ["m", "?", "j", "i", "x", "t", "n", "x", "s", "e", "x", "t"],
+    "fighter":  ["e", "f", "t", "i", "w", "f", "n", "f", "x", "j"],
+}
+
+ANSI = re.compile(r"\x1b\[[0-9;?]*[@-~]|\x1b\][^\x07]*\x07")
+
+
+def upto_cursor(screen):
+    """A vterm screen's text down to its cursor: the prompt is the last line."""
+    rows = [row.replace(vterm.FILLER, "").rstrip() for row in screen.chars[:screen.y]]
+    rows.append(screen.chars[screen.y][:screen.x].replace(vterm.FILLER, ""))
+    return "\n".join(rows)
+
+
+def answer(screen, name, script, quitting=False):
+    """
+    What a scripted player types at the prompt `screen` ends on, as (line,
+    quitting); line is None if the game is still printing.  Room commands
+    come off the front of script, and once it is empty the player quits.
+    """
+    lines = ANSI.sub("", screen[-3000:]).replace("\r", "").split("\n")
+    prompt = lines[-1]
+    if "hero's name" in prompt:
+        return name, quitting
+    if prompt.strip().startswith("[") and "Enter" in prompt:
+        return "", quitting
+    if "(y/n)" in prompt:
+        return ("y" if quitting else "n"), quitting
+    if prompt.strip() in ("Use #:", "Item # to use/equip:", "Drop item #:"):
+        return "1", quitting
+    if prompt.strip() != ">":
+        return None, quitting
+    above = "\n".join(lines[-12:-1])
+    if "Commands:" in above:
+        if script:
+            return script.pop(0), quitting
+        return "q", True
+    if "Actions:" in above:
+        return "1", quitting                 # attack
+    if "c. Cancel" in above:
+        return "0", quitting                 # take everything
+    if "3. Back" in above:
+        return "3", quitting
+    if re.search(r"^\s+1\. ", above, re.M):
+        return "1", quitting                 # first target
+    return "", quitting
+
+
+class Player(Client):
+    """A Client that plays: it waits for a prompt, answers it, repeats."""
+
+    def __init__(self, name, script, key_delay, think):
+        super().__init__()
+        self.name      = name
+        self.script    = list(script)
+        self.key_delay = key_delay
+        self.think     = think
+        self.quitting  = False
+        self.echo      = []        # key → its echo, seconds
+        self.response  = []        # Enter → first game output, seconds
+        self.spawn     = None      # connect → first output, seconds
+        self.inputs    = 0
+        self.closed    = False
+
+    def reply(self):
+        """What to type at the prompt the screen ends on, or None if the
+        game is still printing."""
+        # The screen, not the stream: a redrawn screen only sends what changed.
+        line, self.quitting = answer(upto_cursor(self.term), self.name, self.script, self.quitting)
+        return line
+
+    async def type_line(self, line):
+        for ch in line:
+            self.echo.append(await self.round_trip(ch))
+            await asyncio.sleep(self.key_delay)
+        self.screen = self.screen[-3000:]
+        self.response.append(await self.round_trip("\r"))
+        self.inputs += len(line) + 1
+
+    async def play(self, port, path, timeout=20):
+        t0 = time.monotonic()
+        await self.open(port, path)
+        await asyncio.wait_for(self.arrived.wait(), timeout)
+        self.spawn = time.monotonic() - t0
+        while True:
+            deadline = time.monotonic() + timeout
+            while (line := self.reply()) is None:
+                self.arrived.clear()
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise asyncio.TimeoutError("no prompt")
+                try:
+                    await asyncio.wait_for(self.arrived.wait(), min(left, 0.5))
+                except asyncio.TimeoutError:
+                    if self.reader.at_eof():
+                        return           # the game ended
+            await asyncio.sleep(self.think)
+            await self.type_line(line)
+            if self.quitting and line == "y":
+                return
+
+
+def scrape_metrics(port):
+    """Server RSS and the game processes' RSS/unique memory from /metrics."""
+    import urllib.request
+    text = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode()
+    out = {"server_rss": 0, "children_rss": 0, "children_unique": 0}
+    for line in text.splitlines():
+        name, _, value = line.rpartition(" ")
+        if name == "process_resident_memory_bytes":
+            out["server_rss"] = float(value)
+        elif name.startswith("dungeon_child_rss_bytes"):
+            out["children_rss"] += float(value)
+        elif name.startswith("dungeon_child_unique_bytes"):
+            out["children_unique"] += float(value)
+    return out
+
+
+def _summary(values):
+    ms = [v * 1000 for v in values]
+    return {"n": len(ms), "p50": round(percentile(ms, 50), 2),
+            "p95": round(percentile(ms, 95), 2), "p99": round(percentile(ms, 99), 2),
+            "max": round(max(ms), 2) if ms else 0.0}
+
+
+async def load_level(args, n):
+    names = list(PLAYTHROUGHS)
+    players = [Player(f"Load{i}", PLAYTHROUGHS[names[i % len(names)]],
+                      args.key_delay, args.think) for i in range(n)]
+    peak = {"server_rss": 0, "children_rss": 0, "children_unique": 0}
+    done = asyncio.Event()
+
+    async def sample():
+        while not done.is_set():
+            try:
+                m = await asyncio.get_running_loop().run_in_executor(
+                    None, scrape_metrics, args.port)
+                for k in peak:
+                    peak[k] = max(peak[k], m[k])
+            except OSError:
+                pass
+            try:
+                await asyncio.wait_for(done.wait(), 1)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(i, p):
+        await asyncio.sleep(i * args.stagger)
+        try:
+            await p.play(args.port, args.path)
+            return None
+        except (asyncio.TimeoutError, OSError, wslite.ProtocolError) as e:
+            return f"{type(e).__name__}: {e}"
+        finally:
+            p.close()
+
+    sampler = asyncio.get_running_loop().create_task(sample())
+    t0 = time.monotonic()
+    errors = await asyncio.gather(*(run(i, p) for i, p in enumerate(players)))
+    elapsed = time.monotonic() - t0
+    done.set()
+    await sampler
+    errors = [e for e in errors if e]
+    mb = 1024 * 1024
+    return {
+        "clients": n,
+        "completed": n - len(errors),
+        "errors": errors[:10],
+        "duration_s": round(elapsed, 2),
+        "spawn_ms": _summary([p.spawn for p in players if p.spawn is not None]),
+        "echo_ms": _summary([v for p in players for v in p.echo]),
+        "response_ms": _summary([v for p in players for v in p.response]),
+        "inputs_per_s": round(sum(p.inputs for p in players) / elapsed, 1),
+        "out_kb_per_s": round(sum(p.received for p in players) / elapsed / 1024, 1),
+        "server_rss_mb": round(peak["server_rss"] / mb, 1),
+        "children_rss_mb": round(peak["children_rss"] / mb, 1),
+        "children_unique_mb": round(peak["children_unique"] / mb, 1),
+    }
+
+
+def cmd_load(args):
+    srv = None
+    if not args.external:
+        srv = start_server("server.py", args.port, {"DUNGEON_RESUME_GRACE": "0"})
+    levels = []
+    try:
+        for n in args.ramp:
+            levels.append(asyncio.run(load_level(args, n)))
+            time.sleep(2)                # let the server reap between levels
+    finally:
+        if srv:
+            stop_server(srv)
+    table([(lv["clients"], lv["completed"], lv["duration_s"],
+            lv["spawn_ms"]["p50"], lv["echo_ms"]["p50"], lv["echo_ms"]["p95"],
+            lv["echo_ms"]["p99"], lv["response_ms"]["p50"], lv["response_ms"]["p95"],
+            lv["response_ms"]["p99"], lv["inputs_per_s"], lv["out_kb_per_s"],
+            lv["server_rss_mb"], lv["children_unique_mb"]) for lv in levels],
+          ("clients", "done", "secs", "spawn p50", "echo p50", "p95", "p99",
+           "resp p50", "p95", "p99", "keys/s", "out kB/s", "server MB", "games MB"))
+    if args.report:
+        try:
+            commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                                    capture_output=True, text=True).stdout.strip()
+        except OSError:
+            commit = ""
+        report = {
+            "tool": "bench.py load",
+            "commit": commit,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "settings": {k: v for k, v in vars(args).items() if k != "func"},
+            "env": {k: v for k, v in os.environ.items() if k.startswith("DUNGEON_")},
+            "levels": levels,
+        }
+        Path(args.report).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nreport written to {args.report}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# workers: the load above against 1, 2, 4… server worker processes
+# ─────────────────────────────────────────────────────────────────────────────
+
+def server_cpu(pid):
+    """CPU seconds of server.py and its worker processes, not the games."""
+    total = server.proc_cpu_seconds(pid) or 0.0
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            children = f.read().split()
+    except OSError:
+        children = []
+    for child in children:
+        try:
+            with open(f"/proc/{child}/cmdline", "rb") as f:
+                if b"server.py" not in f.read():
+                    continue             # a game or the zygote
+        except OSError:
+            continue
+        total += server.proc_cpu_seconds(child) or 0.0
+    return total
+
+
+def cmd_workers(args):
+    rows, levels = [], []
+    for n in args.counts:
+        srv = start_server("server.py", args.port, {
+            "DUNGEON_WORKERS": str(n), "DUNGEON_RESUME_GRACE": "0",
+            "DUNGEON_HIBERNATE_AFTER": "0"})
+        try:
+            time.sleep(1)                # let every worker fill its pool
+            cpu0 = server_cpu(srv.pid)
+            level = asyncio.run(load_level(args, args.clients))
+            cpu = server_cpu(srv.pid) - cpu0
+        finally:
+            stop_server(srv)
+        level["workers"] = n
+        level["server_cpu_s"] = round(cpu, 2)
+        levels.append(level)
+        rows.append((n, level["completed"], level["duration_s"], level["inputs_per_s"],
+                     level["out_kb_per_s"], level["echo_ms"]["p50"], level["echo_ms"]["p99"],
+                     level["response_ms"]["p99"], round(cpu, 2),
+                     round(cpu / level["duration_s"] * 100)))
+        time.sleep(1)
+    print(f"\n  {args.clients} scripted players, {os.cpu_count()} CPU(s)\n")
+    table(rows, ("workers", "done", "secs", "keys/s", "out kB/s", "echo p50",
+                 "p99", "resp p99", "server CPU s", "CPU %"))
+    if args.report:
+        Path(args.report).write_text(json.dumps(
+            {"tool": "bench.py workers", "cpus": os.cpu_count(),
+             "clients": args.clients, "levels": levels}, indent=2) + "\n")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# watch: one player, many spectators
+# ─────────────────────────────────────────────────────────────────────────────
+
+class Host(Player):
+    """A Player that notes when each key went out."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.sent_at = []
+
+    def send(self, text):
+        self.sent_at.append(time.monotonic())
+        super().send(text)
+
+
+def final_screen(log, cols=100, rows=40):
+    """The screen a page ends on after the messages in log."""
+    screen = vterm.Screen(cols, rows)
+    for _, data in log:
+        if data.startswith(b"\x00SCREEN:"):
+            screen = vterm.Screen(cols, rows)
+            screen.feed(data[8:].decode())
+        elif data[:1] != b"\x00":
+            screen.feed(data.decode())
+    return screen.repaint()
+
+
+async def watch_run(args):
+    host = Host("Streamer", PLAYTHROUGHS["explorer"], args.key_delay, args.think)
+    host.log = []
+    playing = asyncio.get_running_loop().create_task(host.play(args.port, "/ws"))
+    while not any(c.startswith("\x00WATCH:") for c in host.control):
+        await asyncio.sleep(0.05)
+    watch_id = next(c for c in host.control if c.startswith("\x00WATCH:"))[7:]
+
+    watchers, joins = [], []
+
+    async def join():
+        w = Client()
+        w.log = []
+        t0 = time.monotonic()
+        w.reader, w.writer = await wslite.connect("127.0.0.1", args.port, f"/watch/{watch_id}")
+        asyncio.get_running_loop().create_task(w._pump())
+        while not w.log:
+            await asyncio.sleep(0.01)
+        joins.append(w.log[0][0] - t0)
+        watchers.append(w)
+
+    t0 = time.monotonic()
+    for i in range(0, args.watchers, 50):
+        await asyncio.gather(*(join() for _ in range(min(50, args.watchers - i))))
+    joined = time.monotonic()
+    threads, _ = proc_status(args.server_pid)
+    await playing
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline and not all("\x00END" in w.control for w in watchers):
+        await asyncio.sleep(0.1)
+
+    # Delivery lag: each key sent after everyone joined, to the first output
+    # after it reaching the host and each watcher.
+    keys = [t for t in host.sent_at if t > joined]
+
+    def lags(log):
+        times = [t for t, data in log if data[:1] != b"\x00"]
+        out, i = [], 0
+        for k in keys:
+            while i < len(times) and times[i] < k:
+                i += 1
+            if i < len(times):
+                out.append(times[i] - k)
+        return out
+
+    sample = watchers[:: max(1, len(watchers) // 10)]
+    reference = final_screen(host.log)
+    for w in watchers:
+        w.close()
+    return {
+        "watchers": len(watchers),
+        "ended": sum(1 for w in watchers if "\x00END" in w.control),
+        "join_all_s": round(joined - t0, 2),
+        "join_ms": _summary(joins),
+        "player_ms": _summary(lags(host.log)),
+        "watcher_ms": _summary([v for w in watchers for v in lags(w.log)]),
+        "kb_per_watcher": round(sum(w.received for w in watchers) / len(watchers) / 1024, 1),
+        "same_screen": sum(1 for w in sample if final_screen(w.log) == reference),
+        "sampled": len(sample),
+        "server_threads": threads,
+    }
+
+
+def cmd_watch(args):
+    srv = start_server("server.py", args.port, {
+        "DUNGEON_WORKERS": "1", "DUNGEON_RESUME_GRACE": "0", "DUNGEON_HIBERNATE_AFTER": "0"})
+    try:
+        args.server_pid = srv.pid
+        rss0 = scrape_metrics(args.port)["server_rss"]
+        cpu0 = server_cpu(srv.pid)
+        result = asyncio.run(watch_run(args))
+        result["server_cpu_s"] = round(server_cpu(srv.pid) - cpu0, 2)
+        import urllib.request
+        stats = json.load(urllib.request.urlopen(f"http://127.0.0.1:{args.port}/stats"))
+        result["fanout"] = stats["fanout"]
+        result["server_rss_mb"] = round(
+            (scrape_metrics(args.port)["server_rss"] - rss0) / 1024 / 1024, 1)
+    finally:
+        stop_server(srv)
+    r, f = result, result["fanout"]
+    print(f"\n  one scripted player, {r['watchers']} spectators on /watch\n")
+    table([("join", r["join_ms"]["p50"], r["join_ms"]["p95"], r["join_ms"]["p99"], r["join_ms"]["max"]),
+           ("player output", r["player_ms"]["p50"], r["player_ms"]["p95"],
+            r["player_ms"]["p99"], r["player_ms"]["max"]),
+           ("watcher output", r["watcher_ms"]["p50"], r["watcher_ms"]["p95"],
+            r["watcher_ms"]["p99"], r["watcher_ms"]["max"])],
+          ("ms", "p50", "p95", "p99", "max"))
+    print(f"\n  all joined in {r['join_all_s']} s; {r['ended']}/{r['watchers']} saw the end; "
+          f"{r['same_screen']}/{r['sampled']} sampled final screens match the player's")
+    print(f"  {r['kb_per_watcher']} kB per watcher; framed once: {f['bytes'] / 1024:.1f} kB "
+          f"in {f['frames']} frames, sent {f['sent_bytes'] / 1024:.0f} kB in {f['sends']} "
+          f"sendmsg() calls; {f['resyncs']} resyncs, {f['blocked']} full sockets")
+    print(f"  server: {r['server_cpu_s']} CPU s, +{r['server_rss_mb']} MB RSS, "
+          f"{r['server_threads']} threads while watched")
+    if args.report:
+        Path(args.report).write_text(json.dumps(
+            {"tool": "bench.py watch", **result}, indent=2) + "\n")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# screens: write() syscalls and bytes per screen, this game vs an older one
+# ─────────────────────────────────────────────────────────────────────────────
+
+# SCREENS, then a fight in the next room: every "1" picks the first target
+# or attacks.  A step's output that ends at the combat menu is a round.
+FIGHT = [("combat", b"f\r")] + [("combat", b"1\r")] * 8
+
+
+def proc_io(pid):
+    """write() syscalls and bytes a process has made, from /proc/<pid>/io."""
+    with open(f"/proc/{pid}/io") as f:
+        fields = dict(line.split(": ") for line in f.read().splitlines())
+    return int(fields["syscw"]), int(fields["wchar"])
+
+
+def measure_screens(game_path, cols=100, rows=40):
+    """{screen: [writes, bytes, PTY reads, count]} for one scripted session."""
+    server.GAME_PATH, saved = Path(game_path), server.GAME_PATH
+    proc, fd = server.spawn_game(cols, rows)
+    server.GAME_PATH = saved
+    totals = {}
+    try:
+        for name, keys in SCREENS + FIGHT:
+            before = proc_io(proc.pid)
+            if keys:
+                os.write(fd, keys)
+            chunks = read_screen(fd)
+            writes, nbytes = (a - b for a, b in zip(proc_io(proc.pid), before))
+            text = ANSI.sub("", b"".join(chunks).decode("utf-8", "replace"))
+            if name == "combat":
+                name = "combat round" if "Actions:" in text else "combat end"
+            row = totals.setdefault(name, [0, 0, 0, 0])
+            for i, v in enumerate((writes, nbytes, len(chunks), 1)):
+                row[i] += v
+    finally:
+        server.stop_game(proc, fd)
+    return totals
+
+
+def cmd_screens(args):
+    runs = [("now", server.GAME_PATH)]
+    if args.compare:
+        # The older game beside copies of the modules it imports.
+        tmp = Path(tempfile.mkdtemp(prefix="dungeon-bench-"))
+        for name in ("dungeon_game.py", "dungeon_ascii_art.py", "vterm.py"):
+            shown = subprocess.run(["git", "show", f"{args.compare}:{name}"],
+                                   capture_output=True, cwd=Path(__file__).parent)
+            if shown.returncode == 0:
+                (tmp / name).write_bytes(shown.stdout)
+        runs.insert(0, (args.compare, tmp / "dungeon_game.py"))
+    cols, rows = map(int, args.size.split("x"))
+    results = {label: measure_screens(path, cols, rows) for label, path in runs}
+    rows = []
+    for name in results[runs[-1][0]]:
+        row = [name]
+        for label, _ in runs:
+            writes, nbytes, reads, n = results[label].get(name, [0, 0, 0, 1])
+            row += [f"{writes / n:.0f}", f"{nbytes / n:.0f}", f"{reads / n:.1f}"]
+        rows.append(row)
+    headers = ["screen"]
+    for label, _ in runs:
+        headers += [f"{label} writes", f"{label} bytes", f"{label} reads"]
+    table(rows, headers)
+    if args.report:
+        Path(args.report).write_text(json.dumps(results, indent=2))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# headless: whole games on dungeon_game.HeadlessConsole, no PTY or server
+# ─────────────────────────────────────────────────────────────────────────────
+
+ROOM_COMMANDS = ["n", "s", "e", "w", "f", "t", "x", "i", "j", "m"]
+
+
+def headless_game(seed, moves, speed="normal", typing="game", size=None, diff=True):
+    """Play one game to its end with random room commands; its numbers."""
+    import dungeon_game
+    rng = random.Random(seed)
+    script = [rng.choice(ROOM_COMMANDS) for _ in range(moves)]
+    state = {"quitting": False}
+
+    def respond(con, prompt):
+        shown = upto_cursor(con.screen) if con.screen else con.tail
+        line, state["quitting"] = answer(shown, f"Bot{seed}", script, state["quitting"])
+        return "" if line is None else line
+
+    con = dungeon_game.HeadlessConsole(respond, keep=False, size=size)
+    con.client_typing = typing == "page"
+    con.diff_screens = diff
+    random.seed(seed)                # the game's own dice
+    game = dungeon_game.Game(con)
+    game.text_speed = speed
+    t0 = time.perf_counter()
+    try:
+        game.run()
+        outcome = ("true_ending" if game.true_ending else "won" if game.won else
+                   "quit" if state["quitting"] else "died")
+    except EOFError:
+        outcome = "eof"
+    return {"seconds": time.perf_counter() - t0, "virtual_s": con.clock,
+            "inputs": con.inputs, "writes": con.writes, "bytes": con.bytes,
+            "outcome": outcome,
+            "rooms": sum(1 for room in game.rooms.values() if room.visited)}
+
+
+def cmd_headless(args):
+    rows, report = [], {}
+    cols, rows_ = map(int, args.size.split("x"))
+    for speed in args.speed:
+        for typing in args.typing:
+            for screens in args.screens:
+                results = report[f"{speed}/{typing}/{screens}"] = [
+                    headless_game(args.seed + i, args.moves, speed, typing,
+                                  (cols, rows_), screens == "diff")
+                    for i in range(args.games)]
+                rows.append([speed, typing, screens] + headless_row(results))
+    table(rows, ["speed", "typing", "screens", "games", "ms p50", "ms max", "game s p50", "inputs", "rooms",
+                 "writes", "kB", "B/input", "outcomes"])
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2))
+
+
+def headless_row(results):
+    wall = [r["seconds"] for r in results]
+    outcomes = collections.Counter(r["outcome"] for r in results)
+    return [
+        len(results),
+        f"{statistics.median(wall) * 1000:.1f}", f"{max(wall) * 1000:.1f}",
+        f"{statistics.median(r['virtual_s'] for r in results):.1f}",
+        f"{statistics.median(r['inputs'] for r in results):.0f}",
+        f"{statistics.median(r['rooms'] for r in results):.0f}",
+        f"{statistics.median(r['writes'] for r in results):.0f}",
+        f"{statistics.median(r['bytes'] for r in results) / 1024:.1f}",
+        f"{statistics.median(r['bytes'] / r['inputs'] for r in results):.0f}",
+        " ".join(f"{k}:{v}" for k, v in sorted(outcomes.items())),
+    ]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Entry point
+# ─────────────────────────────────────────────────────────────────────────────
+
+def main():
+    ap  = argparse.ArgumentParser(description=__doc__,
+                                  formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("hosting", help="PTY process per player vs in-process games")
+    p.add_argument("--sessions", type=int, nargs="+", default=[10, 50])
+    p.set_defaults(func=cmd_hosting)
+
+    p = sub.add_parser("servers", help="threaded Flask bridge vs asyncio server")
+    p.add_argument("--sessions", type=int, nargs="+", default=[10, 50, 100])
+    p.add_argument("--spawn", default="zygote", choices=("exec", "zygote"))
+    p.add_argument("--port", type=int, default=5099)
+    p.set_defaults(func=cmd_servers)
+
+    p = sub.add_parser("frames", help="UTF-8 text frames vs raw binary frames on art-heavy screens")
+    p.add_argument("--sessions", type=int, default=20)
+    p.add_argument("--rounds", type=int, default=10)
+    p.add_argument("--port", type=int, default=5099)
+    p.set_defaults(func=cmd_frames)
+
+    p = sub.add_parser("deflate", help="permessage-deflate savings per screen type")
+    p.set_defaults(func=cmd_deflate)
+
+    p = sub.add_parser("vterm", help="screen model memory/parse cost and repaint size")
+    p.add_argument("--sessions", type=int, nargs="+", default=[1, 100, 500])
+    p.set_defaults(func=cmd_vterm)
+
+    p = sub.add_parser("load", help="scripted players against server.py, ramping concurrency")
+    p.add_argument("--ramp", type=int, nargs="+", default=[1, 10, 25, 50])
+    p.add_argument("--port", type=int, default=5099)
+    p.add_argument("--external", action="store_true",
+                   help="use a server already running on --port instead of starting "
+                        "one; start it with DUNGEON_IP_SESSIONS=0 DUNGEON_IP_SPAWN_RATE=0 "
+                        "for more than four clients")
+    p.add_argument("--path", default="/ws", help="WebSocket path, e.g. /ws?frames=binary")
+    p.add_argument("--key-delay", type=float, default=0.05, help="seconds between keys")
+    p.add_argument("--think", type=float, default=0.3, help="seconds before each line")
+    p.add_argument("--stagger", type=float, default=0.05, help="seconds between client starts")
+    p.add_argument("--report", help="write a JSON report here")
+    p.set_defaults(func=cmd_load)
+
+    p = sub.add_parser("workers", help="the load test at several DUNGEON_WORKERS counts")
+    p.add_argument("counts", type=int, nargs="*", default=[1, 2, 4])
+    p.add_argument("--clients", type=int, default=40)
+    p.add_argument("--port", type=int, default=5099)
+    p.add_argument("--path", default="/ws")
+    p.add_argument("--key-delay", type=float, default=0.0)
+    p.add_argument("--think", type=float, default=0.0)
+    p.add_argument("--stagger", type=float, default=0.02)
+    p.add_argument("--report", help="write a JSON report here")
+    p.set_defaults(func=cmd_workers)
+
+    p = sub.add_parser("watch", help="one player streamed to many /watch spectators")
+    p.add_argument("--watchers", type=int, default=500)
+    p.add_argument("--port", type=int, default=5099)
+    p.add_argument("--key-delay", type=float, default=0.05)
+    p.add_argument("--think", type=float, default=0.3)
+    p.add_argument("--report", help="write a JSON report here")
+    p.set_defaults(func=cmd_watch)
+
+    p = sub.add_parser("screens", help="write() syscalls and bytes per screen, vs --compare REV")
+    p.add_argument("--compare", metavar="REV", help="also measure dungeon_game.py as of this git revision")
+    p.add_argument("--size", default="100x40", help="terminal size, COLSxROWS")
+    p.add_argument("--report", help="write the per-screen totals as JSON here")
+    p.set_defaults(func=cmd_screens)
+
+    p = sub.add_parser("headless", help="whole games on a headless console with a virtual clock")
+    p.add_argument("--games", type=int, default=50)
+    p.add_argument("--moves", type=int, default=60, help="random room commands before quitting")
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--speed", nargs="+", default=["normal"],
+                   choices=("slow", "normal", "fast", "instant"), help="text speeds to play at")
+    p.add_argument("--typing", nargs="+", default=["game"], choices=("game", "page"),
+                   help="who types slow text out: the game, or the page (OSC 7770)")
+    p.add_argument("--screens", nargs="+", default=["diff"], choices=("whole", "diff"),
+                   help="send redrawn screens whole, or only what changed")
+    p.add_argument("--size", default="100x40", help="the terminal's size, COLSxROWS")
+    p.add_argument("--report", help="write per-game results as JSON here")
+    p.set_defaults(func=cmd_headless)
+
+    args = ap.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
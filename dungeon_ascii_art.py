@@ -376,11 +376,19 @@ def get_room_art(room_id: int) -> str:
     return ROOM_ART.get(room_id, "")
 
 
+def render_room_art(room_id: int) -> str:
+    """Room ASCII art with dim stone-grey border highlight, or "" if none"""
+    art = get_room_art(room_id)
+    if art:
+        return "\033[90m" + art.strip() + "\033[0m"
+    return ""
+
+
 def print_room_art(room_id: int) -> None:
     """Print room ASCII art with dim stone-grey border highlight"""
-    art = get_room_art(room_id)
+    art = render_room_art(room_id)
     if art:
-        print("\033[90m" + art.strip() + "\033[0m")
+        print(art)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,472 @@
   Full Creative Overhaul v2 — The name is on the tip of your tongue.
 """
 
+import builtins
+import codecs
+import contextlib
+import contextvars
+import pickle
 import random
+import re
 import os
+import select
+import signal
+import stat
 import sys
+import threading
 import time
+import zlib
 import dungeon_ascii_art
 
+try:
+    import termios
+    import tty
+except ImportError:        # Windows: no single-key reads, so no skipping
+    termios = None
+
+try:
+    import vterm           # beside us in the repo: the screen model for diffs
+except ImportError:
+    vterm = None
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Console
+# ─────────────────────────────────────────────────────────────────────────────
+
+class Console:
+    """
+    Where the game's text goes and where its input comes from, and how it
+    waits.  This one is the real terminal.  A host running several games in
+    one process (server.py in-process mode) installs its own per session;
+    HeadlessConsole and CaptureConsole below drive the game with no
+    terminal at all.
+
+    Output is composed, not streamed: write() only adds to the screen
+    being built, and the whole of it goes out in one emit() when the game
+    next waits, for input or in sleep(), or flushes.  A room view, combat
+    round or map is one write() to the terminal (under python3 -u, one
+    syscall, one PTY read and one WebSocket frame) instead of one per
+    print().  Subclasses deliver output by overriding emit().
+
+    typewrite() is the typewriter: text appears a word or so at a time,
+    paced at `speed` (a factor on the game's delays; 0 is instant), and a
+    keypress shows the rest at once: everything typed from then until the
+    game next asks for input.  Subclasses provide keys() and pressed() to
+    hear that keypress, and clear `skipping` in readline().
+
+    With `client_typing` the terminal types instead (server.py's page):
+    each block goes out whole between OSC 7770 markers, the first giving
+    the seconds per character, and the game does not wait for it.
+
+    Screens are redrawn by difference: the console keeps a model of its
+    terminal (a vterm.Screen, when its size is known), and output that
+    clears the screen is sent as only the cells that change, if that is
+    shorter.  A screen taller than the terminal sends the lines that
+    scroll off whole, through a scroll region at the top so the rows under
+    it stay, and the rest as a difference: its top can still be scrolled
+    back to (vterm.Screen.scroll_diff).  Subclasses report the size in terminal_size() and tell the
+    model about input their terminal echoes in echoed().
+
+    A terminal driver echoes a key the moment it arrives, wherever the
+    cursor is then: a key typed ahead, while a screen is still going out,
+    lands in the middle of it and the model never hears of it.  So while
+    diffs are on, own_echo() turns the driver's echo off for the game and
+    readline() edits and echoes the line itself, through write(), when it
+    asks for it.
+
+    overlay() shows a screen (the map, a fight) on the terminal's alternate
+    screen where it has one (`alt_screen`), so the screen under it comes
+    back untouched and redrawing it afterwards is a diff of what changed
+    meanwhile: the HP bar, the enemy list.
+    """
+
+    def __init__(self):
+        self._held = []            # text written since the last flush
+        self.speed = 1.0
+        self.client_typing = CLIENT_TYPING
+        self.diff_screens = DIFF_SCREENS
+        self.screen = None         # what the terminal shows, if known
+        self.alt_screen = None     # from TERM at the first overlay, once the host set it
+        self._inline = False       # the open overlay went to the main screen
+        self.skipping = False      # a key was pressed: type instantly until input
+        self._keyfd = None         # stdin, while keys() has it in cbreak mode
+        self._linefd = None        # stdin, while own_echo() has the driver's echo off
+        self._typed = ""           # keys read past the end of the last line
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def write(self, text):
+        self._held.append(text)
+
+    def flush(self):
+        if self._held:
+            text = "".join(self._held)
+            self._held.clear()
+            text = self.render(text)
+            if text:
+                self.emit(text)
+
+    def render(self, text):
+        """What to send so the terminal ends up showing text's effect."""
+        size = self.terminal_size() if vterm else None
+        shown = self.screen
+        if shown is not None and (shown.cols, shown.rows) != size:
+            shown = None           # resized: what it shows now is anyone's guess
+        if shown is None and (size is None or CLEAR not in text):
+            self.screen = None
+            return text
+        screen = (shown or vterm.Screen(*size)).copy()
+        screen.history = []
+        screen.feed(text.replace("\n", "\r\n"))
+        if screen.alt and screen.scrolled and ALT_ON in text:
+            # An overlay too tall for the alternate screen, which keeps no
+            # scrollback: show it on the main screen as before.
+            text = text.replace(ALT_ON, "")
+            self._inline = True
+            screen = (shown or vterm.Screen(*size)).copy()
+            screen.history = []
+            screen.feed(text.replace("\n", "\r\n"))
+        lines, screen.history = screen.history, None
+        self.screen = screen
+        if not self.diff_screens or shown is None or CLEAR not in text \
+                or f"\033]{TYPE_OSC};" in text:
+            return text
+        base, changes = shown, ""
+        if shown.alt and not screen.alt:
+            base, changes = shown.main_screen(), ALT_OFF   # back from an overlay
+        elif shown.alt != screen.alt:
+            return text
+        if screen.scrolled:
+            if screen.alt:
+                return text                 # no scrollback to keep the top in
+            # Taller than the terminal: what scrolled off goes to the
+            # scrollback as it would have, and the rows left are a diff.
+            changes += screen.scroll_diff(base, lines)
+        else:
+            if base.scrolled:
+                changes += "\033[3J"       # the scrollback a clear would have wiped
+            changes += screen.diff(base)
+        return changes if len(changes) < len(text) else text
+
+    def terminal_size(self):
+        """(columns, rows) of the terminal, or None if there is none."""
+        try:
+            return tuple(os.get_terminal_size(sys.stdout.fileno()))
+        except (OSError, ValueError):
+            return None
+
+    @contextlib.contextmanager
+    def overlay(self):
+        """Show what is written meanwhile over the current screen."""
+        if self.alt_screen is None:
+            self.alt_screen = os.environ.get("TERM", "").startswith(ALT_TERMS)
+        alt = self.diff_screens and self.alt_screen and self.screen is not None
+        if alt:
+            self._inline = False
+            self.write(ALT_ON)
+        try:
+            yield
+        finally:
+            if alt and not self._inline:
+                self.write(ALT_OFF)
+
+    def echoed(self, line):
+        """The terminal echoed an input line: the model shows it too."""
+        if self.screen is not None:
+            self.screen.feed(line + "\r\n")
+
+    def emit(self, text):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    @contextlib.contextmanager
+    def own_echo(self):
+        """Echo input from the game, not the terminal driver, for the duration."""
+        fd = sys.stdin.fileno() if termios and sys.stdin.isatty() else None
+        if fd is None or not self.diff_screens:
+            yield
+            return
+        saved = termios.tcgetattr(fd)
+        tty.setcbreak(fd, termios.TCSANOW)
+        self._linefd = fd
+        try:
+            yield
+        finally:
+            self._linefd = None
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    def readline(self, prompt=""):
+        self.skipping = False
+        self.write(prompt)
+        self.flush()
+        if self._linefd is None:
+            line = builtins.input()
+            self.echoed(line)
+            return line
+        line = []
+        while True:
+            if not self._typed:
+                self.flush()         # the prompt, or the echo of the last key
+                data = os.read(self._linefd, 1024)
+                if not data:
+                    raise EOFError
+                self._typed = self._decoder.decode(data)
+                continue
+            ch, self._typed = self._typed[0], self._typed[1:]
+            if ch in ("\r", "\n"):
+                self.write("\n")
+                return "".join(line)
+            if ch in ("\x7f", "\b"):
+                if line:
+                    line.pop()
+                    self.write("\b \b")
+            elif ch == "\x04" and not line:
+                raise EOFError
+            elif ch.isprintable():
+                line.append(ch)
+                self.write(ch)
+
+    def sleep(self, seconds):
+        self.flush()
+        time.sleep(seconds)
+
+    def clear(self):
+        # ANSI escape — works in Docker/PTY without needing the `clear` binary
+        if os.name == "nt":
+            self.flush()
+            os.system("cls")
+        else:
+            self.write(CLEAR)
+
+    @contextlib.contextmanager
+    def keys(self):
+        """Hear single keypresses (no Enter, no echo) for the duration."""
+        fd = sys.stdin.fileno() if termios and sys.stdin.isatty() else None
+        if fd is None:
+            yield
+            return
+        saved = termios.tcgetattr(fd)
+        tty.setcbreak(fd, termios.TCSANOW)
+        self._keyfd = fd
+        try:
+            yield
+        finally:
+            self._keyfd = None
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    def pressed(self, seconds):
+        """Wait up to `seconds`; True, the keys used up, if one came first."""
+        self.flush()
+        if self._keyfd is None:
+            time.sleep(seconds)
+            return False
+        if select.select([self._keyfd], [], [], seconds)[0]:
+            os.read(self._keyfd, 1024)
+            return True
+        return False
+
+    def typewrite(self, text, delay):
+        """Type text out at `delay` seconds a character (times speed)."""
+        delay *= self.speed
+        if delay <= 0 or self.skipping:
+            self.write(text)
+            return
+        if self.client_typing:
+            self.write(f"\033]{TYPE_OSC};{delay:.4g}\a{text}\033]{TYPE_OSC};\a")
+            return
+        steps = _typing_steps(text, delay)
+        with self.keys():
+            for i, (chunk, seconds) in enumerate(steps):
+                self.write(chunk)
+                if self.pressed(seconds):
+                    self.skipping = True
+                    self.write("".join(c for c, _ in steps[i + 1:]))
+                    break
+
+
+class HeadlessConsole(Console):
+    """
+    No terminal: for tests, bots and benchmarks.  Input comes from script,
+    a list of lines or a function called with (console, prompt) for each
+    line; running out (or a None) raises EOFError, which ends the game
+    as ^D does.  sleep() only moves the virtual `clock` on, so a whole
+    playthrough, animations and all, runs as fast as it can be printed.
+    Output is kept in `output`; keep=False only counts it.  size, as
+    (columns, rows), is the terminal's size for screen diffs; None, the
+    default, sends every screen whole.
+    """
+
+    def __init__(self, script=(), keep=True, size=None):
+        super().__init__()
+        self.size    = size
+        self.alt_screen = True
+        self.script  = script if callable(script) else iter(script)
+        self.keep    = keep
+        self.output  = []
+        self.clock   = 0.0
+        self.writes  = 0
+        self.bytes   = 0
+        self.inputs  = 0
+        self.tail    = ""          # the last 4 kB written, whatever keep says
+
+    def emit(self, text):
+        if self.keep:
+            self.output.append(text)
+        self.tail = (self.tail + text)[-4096:]
+        self.writes += 1
+        self.bytes += len(text)
+
+    def readline(self, prompt=""):
+        self.skipping = False
+        self.write(prompt)
+        self.flush()
+        line = self.script(self, prompt) if callable(self.script) \
+            else next(self.script, None)
+        if line is None:
+            raise EOFError
+        self.inputs += 1
+        self.write(line + "\n")    # the terminal's echo
+        return line
+
+    def sleep(self, seconds):
+        self.flush()
+        self.clock += seconds
+
+    def clear(self):
+        self.write(CLEAR)
+
+    def terminal_size(self):
+        return self.size
+
+    def keys(self):
+        return contextlib.nullcontext()
+
+    def own_echo(self):
+        return contextlib.nullcontext()   # readline() does the echo
+
+    def pressed(self, seconds):
+        self.sleep(seconds)        # nobody to press a key
+        return False
+
+    def text(self):
+        return "".join(self.output)
+
+
+class CaptureConsole(Console):
+    """
+    Passes everything through to another console (the terminal by default)
+    and records it as events, each a tuple starting with its kind and
+    time: ("write", t, text), ("clear", t), ("sleep", t, seconds) and
+    ("input", t, prompt, line).  t is the inner console's virtual clock
+    if it has one, else seconds since the capture began.
+    """
+
+    def __init__(self, inner=None):
+        super().__init__()
+        self.inner   = inner or Console()
+        self.events  = []
+        self.started = time.monotonic()
+
+    def _now(self):
+        clock = getattr(self.inner, "clock", None)
+        return clock if clock is not None else time.monotonic() - self.started
+
+    def write(self, text):
+        self.events.append(("write", self._now(), text))
+        self.inner.write(text)
+
+    def flush(self):
+        self.inner.flush()
+
+    def readline(self, prompt=""):
+        self.skipping = False
+        t = self._now()
+        line = self.inner.readline(prompt)
+        self.events.append(("input", t, prompt, line))
+        return line
+
+    def sleep(self, seconds):
+        self.events.append(("sleep", self._now(), seconds))
+        self.inner.sleep(seconds)
+
+    def keys(self):
+        return self.inner.keys()
+
+    def own_echo(self):
+        return self.inner.own_echo()
+
+    def overlay(self):
+        return self.inner.overlay()
+
+    def pressed(self, seconds):
+        self.events.append(("sleep", self._now(), seconds))
+        return self.inner.pressed(seconds)
+
+    def typewrite(self, text, delay):
+        # The inner console's speed applies: keep it in step with ours.
+        self.inner.speed = self.speed
+        Console.typewrite(self, text, delay)
+
+    def clear(self):
+        self.events.append(("clear", self._now()))
+        self.inner.clear()
+
+
+# Typing speeds the player can choose: factors on the game's own delays.
+TEXT_SPEEDS = {"slow": 1.5, "normal": 1.0, "fast": 0.35, "instant": 0.0}
+# The typewriter's shortest step: at most ~25 writes a second, however fast.
+TYPE_TICK_S = 0.04
+# A terminal that types text out itself (server.py sets this for its games):
+# slow text goes to it whole, between OSC TYPE_OSC markers.  Terminals that
+# do not know the OSC ignore it and show the text at once.
+CLIENT_TYPING = os.environ.get("DUNGEON_CLIENT_TYPING", "0") == "1"
+TYPE_OSC = 7770
+# Send redrawn screens as only what changed (see Console).  Off on a
+# terminal of the player's own; server.py turns it on for its games.
+DIFF_SCREENS = os.environ.get("DUNGEON_DIFF", "0") == "1"
+CLEAR = "\033[H\033[2J\033[3J"
+# The alternate screen, and the TERMs known to have it.
+ALT_ON, ALT_OFF = "\033[?1049h", "\033[?1049l"
+ALT_TERMS = ("xterm", "screen", "tmux", "rxvt", "alacritty", "kitty")
+
+_ANSI = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+_WORD = re.compile(r"\s*\S+|\s+")
+
+def _typing_steps(text, delay):
+    """
+    text as [(chunk, seconds to wait after it)]: whole words, grouped until
+    a step lasts at least TYPE_TICK_S, and never running past a line end.
+    Only visible characters take time; what shows nothing rides along
+    with the next step.
+    """
+    steps, chunk, shown = [], "", 0
+    for line in text.splitlines(keepends=True):
+        for word in _WORD.findall(line):
+            chunk += word
+            shown += len(_ANSI.sub("", word.rstrip("\n")))
+            if shown and (word.endswith("\n") or shown * delay >= TYPE_TICK_S):
+                steps.append((chunk, shown * delay))
+                chunk, shown = "", 0
+    if chunk:
+        steps.append((chunk, shown * delay))
+    return steps
+
+_console = contextvars.ContextVar("console", default=Console())
+
+def use_console(console):
+    """Route the calling thread's game I/O through `console`."""
+    _console.set(console)
+
+# The game talks through these rather than the builtins, so every screen
+# goes to whichever console is active for the current session.
+def print(*args, sep=" ", end="\n", flush=False):
+    con = _console.get()
+    con.write(sep.join(str(a) for a in args) + end)
+    if flush:
+        con.flush()
+
+def input(prompt=""):
+    return _console.get().readline(prompt)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # ANSI Color helpers
 # ─────────────────────────────────────────────────────────────────────────────
@@ -36,20 +496,16 @@ def hr(char="─", width=62, color=C.DIM):
     return colored(char * width, color)
 
 def clear():
-    # ANSI escape — works in Docker/PTY without needing the `clear` binary
-    if os.name == "nt":
-        os.system("cls")
-    else:
-        print("\033[H\033[2J\033[3J", end="", flush=True)
+    _console.get().clear()
+
+def overlay():
+    return _console.get().overlay()
 
 def pause(msg="  [Press Enter to continue]"):
     input(colored(f"\n{msg}", C.DIM))
 
 def slow_print(text, delay=0.022):
-    for ch in text:
-        print(ch, end="", flush=True)
-        time.sleep(delay)
-    print()
+    _console.get().typewrite(text + "\n", delay)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Items
@@ -1299,22 +1755,46 @@ def show_inventory(player):
 # ─────────────────────────────────────────────────────────────────────────────
 
 class Game:
-    def __init__(self):
+    def __init__(self, console=None):
+        # Where this game plays: run() routes all its I/O through it.
+        self.console     = console or _console.get()
         self.player      = None
         self.rooms       = build_map()
         self.room_id     = 1
         self.over        = False
         self.won         = False
         self.true_ending = False
+        self.text_speed  = "normal"      # a TEXT_SPEEDS key; kept in snapshots
 
     def room(self):
         return self.rooms[self.room_id]
 
+    # A snapshot is only the game; whoever restores it plays it on their console.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("console", None)
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("text_speed", "normal")
+        self.__dict__.update(state)
+        self.console = _console.get()
+
     # ── main loop ─────────────────────────────────────────────────────────────
     def run(self):
-        self._title_screen()
-        # Unlock journal entry 1 at start
-        self.player.journal_flags.add("1")
+        use_console(self.console)
+        self.console.speed = TEXT_SPEEDS[self.text_speed]
+        try:
+            with self.console.own_echo():
+                self._play()
+        finally:
+            self.console.flush()         # the last screen has no prompt after it
+
+    def _play(self):
+        if self.player is None:          # a restored game is already under way
+            self._title_screen()
+            # Unlock journal entry 1 at start
+            self.player.journal_flags.add("1")
         while not self.over:
             self._room_loop()
         if self.won:
@@ -1350,7 +1830,9 @@ class Game:
     def _room_loop(self):
         room = self.room()
         clear()
-        dungeon_ascii_art.print_room_art(self.room_id)
+        art = dungeon_ascii_art.render_room_art(self.room_id)
+        if art:
+            print(art)
         print(colored(f"\n  ═══ {room.name.upper()} ═══", C.CYAN, C.BOLD))
         print()
         print(colored(f"  {room.desc}", C.WHITE))
@@ -1406,8 +1888,10 @@ class Game:
         print(colored("  Commands: [n/s/e/w] move  [f] fight  [t] take  "
                       "[x] examine  [j] journal  [i] inventory  [m] map  [?] help", C.DIM))
         print()
-        cmd = input(colored("  > ", C.CYAN)).strip().lower()
+        cmd = input_at_rest(self, colored("  > ", C.CYAN)).strip().lower()
 
+        # Screens shown over the room's (overlay()) leave it as it was, so
+        # coming back redraws only what changed.
         if cmd in ("n", "s", "e", "w", "north", "south", "east", "west"):
             dirs = {"n": "north", "s": "south", "e": "east", "w": "west"}
             self._move(dirs.get(cmd, cmd))
@@ -1419,26 +1903,36 @@ class Game:
             self._take(room)
 
         elif cmd in ("x", "examine", "look"):
-            self._examine(room)
+            with overlay():
+                self._examine(room)
 
         elif cmd in ("j", "journal"):
-            self._show_journal()
+            with overlay():
+                self._show_journal()
 
         elif cmd in ("i", "inv", "inventory"):
-            self._inventory_menu()
+            with overlay():
+                self._inventory_menu()
 
         elif cmd in ("m", "map"):
-            clear()
-            show_map(self.room_id)
-            pause()
+            with overlay():
+                clear()
+                show_map(self.room_id)
+                pause()
 
         elif cmd in ("?", "h", "help"):
-            self._help()
+            with overlay():
+                self._help()
+
+        elif cmd in ("v", "speed"):
+            self._speed_menu()
 
         elif cmd in ("q", "quit"):
             if input(colored("  Quit? (y/n): ", C.RED)).strip().lower() == "y":
                 print(colored("\n  The dungeon claims another soul...\n", C.DIM))
-                sys.exit(0)
+                # End the run rather than the process: a host may play on.
+                self.over = True
+                return
 
         else:
             print(colored("  Unknown command. Type [?] for help.", C.DIM))
@@ -1478,7 +1972,10 @@ class Game:
             print(colored("\n  No enemies here.", C.DIM))
             pause()
             return
+        with overlay():
+            self._fight_on(room, enemies)
 
+    def _fight_on(self, room, enemies):
         # ── Pre-combat intros ────────────────────────────────────────────────
         self._show_combat_intro(room, enemies)
 
@@ -1839,6 +2336,18 @@ class Game:
                 print(colored(f"\n  Dropped {ITEMS[key].name}.", C.DIM))
             pause()
 
+    # ── text speed ────────────────────────────────────────────────────────────
+    def _speed_menu(self):
+        names = list(TEXT_SPEEDS)
+        print(colored(f"\n  Text speed: {self.text_speed}. Any key finishes the text being typed.", C.DIM))
+        print(colored("  " + "  ".join(f"{i}. {n.title()}" for i, n in enumerate(names, 1)), C.CYAN))
+        ch = input(colored("  > ", C.CYAN)).strip()
+        if ch.isdigit() and 1 <= int(ch) <= len(names):
+            self.text_speed = names[int(ch) - 1]
+            self.console.speed = TEXT_SPEEDS[self.text_speed]
+            slow_print(colored(f"\n  Text speed: {self.text_speed}.", C.GREEN))
+            pause()
+
     # ── help ──────────────────────────────────────────────────────────────────
     def _help(self):
         clear()
@@ -1850,6 +2359,7 @@ class Game:
         print("  Journal     j              read collected journal entries")
         print("  Inventory   i              manage items")
         print("  Map         m              show dungeon map")
+        print("  Text speed  v              slow / normal / fast / instant")
         print("  Quit        q\n")
         print(colored("  Combat options:", C.YELLOW))
         print("  1. Attack  — strike target (10% crit for 1.75× damage)")
@@ -2131,15 +2641,97 @@ class Game:
         print()
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Hibernation
+# ─────────────────────────────────────────────────────────────────────────────
+# A host can ask an idle game to save itself and exit (SIGUSR1), then start
+# a new process on the snapshot when the player comes back.  Only the room
+# prompt is a safe point: between commands the whole run is in the Game
+# object, so the snapshot is that plus the RNG state and the restored game
+# rolls exactly the dice this one would have.  Anywhere else the request is
+# ignored and the host asks again later.
+
+SNAPSHOT_VERSION = 1
+HIBERNATE_DIR    = os.environ.get("DUNGEON_HIBERNATE_DIR", "")
+
+_resting = None   # the Game waiting at its room prompt, if any
+
+def snapshot_path(pid=None, directory=None):
+    """Where the game with this pid writes its snapshot."""
+    return os.path.join(directory or HIBERNATE_DIR, f"{pid or os.getpid()}.snap")
+
+def private_dir(path):
+    """
+    Make path a directory only this user can reach, or check that it is
+    one.  Snapshots are pickles: whoever can plant one where a game loads
+    it runs code in that game.  PermissionError if it is anything else.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(
+            f"{path} is not a directory of uid {os.getuid()} with mode 0700")
+    return path
+
+def save_snapshot(game, path):
+    data = zlib.compress(pickle.dumps(
+        (SNAPSHOT_VERSION, game, random.getstate()), pickle.HIGHEST_PROTOCOL), 6)
+    fd = os.open(path + ".tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)
+    return len(data)
+
+def load_snapshot(path):
+    private_dir(os.path.dirname(os.path.abspath(path)))
+    with os.fdopen(os.open(path, os.O_RDONLY | os.O_NOFOLLOW), "rb") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_uid != os.getuid():
+            raise PermissionError(f"{path} is not a file of uid {os.getuid()}")
+        version, game, rng = pickle.loads(zlib.decompress(f.read()))
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"snapshot version {version}, expected {SNAPSHOT_VERSION}")
+    random.setstate(rng)
+    return game
+
+def input_at_rest(game, prompt):
+    """input() at a prompt where the game may be hibernated."""
+    global _resting
+    _resting = game
+    try:
+        return input(prompt)
+    finally:
+        _resting = None
+
+def _hibernate(signum, frame):
+    if _resting is None or not HIBERNATE_DIR:
+        return
+    try:
+        save_snapshot(_resting, snapshot_path())
+    except OSError:
+        return           # nowhere to save: stay up
+    os._exit(0)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Entry point
 # ─────────────────────────────────────────────────────────────────────────────
 
 def main():
+    # A game on a server thread (DUNGEON_HOSTING=inproc) has no process of
+    # its own to hibernate, and may not set signal handlers anyway.
+    if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGUSR1, _hibernate)
+    restore = os.environ.pop("DUNGEON_RESTORE", "")
     try:
-        Game().run()
+        if restore:
+            game = load_snapshot(restore)
+            os.unlink(restore)
+            game.run()
+        else:
+            Game().run()
     except KeyboardInterrupt:
-        print(colored("\n\n  Interrupted. Farewell, brave adventurer.\n", C.DIM))
+        print(colored("\n\n  Interrupted. Farewell, brave adventurer.\n", C.DIM), flush=True)
         sys.exit(0)
 
 
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Spectator fan-out
+  Streams a game to any number of read-only watchers from one thread.
+
+  Each chunk of a game's output is framed once, as a WebSocket text frame,
+  into a Channel shared by all of that game's watchers.  A watcher is only
+  a socket and a position in the channel: catching it up is one sendmsg()
+  over the shared frames, with no per-watcher copy, queue or thread.
+  Sends never block (MSG_DONTWAIT); a watcher whose socket is full waits
+  for EPOLLOUT while the rest carry on, and one that falls more than the
+  channel's limit behind skips to a fresh snapshot of the screen.
+
+  Only sends happen here.  Whatever owns the connection keeps reading it
+  (for the close); when a channel closes, its watchers' sockets are shut
+  for reading so that reader returns.
+"""
+
+import collections
+import itertools
+import os
+import selectors
+import socket
+import threading
+
+import keepalive
+import wslite
+
+# Most frames handed to one sendmsg() (IOV_MAX is 1024 on Linux).
+MAX_IOV = 512
+
+
+class Channel:
+    """
+    Frames one game has sent its watchers, numbered from `base`.
+    snapshot() returns (messages, index): what shows a late or lagging
+    watcher the screen as of frame `index`, taken under the game's lock.
+    """
+
+    def __init__(self, snapshot, limit=256 * 1024):
+        self.snapshot = snapshot
+        self.limit    = limit
+        self.frames   = collections.deque()
+        self.base     = 0          # number of frames[0]
+        self.size     = 0          # bytes in frames
+        self.watchers = set()
+        self.closed   = False
+
+    @property
+    def end(self):
+        return self.base + len(self.frames)
+
+
+class Watcher:
+    __slots__ = ("sock", "fd", "channel", "pos", "offset", "private",
+                 "stale", "blocked", "done", "sent")
+
+    def __init__(self, sock, channel, pos, private):
+        self.sock    = sock
+        self.fd      = sock.fileno()
+        self.channel = channel
+        self.pos     = pos         # next shared frame to send
+        self.offset  = 0           # bytes of the first pending frame already sent
+        self.private = private     # frames for this watcher only, sent first
+        self.stale   = False       # fell out of the channel: needs a snapshot
+        self.blocked = False       # waiting for EPOLLOUT
+        self.done    = threading.Event()   # set when the fan-out lets go of it
+        self.sent    = 0
+
+
+def frame(message):
+    """A text frame for message (str or UTF-8 bytes)."""
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    return wslite.encode_frame(wslite.OP_TEXT, message)
+
+
+class Fanout:
+    """
+    publish(), add(), remove() and close() from any thread; the sends run
+    on the fan-out thread.  publish() is cheap enough for the I/O hub: it
+    frames the chunk, appends it and wakes this thread.
+    """
+
+    def __init__(self):
+        self._sel      = None      # made by start(), in the process that runs it
+        self._lock     = threading.Lock()
+        self._ops      = collections.deque()
+        self._dirty    = set()     # channels with new frames
+        self._channels = set()
+        self._running  = False
+        self._thread   = None
+        self.frames    = 0         # frames published
+        self.bytes     = 0         # bytes published, framed
+        self.sends     = 0         # sendmsg() calls
+        self.sent      = 0         # bytes sent to watchers
+        self.resyncs   = 0         # lagging watchers sent a snapshot instead
+        self.blocked   = 0         # times a watcher's socket was full
+
+    # ── any thread ───────────────────────────────────────────────────────────
+    def start(self):
+        self._sel = getattr(selectors, "EpollSelector", selectors.DefaultSelector)()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._sel.register(self._wake_r, selectors.EVENT_READ)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="fanout", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._wake()
+
+    def channel(self, snapshot, limit=256 * 1024):
+        ch = Channel(snapshot, limit)
+        with self._lock:
+            self._channels.add(ch)
+        return ch
+
+    def publish(self, channel, message):
+        """Send message (str or UTF-8 bytes) to every watcher of channel."""
+        data = frame(message)
+        with self._lock:
+            channel.frames.append(data)
+            channel.size += len(data)
+            self._dirty.add(channel)
+        self.frames += 1
+        self.bytes += len(data)
+        self._wake()
+
+    def add(self, channel, sock, messages, pos):
+        """
+        Watch channel on sock, starting with messages (a snapshot of the
+        screen as of frame pos).  Call it under the lock publish() is
+        called under, so no frame lands between the snapshot and pos.
+        """
+        w = Watcher(sock, channel, pos, [frame(m) for m in messages])
+        with self._lock:
+            self._ops.append(("add", w))
+        self._wake()
+        return w
+
+    def remove(self, watcher):
+        """The watcher's connection closed."""
+        with self._lock:
+            self._ops.append(("remove", watcher))
+        self._wake()
+
+    def close(self, channel):
+        """Send what channel has, then let go of its watchers."""
+        with self._lock:
+            self._ops.append(("close", channel))
+        self._wake()
+
+    def ping(self, watcher):
+        """Send watcher a WebSocket ping (keepalive.PING) between its frames."""
+        with self._lock:
+            self._ops.append(("ping", watcher))
+        self._wake()
+
+    def watchers(self):
+        return sum(len(ch.watchers) for ch in list(self._channels))
+
+    def stats(self):
+        return {
+            "channels": len(self._channels), "watchers": self.watchers(),
+            "frames": self.frames, "bytes": self.bytes, "sends": self.sends,
+            "sent_bytes": self.sent, "resyncs": self.resyncs,
+            "blocked": self.blocked,
+            # Bytes on the wire per byte framed: the fan-out factor.
+            "amplification": round(self.sent / self.bytes, 1) if self.bytes else 0.0,
+        }
+
+    def _wake(self):
+        if self._sel is None:
+            return                 # not started: the ops run once it is
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass                   # already pending
+
+    # ── fan-out thread ───────────────────────────────────────────────────────
+    def _run(self):
+        while self._running:
+            for key, _ in self._sel.select():
+                if key.fd == self._wake_r:
+                    try:
+                        os.read(self._wake_r, 4096)
+                    except BlockingIOError:
+                        pass
+                else:
+                    w = key.data
+                    self._sel.unregister(w.fd)
+                    w.blocked = False
+                    self._flush(w)
+            with self._lock:
+                ops, self._ops = self._ops, collections.deque()
+                dirty, self._dirty = self._dirty, set()
+            for op, arg in ops:
+                if op == "add":
+                    arg.channel.watchers.add(arg)
+                    dirty.add(arg.channel)
+                elif op == "remove":
+                    self._drop(arg)
+                elif op == "ping":
+                    self._ping(arg)
+                else:
+                    arg.closed = True
+                    dirty.add(arg)
+            for ch in dirty:
+                for w in list(ch.watchers):
+                    if not w.blocked:
+                        self._flush(w)
+                self._trim(ch)
+
+    def _flush(self, w):
+        """Send w everything it is missing that its socket will take."""
+        ch = w.channel
+        if w.stale:
+            messages, w.pos = ch.snapshot()
+            w.private += [frame(m) for m in messages]
+            w.stale = False
+            self.resyncs += 1
+        while True:
+            bufs = w.private[:MAX_IOV]
+            if len(bufs) < MAX_IOV and w.pos < ch.end:
+                start = w.pos - ch.base
+                bufs += itertools.islice(ch.frames, start, start + MAX_IOV - len(bufs))
+            if not bufs:
+                break
+            views = [memoryview(b) for b in bufs]
+            views[0] = views[0][w.offset:]
+            want = sum(len(v) for v in views)
+            try:
+                sent = w.sock.sendmsg(views, [], socket.MSG_DONTWAIT | socket.MSG_NOSIGNAL)
+            except BlockingIOError:
+                sent = 0
+            except OSError:
+                self._drop(w)
+                return
+            self.sends += 1
+            self.sent += sent
+            w.sent += sent
+            n = w.offset + sent
+            for b in bufs:
+                if n < len(b):
+                    break
+                n -= len(b)
+                if w.private:
+                    w.private.pop(0)
+                else:
+                    w.pos += 1
+            w.offset = n
+            if sent < want:
+                # Socket full: carry on when it drains.
+                w.blocked = True
+                self.blocked += 1
+                self._sel.register(w.fd, selectors.EVENT_WRITE, w)
+                return
+        if ch.closed:
+            self._drop(w)
+
+    def _ping(self, w):
+        ch = w.channel
+        if w not in ch.watchers:
+            return
+        if w.offset and not w.private:
+            # Part-way into a shared frame: finish it first, privately.
+            w.private.append(ch.frames[w.pos - ch.base][w.offset:])
+            w.offset = 0
+            w.pos += 1
+        w.private.append(keepalive.PING)
+        if not w.blocked:
+            self._flush(w)
+
+    def _drop(self, w):
+        ch = w.channel
+        if w not in ch.watchers:
+            return
+        ch.watchers.discard(w)
+        if w.blocked:
+            self._sel.unregister(w.fd)
+            w.blocked = False
+        try:
+            w.sock.shutdown(socket.SHUT_RD)   # wakes the connection's reader
+        except OSError:
+            pass
+        w.done.set()
+        if ch.closed and not ch.watchers:
+            with self._lock:
+                self._channels.discard(ch)
+
+    def _trim(self, ch):
+        """Drop frames every watcher has, and old ones past ch.limit."""
+        with self._lock:
+            low = min((w.pos for w in ch.watchers), default=ch.end)
+            while ch.frames and (ch.base < low or ch.size > ch.limit):
+                data = ch.frames.popleft()
+                ch.size -= len(data)
+                if ch.base >= low:
+                    # Someone still needs this frame: they skip to a
+                    # snapshot, keeping the rest of one they are part-way into.
+                    for w in ch.watchers:
+                        if w.pos == ch.base:
+                            if w.offset and not w.private:
+                                w.private.append(data[w.offset:])
+                                w.offset = 0
+                            w.pos += 1
+                            w.stale = True
+                    low = min(w.pos for w in ch.watchers)
+                ch.base += 1
+            if ch.closed and not ch.watchers:
+                ch.frames.clear()
+                ch.size = 0
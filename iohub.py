@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — PTY I/O hub
+  One thread owns every PTY master in a single epoll set and hands the
+  output to per-session callbacks.  It sleeps in epoll_wait() with no
+  timeout, so idle sessions cost nothing; registration changes and shutdown
+  reach it through an eventfd (a pipe where eventfd is unavailable).
+
+  Output is coalesced with a latency budget: the first bytes after a quiet
+  spell are delivered at once (keystroke echo is never delayed), but while
+  a session keeps producing output it is delivered at most once per window
+  or whenever max_bytes pile up.  A slow_print animation thus becomes ~30
+  WebSocket frames a second instead of one per character.  The epoll
+  timeout is only set while some session has output waiting.
+"""
+
+import collections
+import os
+import selectors
+import threading
+import time
+
+MIN_READ = 1024
+MAX_READ = 64 * 1024
+
+
+class _Channel:
+    __slots__ = ("fd", "on_data", "on_close", "bufsize",
+                 "window", "max_bytes", "pending", "deadline", "last_flush")
+
+    def __init__(self, fd, on_data, on_close, window, max_bytes):
+        self.fd        = fd
+        self.on_data   = on_data
+        self.on_close  = on_close
+        self.bufsize   = 4096
+        self.window    = window
+        self.max_bytes = max_bytes
+        self.pending   = bytearray()
+        self.deadline  = None
+        self.last_flush = 0.0
+
+
+class IOHub:
+    """
+    add(fd, on_data, on_close) from any thread; on_data(bytes) and
+    on_close() then run on the hub thread.  Callbacks must not block for
+    long: every other session waits behind them.
+
+    window (seconds) and max_bytes set the default coalescing budget; a
+    window of 0 forwards every read as soon as it arrives.
+    """
+
+    def __init__(self, window=0.033, max_bytes=16384):
+        self.window    = window
+        self.max_bytes = max_bytes
+        self._sel      = None      # made by start(), in the process that runs it
+        self._ops      = collections.deque()
+        self._channels = {}
+        self._waiting  = set()     # channels holding coalesced output
+        self._running  = False
+        self._thread   = None
+        self._started  = time.monotonic()
+        self.wakeups   = 0
+        self.reads     = 0         # PTY reads: frames had nothing been held
+        self.frames    = 0         # chunks actually delivered
+        self.bytes     = 0
+
+    # ── any thread ───────────────────────────────────────────────────────────
+    def start(self):
+        self._sel = getattr(selectors, "EpollSelector", selectors.DefaultSelector)()
+        if hasattr(os, "eventfd"):
+            self._wake_r = self._wake_w = os.eventfd(0, os.EFD_NONBLOCK)
+        else:
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+        self._running = True
+        self._sel.register(self._wake_r, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._run, name="iohub", daemon=True)
+        self._thread.start()
+
+    def add(self, fd, on_data, on_close, window=None):
+        """Watch fd; window overrides the hub's coalescing window for it."""
+        ch = _Channel(fd, on_data, on_close,
+                      self.window if window is None else window, self.max_bytes)
+        self._ops.append(("add", ch))
+        self._wake()
+
+    def remove(self, fd):
+        """Stop watching fd.  on_close is not called for a removed fd."""
+        self._ops.append(("remove", fd))
+        self._wake()
+
+    def is_alive(self):
+        return bool(self._thread and self._thread.is_alive())
+
+    def stop(self):
+        self._running = False
+        self._wake()
+
+    def stats(self):
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        return {
+            "fds": len(self._channels), "wakeups": self.wakeups,
+            "window_ms": self.window * 1000, "max_bytes": self.max_bytes,
+            "reads": self.reads, "frames": self.frames, "bytes": self.bytes,
+            "reads_per_s":  round(self.reads / elapsed, 2),
+            "frames_per_s": round(self.frames / elapsed, 2),
+            "bytes_per_s":  round(self.bytes / elapsed, 2),
+        }
+
+    def _wake(self):
+        if self._sel is None:
+            return                 # not started: the ops run once it is
+        if self._wake_w == self._wake_r:
+            os.eventfd_write(self._wake_w, 1)
+        else:
+            os.write(self._wake_w, b"\0")
+
+    # ── hub thread ───────────────────────────────────────────────────────────
+    def _run(self):
+        while self._running:
+            timeout = None
+            if self._waiting:
+                due = min(ch.deadline for ch in self._waiting)
+                timeout = max(0.0, due - time.monotonic())
+            events = self._sel.select(timeout)
+            self.wakeups += 1
+            for key, _ in events:
+                if key.fd == self._wake_r:
+                    self._drain_wake()
+                    self._apply_ops()
+                else:
+                    self._read(key.data)
+            if self._waiting:
+                now = time.monotonic()
+                for ch in [c for c in self._waiting if c.deadline <= now]:
+                    self._flush(ch)
+
+    def _drain_wake(self):
+        try:
+            os.read(self._wake_r, 4096)
+        except BlockingIOError:
+            pass
+
+    def _apply_ops(self):
+        while self._ops:
+            op, arg = self._ops.popleft()
+            if op == "add":
+                self._channels[arg.fd] = arg
+                self._sel.register(arg.fd, selectors.EVENT_READ, arg)
+            elif arg in self._channels:
+                self._drop(self._channels[arg])
+
+    def _flush(self, ch):
+        self._waiting.discard(ch)
+        ch.deadline = None
+        ch.last_flush = time.monotonic()
+        if ch.pending:
+            data = bytes(ch.pending)
+            ch.pending.clear()
+            self.frames += 1
+            ch.on_data(data)
+
+    def _drop(self, ch):
+        self._waiting.discard(ch)
+        self._channels.pop(ch.fd, None)
+        try:
+            self._sel.unregister(ch.fd)
+        except (KeyError, ValueError):
+            pass
+
+    def _read(self, ch):
+        if ch.fd not in self._channels:
+            return   # removed earlier in this same batch of events
+        try:
+            data = os.read(ch.fd, ch.bufsize)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""   # EIO: the game closed its side of the PTY
+        if not data:
+            self._flush(ch)
+            self._drop(ch)
+            ch.on_close()
+            return
+        self.reads += 1
+        self.bytes += len(data)
+        # Adapt the read size to the session: a full buffer means output is
+        # bursting (art, screen redraws), a mostly empty one means typing.
+        if len(data) == ch.bufsize and ch.bufsize < MAX_READ:
+            ch.bufsize *= 2
+        elif len(data) < ch.bufsize // 4 and ch.bufsize > MIN_READ:
+            ch.bufsize //= 2
+        ch.pending += data
+        if ch.deadline is not None:
+            if len(ch.pending) >= ch.max_bytes:
+                self._flush(ch)
+            return
+        next_slot = ch.last_flush + ch.window
+        if ch.window <= 0 or len(ch.pending) >= ch.max_bytes \
+                or time.monotonic() >= next_slot:
+            self._flush(ch)
+        else:
+            ch.deadline = next_slot
+            self._waiting.add(ch)
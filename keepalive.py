@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — WebSocket keepalive
+  Finds browsers that vanished without closing their socket.
+
+  A phone that changes network or a laptop that goes to sleep sends no FIN:
+  the server's blocking receive() would wait for the OS TCP timeout, hours
+  with no data in flight, and keep the game, its PTY and its threads.  So
+  one thread pings every connection each `interval` seconds (a WebSocket
+  ping, which browsers answer on their own, so an idle player is never
+  disturbed) and reaps one that leaves `misses` pings in a row unanswered.
+  A dead peer is thus found between misses and misses + 1 intervals after
+  it went quiet, at the cost of one small frame per interval each way.
+
+  The thread never writes to a socket itself: a connection's ping() hands
+  the frame to whatever already writes to it, so frames never interleave.
+"""
+
+import threading
+import time
+
+import wslite
+
+# The ping every connection is sent: an empty control frame, never compressed.
+PING = wslite.encode_frame(wslite.OP_PING, b"")
+
+
+class Peer:
+    """
+    One connection.  ping() sends it PING; answered() says whether a pong
+    has come back since the last one (and forgets it); reap() closes it.
+    """
+
+    __slots__ = ("ping", "answered", "reap", "missed", "dead")
+
+    def __init__(self, ping, answered, reap):
+        self.ping     = ping
+        self.answered = answered
+        self.reap     = reap
+        self.missed   = 0          # pings in a row with no pong
+        self.dead     = False      # reaped by the keepalive
+
+
+class Keepalive:
+    """add() and remove() from any thread; pings and reaps run on its own."""
+
+    def __init__(self, interval=25.0, misses=2):
+        self.interval = interval
+        self.misses   = misses
+        self._peers   = set()
+        self._lock    = threading.Lock()
+        self.pings    = 0
+        self.missed   = 0          # pings that went unanswered
+        self.reaped   = 0          # connections found dead
+
+    def start(self):
+        if self.interval > 0:
+            threading.Thread(target=self._run, name="keepalive", daemon=True).start()
+
+    def add(self, ping, answered, reap):
+        peer = Peer(ping, answered, reap)
+        with self._lock:
+            self._peers.add(peer)
+        return peer
+
+    def remove(self, peer):
+        with self._lock:
+            self._peers.discard(peer)
+
+    def stats(self):
+        return {"interval_s": self.interval, "misses": self.misses,
+                "peers": len(self._peers), "pings": self.pings,
+                "missed": self.missed, "reaped": self.reaped}
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                peers = list(self._peers)
+            for peer in peers:
+                self._check(peer)
+
+    def _check(self, peer):
+        if peer.answered():
+            peer.missed = 0
+        else:
+            peer.missed += 1
+            self.missed += 1
+            if peer.missed >= self.misses:
+                self.remove(peer)
+                peer.dead = True
+                self.reaped += 1
+                try:
+                    peer.reap()
+                except Exception:
+                    pass
+                return
+        try:
+            peer.ping()
+        except Exception:
+            pass               # the connection's own reader sees the error
+        self.pings += 1
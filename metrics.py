@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Metrics
+  Counters, gauges and histograms rendered in the Prometheus text
+  exposition format (version 0.0.4) for server.py's /metrics.
+
+  Updates take no lock: each is a dict read and write on the calling
+  thread, which the GIL keeps consistent.  Two threads bumping the same
+  series at the same instant can lose one increment; for rates and
+  latency percentiles that is noise, and it keeps the hub thread and the
+  request threads from ever waiting on each other.
+"""
+
+import math
+
+REGISTRY = []
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    pairs += [f'{n}="{v}"' for n, v in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return repr(int(value))
+    return repr(value)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, help, labels=(), collect=None):
+        self.name    = name
+        self.help    = help
+        self.labels  = tuple(labels)
+        self.values  = {}
+        self.collect = collect
+        REGISTRY.append(self)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self):
+        if self.collect:
+            self.values = self.collect()
+        lines = self.header()
+        for key, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.labels, key)} {_number(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """
+    Monotonic count: inc(amount, *label_values), or pass `collect`, a
+    function returning {label_values: value} that is called at scrape time,
+    to export a count kept elsewhere.
+    """
+    kind = "counter"
+
+    def inc(self, amount=1, *labels):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    """A value that goes up and down: set() it, or pass `collect`."""
+    kind = "gauge"
+
+    def set(self, value, *labels):
+        self.values[labels] = value
+
+
+class Histogram(_Metric):
+    """Cumulative buckets plus _sum and _count.  observe(value, *label_values)."""
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=(
+            .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets) + (math.inf,)
+
+    def observe(self, value, *labels):
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [[0] * len(self.buckets), 0.0, 0]
+        counts = series[0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        series[1] += value
+        series[2] += 1
+
+    def render(self):
+        lines = self.header()
+        for key, (counts, total, count) in sorted(self.values.items()):
+            running = 0
+            for bound, n in zip(self.buckets, counts):
+                running += n
+                lines.append(f"{self.name}_bucket"
+                             f"{_labels(self.labels, key, [('le', _number(bound))])} {running}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labels, key)} {count}")
+        return lines
+
+
+def render():
+    """Every registered metric, ready to serve as text/plain; version=0.0.4."""
+    lines = []
+    for metric in REGISTRY:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
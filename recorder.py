@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Session recorder
+  Records games as asciicast v2 (the asciinema format: a JSON header line,
+  then one [time, "o", text] line per chunk of output) for server.py when
+  DUNGEON_RECORD=1.
+
+  Recording never touches the disk on the I/O hub thread: output() only
+  appends a line to the recording's pending list.  One writer thread takes
+  those lists every FLUSH_S seconds and writes each recording's batch with
+  a single write().
+
+  A recording is a run of segments, <id>.<n>.cast.  A segment that grows
+  past `rotate` bytes, and the last one when the game ends, is replaced by
+  its zlib-compressed <id>.<n>.cast.z.  Decompressed and concatenated in
+  order they form one .cast file; segment 0 carries the header.
+
+  Beside them, <id>.idx holds keyframes.  At every chunk of output that
+  clears the screen, and after KEYFRAME_BYTES of output without one (a
+  game sending its screens as diffs seldom clears), it stores the screen
+  as that chunk leaves it (a vterm repaint), the terminal size, and where
+  the event after it starts: its segment and byte offset in that segment
+  uncompressed.  A replay can then start anywhere by drawing the nearest
+  keyframe and reading on from that offset, without parsing what came
+  before it.  Each batch written also adds {"end": <seconds>} to the
+  index, so a recording's length is known without reading it.  The index
+  is compressed to <id>.idx.z when the game ends.
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+
+FLUSH_S = 1.0
+# Output bytes after which a keyframe is due even with no clear.
+KEYFRAME_BYTES = 32 << 10
+
+
+def _line(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class Recording:
+    """One game's cast.  output() and resize() run on the hub thread."""
+
+    def __init__(self, rec_id, cols, rows):
+        self.id        = rec_id
+        self.started   = time.monotonic()
+        self.pending   = [_line({"version": 2, "width": cols, "height": rows,
+                                 "timestamp": int(time.time()),
+                                 "env": {"TERM": "xterm-256color"}})]
+        self.keyframes = []        # keyframes waiting for the writer
+        self.events    = 0         # events so far: the number of the next one
+        self.taken     = -1        # event number of the next line take() returns
+        self.size      = f"{cols}x{rows}"
+        self.duration  = 0.0
+        self.segment   = 0
+        self.segment_bytes = 0
+        self.raw       = 0         # output bytes recorded
+        self.written   = 0         # bytes written to disk, compressed copies too
+        self.unkeyed   = 0         # output bytes since the last keyframe
+        self.closed    = False
+        self.lock      = threading.Lock()   # pending and keyframes
+
+    def keyframe_due(self):
+        return self.unkeyed >= KEYFRAME_BYTES
+
+    def output(self, text, screen=None):
+        """Record text; screen is a repaint to keyframe after it, if any."""
+        t = round(time.monotonic() - self.started, 6)
+        line = _line([t, "o", text])
+        with self.lock:
+            self.pending.append(line)
+            self.events += 1
+            if screen is not None:
+                self.keyframes.append({"t": t, "event": self.events,
+                                       "size": self.size, "screen": screen})
+            self.duration = t
+        size = len(text.encode("utf-8"))
+        self.raw += size
+        self.unkeyed = 0 if screen is not None else self.unkeyed + size
+
+    def resize(self, cols, rows):
+        t = round(time.monotonic() - self.started, 6)
+        with self.lock:
+            self.size = f"{cols}x{rows}"
+            self.pending.append(_line([t, "r", self.size]))
+            self.events += 1
+
+    def take(self):
+        """
+        (cast lines, keyframes, event number of the first line, time of the
+        last output) added since the last take().  The header line is
+        event -1.
+        """
+        with self.lock:
+            lines, self.pending = self.pending, []
+            keys, self.keyframes = self.keyframes, []
+            first, self.taken = self.taken, self.taken + len(lines)
+            return lines, keys, first, self.duration
+
+
+class Recorder:
+    """
+    The writer thread and every recording it writes.  start(), close() and
+    stats() from any thread.
+    """
+
+    def __init__(self, directory, rotate=1 << 20):
+        self.dir       = Path(directory)
+        self.rotate    = rotate
+        self.active    = {}        # id → Recording still being written
+        self.finished  = [0, 0]    # raw and written bytes of finished recordings
+        self._lock     = threading.Lock()
+        self._wake     = threading.Event()
+        self._thread   = None
+        self.batches   = 0         # write() calls
+        self.rotations = 0
+
+    def start(self):
+        os.makedirs(self.dir, mode=0o700, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, rec_id, cols, rows):
+        rec = Recording(rec_id, cols, rows)
+        with self._lock:
+            self.active[rec_id] = rec
+        return rec
+
+    def close(self, rec):
+        """The game ended: write the rest and compress the last segment."""
+        rec.closed = True
+        self._wake.set()
+
+    def flush(self):
+        """Write everything pending now (on the calling thread)."""
+        with self._lock:
+            recs = list(self.active.values())
+        for rec in recs:
+            self._write(rec)
+
+    # ── writer thread ────────────────────────────────────────────────────────
+    def _run(self):
+        while True:
+            self._wake.wait(FLUSH_S)
+            self._wake.clear()
+            self.flush()
+
+    def _write(self, rec):
+        closed = rec.closed         # read first: all its output is in by then
+        lines, keys, first, duration = rec.take()
+        # Where each line of the batch starts in the segment.
+        starts = [rec.segment_bytes]
+        if lines:
+            chunks = [line.encode("utf-8") for line in lines]
+            for chunk in chunks:
+                starts.append(starts[-1] + len(chunk))
+            data = b"".join(chunks)
+            with open(self.dir / f"{rec.id}.{rec.segment}.cast", "ab") as f:
+                f.write(data)
+            rec.written += len(data)
+            rec.segment_bytes += len(data)
+            self.batches += 1
+        segment = rec.segment
+        if rec.segment_bytes > self.rotate or (closed and rec.segment_bytes):
+            self._compress(rec)
+        index = []
+        if keys:
+            for k in keys:
+                at = k["event"] - first
+                if at < len(lines):
+                    k["segment"], k["offset"] = segment, starts[at]
+                else:                   # its event is in the next batch
+                    k["segment"], k["offset"] = rec.segment, rec.segment_bytes
+                index.append(_line(k))
+        if lines:
+            index.append(_line({"end": duration}))
+        if index:
+            data = "".join(index).encode("utf-8")
+            with open(self.dir / f"{rec.id}.idx", "ab") as f:
+                f.write(data)
+            rec.written += len(data)
+            self.batches += 1
+        if closed:
+            self._pack(self.dir / f"{rec.id}.idx", rec)
+            with self._lock:
+                self.active.pop(rec.id, None)
+                self.finished[0] += rec.raw
+                self.finished[1] += rec.written
+
+    def _compress(self, rec):
+        self._pack(self.dir / f"{rec.id}.{rec.segment}.cast", rec)
+        rec.segment += 1
+        rec.segment_bytes = 0
+        self.rotations += 1
+
+    def _pack(self, plain, rec):
+        """Replace plain with plain.z, its zlib-compressed copy."""
+        try:
+            packed = zlib.compress(plain.read_bytes(), 6)
+        except FileNotFoundError:
+            return
+        tmp = plain.with_name(plain.name + ".z.tmp")
+        tmp.write_bytes(packed)
+        os.replace(tmp, plain.with_name(plain.name + ".z"))
+        plain.unlink()
+        rec.written += len(packed)
+
+    # ── reports ──────────────────────────────────────────────────────────────
+    def stats(self):
+        with self._lock:
+            sizes = [(r.raw, r.written) for r in self.active.values()]
+            sizes.append(tuple(self.finished))
+            recording = len(self.active)
+        raw = sum(r for r, _ in sizes)
+        written = sum(w for _, w in sizes)
+        usage = recordings(self.dir)
+        disk = sum(usage.values())
+        return {
+            "dir": str(self.dir),
+            "recording": recording,
+            "recordings": len(usage),
+            "raw_bytes": raw,
+            "written_bytes": written,
+            "disk_bytes": disk,
+            # Bytes written per byte of game output, and kept on disk.
+            "write_amplification": round(written / raw, 2) if raw else 0.0,
+            "disk_ratio": round(disk / raw, 2) if raw else 0.0,
+            "avg_disk_bytes": round(disk / len(usage)) if usage else 0,
+            "batches": self.batches,
+            "rotations": self.rotations,
+        }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reading recordings back
+# ─────────────────────────────────────────────────────────────────────────────
+
+def recordings(directory):
+    """{id: bytes on disk} for every recording in directory."""
+    out = {}
+    for path in Path(directory).glob("*.0.cast*"):
+        out[path.name.split(".", 1)[0]] = 0
+    for path in Path(directory).glob("*.*"):
+        rec_id = path.name.split(".", 1)[0]
+        if rec_id in out:
+            out[rec_id] += path.stat().st_size
+    return out
+
+
+def cast_lines(directory, rec_id, segment=0, offset=0):
+    """
+    Every line of a recording as written so far, header first; or from
+    byte `offset` of `segment` on, as a keyframe gives them.
+    """
+    n = segment
+    while True:
+        base = Path(directory) / f"{rec_id}.{n}.cast"
+        packed = base.with_suffix(".cast.z")
+        if packed.exists():
+            data = zlib.decompress(packed.read_bytes())
+        elif base.exists():
+            data = base.read_bytes()
+            data = data[:data.rfind(b"\n") + 1]  # a line being written
+        else:
+            return
+        if n == segment:
+            data = data[offset:]
+        yield from data.decode("utf-8").splitlines()
+        n += 1
+
+
+def header(directory, rec_id):
+    """The recording's header line, reading no further than it, or None."""
+    base = Path(directory) / f"{rec_id}.0.cast"
+    head = b""
+    try:
+        with open(base.with_suffix(".cast.z"), "rb") as f:
+            unpack = zlib.decompressobj()
+            while b"\n" not in head:
+                chunk = f.read(4096)
+                if not chunk:
+                    break
+                head += unpack.decompress(chunk)
+    except FileNotFoundError:
+        try:
+            with open(base, "rb") as f:
+                head = f.readline()
+        except FileNotFoundError:
+            return None
+    if b"\n" not in head:
+        return None
+    return head.split(b"\n", 1)[0].decode("utf-8")
+
+
+def _index(directory, rec_id):
+    """Every entry of the recording's index: keyframes and ends."""
+    path = Path(directory) / f"{rec_id}.idx"
+    try:
+        text = zlib.decompress(path.with_name(path.name + ".z").read_bytes()).decode("utf-8")
+    except FileNotFoundError:
+        try:
+            text = path.read_text("utf-8")
+        except OSError:
+            return []
+    return [json.loads(line) for line in text[:text.rfind("\n") + 1].splitlines()]
+
+
+def keyframes(directory, rec_id):
+    """The recording's keyframes, oldest first."""
+    return [k for k in _index(directory, rec_id) if "screen" in k]
+
+
+def info(directory, rec_id):
+    """
+    Header, duration and keyframe times, or None if there is no such
+    recording; from the header line and the index alone.
+    """
+    head = header(directory, rec_id)
+    if head is None:
+        return None
+    duration, frames = 0.0, []
+    for entry in _index(directory, rec_id):
+        if "screen" in entry:
+            frames.append(entry["t"])
+        else:
+            duration = entry["end"]
+    return {"header": json.loads(head), "duration": duration, "keyframes": frames}
+
+
+def seek(directory, rec_id, start=0.0):
+    """
+    The recording as cast lines, starting from the last keyframe at or
+    before `start` seconds: the header, the keyframe's screen as an event
+    at its own time, then every event after it, read from the keyframe's
+    offset on.  Event times are kept, so a player knows where in the
+    recording it is.
+    """
+    frame = None
+    for k in keyframes(directory, rec_id):
+        if k["t"] > start:
+            break
+        frame = k
+    head = header(directory, rec_id)
+    if head is None:
+        return
+    yield head
+    if frame is None:
+        lines = cast_lines(directory, rec_id)
+        next(lines, None)
+        yield from lines
+        return
+    started = json.loads(head)
+    if frame["size"] != f"{started['width']}x{started['height']}":
+        yield _line([frame["t"], "r", frame["size"]]).rstrip("\n")
+    yield _line([frame["t"], "o", frame["screen"]]).rstrip("\n")
+    yield from cast_lines(directory, rec_id, frame["segment"], frame["offset"])
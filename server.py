@@ -5,22 +5,149 @@
   Usage: python3 server.py [port]
 """
 
+import ast
+import atexit
+import codecs
+import collections
+import contextlib
 import fcntl
 import os
 import pty
-import select
+import secrets
+import signal
+import socket
 import struct
 import subprocess
+import sys
+import tempfile
 import termios
 import threading
+import time
 from pathlib import Path
 
-from flask import Flask
+from flask import Flask, Response, jsonify, request
 from flask_sock import Sock
+from simple_websocket import ConnectionClosed
+
+import admission
+import assets
+import dungeon_ascii_art
+import dungeon_game
+import fanout
+import keepalive
+import metrics
+import recorder
+import vterm
+import workers
+from iohub import IOHub
+from zygote import Zygote
 
 GAME_PATH = Path(__file__).parent / "dungeon_game.py"
 
-app = Flask(__name__)
+# How session processes are created: "exec" starts a fresh interpreter per
+# game, "zygote" forks it from one preloaded parent so content is shared.
+SPAWN_MODE = os.environ.get("DUNGEON_SPAWN", "exec")
+
+# While a game is streaming output, send at most one WebSocket frame per
+# this many ms (or per this many bytes).  Output after a quiet spell always
+# goes out at once.  0 sends every PTY read straight away.
+COALESCE_MS    = float(os.environ.get("DUNGEON_COALESCE_MS", "33"))
+COALESCE_BYTES = int(os.environ.get("DUNGEON_COALESCE_BYTES", "16384"))
+
+# A socket that falls this many bytes of output behind skips to the latest
+# screen (what follows the last clear, or a repaint) instead of being sent
+# every frame it missed.
+OUTPUT_QUEUE = int(os.environ.get("DUNGEON_OUTPUT_QUEUE", str(64 * 1024)))
+
+# How PTY output travels: "text" decodes it to UTF-8 text frames, "binary"
+# sends the raw bytes and lets xterm.js decode them.  ?frames= overrides it
+# per connection.
+FRAMES = os.environ.get("DUNGEON_FRAMES", "text")
+
+# Start every compressed connection by sending the game's common text (see
+# deflate_dictionary()) so the first room already compresses like a redraw.
+DEFLATE_PRIME = os.environ.get("DUNGEON_DEFLATE_PRIME", "0") == "1"
+
+# A game outlives its WebSocket by this many seconds, so a locked phone or a
+# Wi-Fi blip resumes the same run.  0 ends the game on disconnect.
+RESUME_GRACE = float(os.environ.get("DUNGEON_RESUME_GRACE", "300"))
+# At most this many detached games are kept; the longest-detached go first.
+RESUME_MAX = int(os.environ.get("DUNGEON_RESUME_MAX", "50"))
+# Bytes of recent output each game keeps for replay after a reconnect.
+RESUME_BUFFER = int(os.environ.get("DUNGEON_RESUME_BUFFER", str(64 * 1024)))
+
+# A game idle this many seconds at its room prompt is saved to disk and its
+# process ended; the next keystroke restores it.  0 disables hibernation.
+HIBERNATE_AFTER = float(os.environ.get("DUNGEON_HIBERNATE_AFTER", "600"))
+# Where snapshots go: private to this user, as snapshots are pickles (see
+# prepare_hibernate_dir).  Set in the environment so games inherit it.
+HIBERNATE_DIR = os.environ.setdefault("DUNGEON_HIBERNATE_DIR", os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or os.path.expanduser("~/.cache"), "dungeon-snapshots"))
+
+# Let the page type out the game's slow text itself: the game sends each
+# paragraph whole, marked with OSC 7770, instead of a few words at a time.
+# Set in the environment so game processes inherit it.
+CLIENT_TYPING = os.environ.setdefault("DUNGEON_CLIENT_TYPING", "1") == "1"
+
+# Redraw screens by difference (see dungeon_game.Console): the page's
+# terminal is always one the game can model.  Set in the environment so
+# game processes inherit it.
+DIFF_SCREENS = os.environ.setdefault("DUNGEON_DIFF", "1") == "1"
+
+# Record every game as an asciicast v2 file in DUNGEON_RECORD_DIR, with
+# keyframes for seeking, replayable at /replay/<id>.  There is no public
+# listing: an id is the only way in, and ids are only on disk.
+# Segments past DUNGEON_RECORD_ROTATE bytes are zlib-compressed.
+RECORD = os.environ.get("DUNGEON_RECORD", "0") == "1"
+RECORD_DIR = os.environ.get(
+    "DUNGEON_RECORD_DIR", os.path.join(tempfile.gettempdir(), "dungeon-recordings"))
+RECORD_ROTATE = int(os.environ.get("DUNGEON_RECORD_ROTATE", str(1 << 20)))
+
+# Ping every WebSocket each DUNGEON_PING_INTERVAL seconds and close one that
+# leaves DUNGEON_PING_MISSES pings in a row unanswered: a browser that
+# vanished without closing.  Browsers answer pings themselves, so idle
+# players are unaffected.  0 disables.
+PING_INTERVAL = float(os.environ.get("DUNGEON_PING_INTERVAL", "25"))
+PING_MISSES   = int(os.environ.get("DUNGEON_PING_MISSES", "2"))
+
+# Admission control (admission.py).  A new game starts only while available
+# memory, less DUNGEON_MEM_RESERVE_MB, holds one more at the measured cost
+# of those running (DUNGEON_SESSION_MB until there are any); otherwise the
+# player waits in line.  DUNGEON_MAX_GAMES caps games outright.  Each
+# address may have DUNGEON_IP_SESSIONS connections playing or waiting,
+# and starts are limited to DUNGEON_SPAWN_RATE a second overall and
+# DUNGEON_IP_SPAWN_RATE a minute per address.  0 turns a limit off;
+# DUNGEON_ADMISSION=0 turns them all off.
+ADMIT         = os.environ.get("DUNGEON_ADMISSION", "1") == "1"
+MAX_GAMES     = int(os.environ.get("DUNGEON_MAX_GAMES", "0"))
+MEM_RESERVE   = int(float(os.environ.get("DUNGEON_MEM_RESERVE_MB", "32")) * 2**20)
+SESSION_BYTES = int(float(os.environ.get("DUNGEON_SESSION_MB", "16")) * 2**20)
+IP_SESSIONS   = int(os.environ.get("DUNGEON_IP_SESSIONS", "4"))
+SPAWN_RATE    = float(os.environ.get("DUNGEON_SPAWN_RATE", "4"))
+IP_SPAWN_RATE = float(os.environ.get("DUNGEON_IP_SPAWN_RATE", "10"))
+ADMIT_QUEUE   = int(os.environ.get("DUNGEON_ADMIT_QUEUE", "200"))
+# Behind this many proxies, take the client's address from Fly-Client-IP or
+# else the X-Forwarded-For hop the outermost of them appended: hops to its
+# left are whatever the client sent.  0 uses the socket's peer address.
+TRUST_PROXY   = int(os.environ.get("DUNGEON_TRUST_PROXY", "0"))
+
+# Where games run: "pty" gives each one its own process and PTY, "inproc"
+# runs every Game inside this server behind a WebConsole.
+HOSTING = os.environ.get("DUNGEON_HOSTING", "pty")
+
+# Number of idle game processes kept parked at the title screen.  0 disables
+# the pool and every connection cold-starts its own interpreter.
+POOL_SIZE = int(os.environ.get("DUNGEON_POOL_SIZE", "2"))
+
+# Server processes, each with its own GIL, hub, pool and games; a pre-fork
+# master routes every reconnect to the worker holding its game (see
+# workers.py).  "auto" runs one per CPU.  One by default: each worker
+# keeps its own admission limits, metrics and health, and /metrics,
+# /stats and /healthz only ever answer for the worker they land on.
+WORKERS   = workers.count(os.environ.get("DUNGEON_WORKERS", "1"))
+WORKER_ID = None            # this worker's index when WORKERS > 1
+
+app = Flask(__name__, static_folder=None)   # /static is served from STATIC
 sock = Sock(app)
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -33,7 +160,7 @@ HTML = r"""<!DOCTYPE html>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
   <title>Dungeon of the Forgotten King</title>
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/xterm@5.3.0/css/xterm.css"/>
+  <link rel="stylesheet" href="/static/xterm.css"/>
   <style>
     *, *::before, *::after { margin: 0; padding: 0; box-sizing: border-box; }
 
@@ -58,6 +185,8 @@ HTML = r"""<!DOCTYPE html>
       user-select: none;
     }
     #header span { color: #997700; }
+    #header a { color: #444; margin-left: 2em; text-decoration: none; }
+    #header a:hover { color: #888; }
 
     #terminal-container {
       flex: 1;
@@ -121,7 +250,7 @@ HTML = r"""<!DOCTYPE html>
 </head>
 <body>
 
-<div id="header">⚔ &nbsp; <span>DUNGEON OF THE FORGOTTEN KING</span> &nbsp; ⚔</div>
+<div id="header">⚔ &nbsp; <span>DUNGEON OF THE FORGOTTEN KING</span> &nbsp; ⚔<a id="watch-link" target="_blank" hidden>spectate ↗</a></div>
 <div id="terminal-container">
   <div id="terminal"></div>
 </div>
@@ -137,9 +266,12 @@ HTML = r"""<!DOCTYPE html>
   <button id="start-btn">ENTER THE DUNGEON</button>
 </div>
 
-<script src="https://cdn.jsdelivr.net/npm/xterm@5.3.0/lib/xterm.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/xterm-addon-fit@0.8.0/lib/xterm-addon-fit.js"></script>
-<script>
+<script src="/static/xterm.js"></script>
+<script src="/static/addon-fit.js"></script>
+<script type="module">
+const { Terminal } = window;
+const { FitAddon } = window.FitAddon;
+
 const overlay  = document.getElementById('overlay');
 const startBtn = document.getElementById('start-btn');
 
@@ -173,15 +305,150 @@ const term = new Terminal({
   },
 });
 
-const fitAddon = new FitAddon.FitAddon();
+const fitAddon = new FitAddon();
 term.loadAddon(fitAddon);
 term.open(document.getElementById('terminal'));
 fitAddon.fit();
 
 let ws = null;
 
+// Resumable sessions: the server names the session in a "\x00SESSION:" control
+// message and keeps the game alive for a while after a disconnect.  The page
+// counts the stream bytes it has written (`seen`) so a reconnect replays
+// only what it missed.
+const SESSION_KEY = 'dungeon-session';
+const utf8 = new TextEncoder();
+let seen      = 0;
+let resumable = false;   // this page's game can be picked up again
+let ended     = false;   // the game itself finished
+let retries   = 0;
+let refused   = null;    // why the server would not start a game, if it would not
+
+// /?watch=<id> is a spectator's page: it shows someone else's game and
+// sends nothing, and never touches this browser's own saved session.
+const WATCH     = new URLSearchParams(location.search).get('watch');
+const watchLink = document.getElementById('watch-link');
+if (WATCH) {
+  overlay.querySelector('.subtitle').textContent = 'spectating';
+  startBtn.textContent = 'WATCH';
+}
+
+// Slow text is typed out here, not by the game: it sends each paragraph
+// whole, between "\x1b]7770;<seconds per character>\x07" and "\x1b]7770;\x07".
+// Output is queued and cut after every marker, so the OSC handler has set
+// the pace before the text behind it comes up; that text is then revealed
+// a little at a time.  A key shows the rest, and everything typed until
+// the queue runs dry (the game's prompt); it is not sent to the game.
+const TYPE_MARK = '\x1b]7770;';
+let outQ     = [];
+let outBusy  = false;
+let carry    = null;     // the start of a marker cut off by the message end
+let pace     = 0;        // seconds per character, between markers
+let rushing  = false;
+let finish   = null;     // ends the typing under way: shows the rest, or drops it
+const typeDecoder = new TextDecoder();
+
+term.parser.registerOscHandler(7770, (data) => {
+  pace = parseFloat(data) || 0;
+  return true;
+});
+
+function find(data, needle, from) {
+  if (typeof data === 'string') return data.indexOf(needle, from);
+  next: for (let i = from; i <= data.length - needle.length; i++) {
+    for (let j = 0; j < needle.length; j++) {
+      if (data[i + j] !== needle.charCodeAt(j)) continue next;
+    }
+    return i;
+  }
+  return -1;
+}
+
+function join(a, b) {
+  if (typeof a === 'string') return a + b;
+  const both = new Uint8Array(a.length + b.length);
+  both.set(a);
+  both.set(b, a.length);
+  return both;
+}
+
+function output(data) {
+  if (carry) { data = join(carry, data); carry = null; }
+  const esc = data.lastIndexOf(typeof data === 'string' ? '\x1b' : 27);
+  if (esc >= 0) {
+    const head = data.slice(esc, esc + 32);
+    const tail = typeof head === 'string' ? head : String.fromCharCode(...head);
+    if (tail.length < TYPE_MARK.length ? TYPE_MARK.startsWith(tail)
+        : tail.startsWith(TYPE_MARK) && !tail.includes('\x07')) {
+      carry = data.slice(esc);
+      data = data.slice(0, esc);
+    }
+  }
+  let from = 0, at;
+  while ((at = find(data, TYPE_MARK, from)) >= 0) {
+    const end = find(data, '\x07', at) + 1;
+    outQ.push(data.slice(from, end));
+    from = end;
+  }
+  if (from < data.length) outQ.push(data.slice(from));
+  pump();
+}
+
+function pump() {
+  if (outBusy || !outQ.length) return;
+  const piece = outQ.shift();
+  outBusy = true;
+  const next = () => {
+    outBusy = false;
+    if (!outQ.length) rushing = false;
+    pump();
+  };
+  if (pace > 0 && !rushing) typeOut(piece, next);
+  else term.write(piece, next);
+}
+
+function typeOut(piece, done) {
+  const text  = typeof piece === 'string' ? piece : typeDecoder.decode(piece, { stream: true });
+  // Escape sequences go out whole and take no time.
+  const parts = text.match(/\x1b\[[0-9;?]*[@-~]|\x1b\][^\x07]*\x07|[\s\S]/gu) || [];
+  const start = performance.now();
+  let i = 0, shown = 0, timer = null;
+  const step = () => {
+    const due = (performance.now() - start) / 1000 / pace;
+    let out = '';
+    while (i < parts.length && (parts[i][0] === '\x1b' || shown < due)) {
+      if (parts[i][0] !== '\x1b') shown++;
+      out += parts[i++];
+    }
+    if (i < parts.length) {
+      if (out) term.write(out);
+      timer = setTimeout(step, 30);
+    } else {
+      finish = null;
+      term.write(out, done);
+    }
+  };
+  finish = (show = true) => {
+    clearTimeout(timer);
+    finish = null;
+    if (show) term.write(parts.slice(i).join(''), done);
+    else done();
+  };
+  step();
+}
+
+// Start over on a clean terminal: nothing queued or being typed survives.
+function resetTerm() {
+  outQ = [];
+  if (finish) finish(false);
+  carry = null;
+  pace = 0;
+  rushing = false;
+  term.reset();
+}
+
 function sendResize() {
-  if (ws && ws.readyState === WebSocket.OPEN) {
+  if (ws && ws.readyState === WebSocket.OPEN && !WATCH) {
     ws.send(`\x00RESIZE:${term.cols}:${term.rows}`);
   }
 }
@@ -191,44 +458,315 @@ window.addEventListener('resize', () => {
   sendResize();
 });
 
+function control(msg) {
+  if (msg.startsWith('\x00SESSION:')) {
+    const [, token, offset] = msg.split(':');
+    localStorage.setItem(SESSION_KEY, token);
+    // A new game, or output we can no longer get back: start clean.
+    if (Number(offset) !== seen) resetTerm();
+    seen = Number(offset);
+    resumable = true;
+  } else if (msg.startsWith('\x00SCREEN:')) {
+    // A repaint of the current screen in place of output we missed.
+    resetTerm();
+    output(msg.slice(8));
+  } else if (msg.startsWith('\x00WATCH:')) {
+    // The link a spectator can open to follow this game.
+    watchLink.href = '/?watch=' + encodeURIComponent(msg.slice(7));
+    watchLink.hidden = false;
+  } else if (msg.startsWith('\x00QUEUE:')) {
+    // The server is full: show our place in line until it lets us in (0).
+    const [, place, waiting] = msg.split(':').map(Number);
+    if (place) {
+      overlay.classList.remove('hidden');
+      overlay.querySelector('.subtitle').textContent =
+        `the dungeon is full — you are ${place} of ${waiting} in line`;
+      startBtn.hidden = true;
+    } else {
+      overlay.classList.add('hidden');
+      startBtn.hidden = false;
+      term.focus();
+    }
+  } else if (msg.startsWith('\x00FULL:')) {
+    refused = msg.slice(6);
+  } else if (msg === '\x00END') {
+    ended = true;
+  }
+}
+
 function connect() {
-  const proto = location.protocol === 'https:' ? 'wss' : 'ws';
-  ws = new WebSocket(`${proto}://${location.host}/ws`);
+  if (ws && ws.readyState <= WebSocket.OPEN) return;   // already on it
+  const proto  = location.protocol === 'https:' ? 'wss' : 'ws';
+  const params = new URLSearchParams(location.search);
+  const token  = localStorage.getItem(SESSION_KEY);
+  if (WATCH) {
+    ws = new WebSocket(`${proto}://${location.host}/watch/${encodeURIComponent(WATCH)}`);
+  } else {
+    if (token) {
+      params.set('resume', token);
+      params.set('seen', seen);
+    }
+    const query = params.toString();
+    ws = new WebSocket(`${proto}://${location.host}/ws${query ? '?' + query : ''}`);
+  }
+  ws.binaryType = 'arraybuffer';
+  ended = false;
+  refused = null;
 
   ws.onopen = () => {
     overlay.classList.add('hidden');
-    term.reset();
+    retries = 0;
     term.focus();
     sendResize();
   };
 
   ws.onmessage = (e) => {
-    term.write(e.data);
+    // Binary frames are raw PTY bytes; xterm.js decodes UTF-8 itself and
+    // carries split sequences over to the next write.
+    const data = typeof e.data === 'string' ? e.data : new Uint8Array(e.data);
+    // Messages starting with NUL are for the page, not the terminal.
+    if (typeof data === 'string' ? data.charCodeAt(0) === 0 : data[0] === 0) {
+      control(typeof data === 'string' ? data : new TextDecoder().decode(data));
+      return;
+    }
+    seen += typeof data === 'string' ? utf8.encode(data).length : data.length;
+    output(data);
   };
 
   ws.onclose = () => {
-    term.write('\r\n\r\n\x1b[2m  [Session ended. Press the button to play again.]\x1b[0m\r\n');
+    ws = null;
+    watchLink.hidden = true;
+    if (WATCH) {
+      output('\r\n\r\n\x1b[2m  [The game has ended.]\x1b[0m\r\n');
+      overlay.classList.remove('hidden');
+      startBtn.textContent = 'WATCH AGAIN';
+      return;
+    }
+    if (resumable && !ended && retries < 8) {
+      // Dropped, not finished: the game is waiting for us on the server.
+      overlay.classList.remove('hidden');
+      overlay.querySelector('.subtitle').textContent = 'reconnecting…';
+      startBtn.textContent = 'NEW GAME';
+      setTimeout(connect, Math.min(1000 * 2 ** retries++, 10000));
+      return;
+    }
+    resumable = false;
+    localStorage.removeItem(SESSION_KEY);
+    startBtn.hidden = false;
+    if (refused) {
+      overlay.classList.remove('hidden');
+      overlay.querySelector('.subtitle').textContent = refused === 'ip'
+        ? 'too many games from your address — finish one first'
+        : 'the line is full — try again in a minute';
+      startBtn.textContent = 'TRY AGAIN';
+      return;
+    }
+    output('\r\n\r\n\x1b[2m  [Session ended. Press the button to play again.]\x1b[0m\r\n');
     overlay.classList.remove('hidden');
     overlay.querySelector('.subtitle').textContent = 'of the  F O R G O T T E N  K I N G';
     startBtn.textContent = 'PLAY AGAIN';
   };
-
-  term.onData((data) => {
-    if (ws && ws.readyState === WebSocket.OPEN) {
-      ws.send(data);
-    }
-  });
 }
 
+term.onData((data) => {
+  if (finish || rushing) {
+    // A key while text is typed out shows it all; keys from then until
+    // the queue runs dry only skip too.  Neither reaches the game.
+    rushing = true;
+    if (finish) finish();
+    return;
+  }
+  if (ws && ws.readyState === WebSocket.OPEN && !WATCH) {
+    ws.send(data);
+  }
+});
+
+// A phone coming back from a locked screen reconnects straight away
+// instead of waiting out the backoff.
+document.addEventListener('visibilitychange', () => {
+  if (document.visibilityState === 'visible' && resumable && !ended && !ws) {
+    retries = 0;
+    connect();
+  }
+});
+
 startBtn.addEventListener('click', () => {
-  if (ws) { ws.close(); ws = null; }
+  if (WATCH) {
+    resetTerm();
+    connect();
+    return;
+  }
+  // Always a fresh game; a detached one expires on its own.
+  localStorage.removeItem(SESSION_KEY);
+  resumable = false;
+  seen = 0;
+  if (ws) { ws.onclose = null; ws.close(); ws = null; }
+  resetTerm();
   connect();
 });
+
+// Back from a reload or a closed tab: pick the game up where it was.
+if (WATCH || localStorage.getItem(SESSION_KEY)) connect();
 </script>
 </body>
 </html>
 """
 
+# The vendored xterm.js files, and the page linking to their fingerprinted
+# URLs; both compressed once here (see assets.py).
+STATIC = assets.Bundle()
+PAGE   = assets.Asset(STATIC.link(HTML).encode(), assets.TYPES[".html"])
+
+# /replay/<id>: plays a recording, and seeks by asking for the cast from the
+# nearest keyframe (recorder.seek) rather than replaying from the start.
+REPLAY_HTML = r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Replay — Dungeon of the Forgotten King</title>
+  <link rel="stylesheet" href="/static/xterm.css"/>
+  <style>
+    body {
+      background: #000;
+      color: #888;
+      font-family: "Courier New", monospace;
+      font-size: 12px;
+      margin: 0;
+      display: flex;
+      flex-direction: column;
+      height: 100dvh;
+    }
+    #terminal { flex: 1; padding: 10px; overflow: hidden; }
+    #bar {
+      display: flex;
+      gap: 12px;
+      align-items: center;
+      padding: 8px 16px;
+      border-top: 1px solid #1a1a1a;
+    }
+    #seek { flex: 1; }
+    button {
+      background: transparent;
+      color: #888;
+      border: 1px solid #333;
+      font: inherit;
+      padding: 4px 12px;
+      cursor: pointer;
+    }
+  </style>
+</head>
+<body>
+<div id="terminal"></div>
+<div id="bar">
+  <button id="play">❚❚</button>
+  <input id="seek" type="range" min="0" step="0.1" value="0">
+  <span id="clock">0:00 / 0:00</span>
+</div>
+<script src="/static/xterm.js"></script>
+<script type="module">
+const { Terminal } = window;
+
+const id      = location.pathname.split('/').pop();
+const playBtn = document.getElementById('play');
+const seekBar = document.getElementById('seek');
+const clock   = document.getElementById('clock');
+const term = new Terminal({
+  fontFamily: '"Cascadia Code", "Fira Code", "Courier New", monospace',
+  fontSize: 14,
+  lineHeight: 1.2,
+  theme: { background: '#000000', foreground: '#cccccc' },
+});
+term.open(document.getElementById('terminal'));
+
+const info = await (await fetch(`/replay/${id}.json`)).json();
+term.resize(info.header.width, info.header.height);
+seekBar.max = info.duration;
+
+// events: [time, kind, data] from the keyframe load() started at; `at` is
+// the recording time on screen and, while playing, now - origin.
+let events = [], next = 0, at = 0, origin = 0, playing = false, timer = null;
+
+const fmt = (t) => `${Math.floor(t / 60)}:${String(Math.floor(t % 60)).padStart(2, '0')}`;
+
+function show() {
+  seekBar.value = at;
+  clock.textContent = `${fmt(at)} / ${fmt(info.duration)}`;
+}
+
+function apply(t) {
+  let out = '';
+  while (next < events.length && events[next][0] <= t) {
+    const [, kind, data] = events[next++];
+    if (kind === 'o') {
+      out += data;
+    } else if (kind === 'r') {
+      term.write(out);
+      out = '';
+      const [cols, rows] = data.split('x').map(Number);
+      term.resize(cols, rows);
+    }
+  }
+  if (out) term.write(out);
+}
+
+async function load(t) {
+  const text = await (await fetch(`/replay/${id}.cast?t=${t}`)).text();
+  events = text.trim().split('\n').slice(1).map((line) => JSON.parse(line));
+  next = 0;
+  term.reset();
+  at = t;
+  apply(t);            // the keyframe and everything up to t, at once
+  show();
+}
+
+function tick() {
+  at = Math.min(info.duration, performance.now() / 1000 - origin);
+  apply(at);
+  show();
+  if (next >= events.length) return pause();
+  // Sleep until the next event, waking at least 4 times a second for the clock.
+  timer = setTimeout(tick, Math.min(250, Math.max(0, (events[next][0] - at) * 1000)));
+}
+
+function play() {
+  playing = true;
+  playBtn.textContent = '❚❚';
+  origin = performance.now() / 1000 - at;
+  clearTimeout(timer);
+  tick();
+}
+
+function pause() {
+  playing = false;
+  playBtn.textContent = '▶';
+  clearTimeout(timer);
+}
+
+playBtn.addEventListener('click', async () => {
+  if (playing) return pause();
+  if (next >= events.length) await load(0);
+  play();
+});
+
+seekBar.addEventListener('input', () => {
+  pause();
+  clock.textContent = `${fmt(Number(seekBar.value))} / ${fmt(info.duration)}`;
+});
+
+seekBar.addEventListener('change', async () => {
+  await load(Number(seekBar.value));
+  play();
+});
+
+await load(0);
+play();
+</script>
+</body>
+</html>
+"""
+REPLAY_PAGE = assets.Asset(STATIC.link(REPLAY_HTML).encode(), assets.TYPES[".html"])
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # PTY helpers
@@ -239,38 +777,31 @@ def set_winsize(fd, rows, cols):
     fcntl.ioctl(fd, termios.TIOCSWINSZ, s)
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Routes
-# ─────────────────────────────────────────────────────────────────────────────
-
-@app.route("/")
-def index():
-    return HTML
+ZYGOTE = Zygote() if SPAWN_MODE == "zygote" and HOSTING == "pty" else None
 
 
-@sock.route("/ws")
-def game_ws(ws):
+def spawn_game(cols=None, rows=None, restore=None):
     """
-    Spawn one game process per WebSocket connection.
-    Bridge: browser keystrokes → PTY stdin, PTY stdout → browser xterm.js.
-
-    Design: two daemon threads handle I/O; the main thread only monitors
-    termination.  ws_reader uses blocking ws.receive() (no timeout) so the
-    session never drops due to idle time between keystrokes.
+    Start one game process on a fresh PTY and return (proc, master_fd).
+    With no size given the game is started for the pool: the PTY defaults to
+    80x24 and COLUMNS/LINES are left unset so the real size can be applied
+    with resize_game() once a browser attaches.  restore is a snapshot path
+    to resume a hibernated game from instead of the title screen.
     """
+    if ZYGOTE:
+        return ZYGOTE.spawn(cols, rows, restore)
     master_fd, slave_fd = pty.openpty()
-
-    # Wait for the browser's first resize before starting the game so the
-    # subprocess sees the real terminal dimensions from the very first render.
-    cols, rows = 80, 24
-    try:
-        first = ws.receive(timeout=3)
-        if first and first.startswith("\x00RESIZE:"):
-            _, c, r = first.split(":")
-            cols, rows = int(c), int(r)
-    except Exception:
-        pass  # use defaults if no resize arrives in time
-    set_winsize(master_fd, rows, cols)
+    env = {
+        **os.environ,
+        "PYTHONUNBUFFERED": "1",
+        "TERM": "xterm-256color",
+    }
+    if cols and rows:
+        env["COLUMNS"] = str(cols)
+        env["LINES"] = str(rows)
+    if restore:
+        env["DUNGEON_RESTORE"] = restore
+    set_winsize(master_fd, rows or 24, cols or 80)
 
     proc = subprocess.Popen(
         ["python3", "-u", str(GAME_PATH)],
@@ -278,84 +809,1575 @@ def game_ws(ws):
         stdout=slave_fd,
         stderr=slave_fd,
         close_fds=True,
-        env={
-            **os.environ,
-            "PYTHONUNBUFFERED": "1",
-            "TERM": "xterm-256color",
-            "COLUMNS": str(cols),
-            "LINES": str(rows),
-        },
+        env=env,
     )
     os.close(slave_fd)
+    return proc, master_fd
+
+
+def resize_game(proc, master_fd, rows, cols):
+    """Apply a new window size and tell the game about it."""
+    set_winsize(master_fd, rows, cols)
+    try:
+        proc.send_signal(signal.SIGWINCH)
+    except ProcessLookupError:
+        pass
+
+
+def proc_memory(pid):
+    """
+    RSS of one process split into the part only it owns and the part shared
+    with others (zygote siblings, libraries), in kB, from smaps_rollup.
+    """
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if rest.strip().endswith("kB"):
+                    fields[key] = int(rest.split()[0])
+    except OSError:
+        return None
+    return {
+        "rss_kb":    fields.get("Rss", 0),
+        "pss_kb":    fields.get("Pss", 0),
+        "unique_kb": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        "shared_kb": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+    }
+
+
+def mem_available_kb():
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def stop_game(proc, master_fd):
+    proc.terminate()
+    try:
+        proc.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    try:
+        os.close(master_fd)
+    except OSError:
+        pass
+
+
+def proc_cpu_seconds(pid):
+    """User + system CPU seconds a process has used so far."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Metrics (served at /metrics)
+# ─────────────────────────────────────────────────────────────────────────────
+
+SPAWN_SECONDS = metrics.Histogram(
+    "dungeon_spawn_seconds", "Time to get a game for a new session.", ["source"])
+FIRST_OUTPUT_SECONDS = metrics.Histogram(
+    "dungeon_first_output_seconds", "Connect to first game output sent.", ["source"])
+WS_MESSAGES = metrics.Counter(
+    "dungeon_ws_messages_total", "WebSocket messages, by direction.", ["direction"])
+WS_BYTES = metrics.Counter(
+    "dungeon_ws_bytes_total", "WebSocket payload bytes, by direction.", ["direction"])
+RESIZES = metrics.Counter(
+    "dungeon_resizes_total", "RESIZE messages from browsers.")
+CONNECTION_ENDS = metrics.Counter(
+    "dungeon_connection_ends_total",
+    "Why WebSocket connections ended: game_exit, client_close, dead_peer, error or takeover.",
+    ["reason"])
+SESSION_ENDS = metrics.Counter(
+    "dungeon_session_ends_total",
+    "Why games ended: game_exit, disconnect, expired or evicted.", ["reason"])
+STATIC_RESPONSES = metrics.Counter(
+    "dungeon_static_responses_total",
+    "Page and asset responses by status (200 or 304) and content coding.",
+    ["status", "encoding"])
+
+
+def _sent(data):
+    WS_MESSAGES.inc(1, "out")
+    WS_BYTES.inc(len(data), "out")
+
+
+def _received(data):
+    WS_MESSAGES.inc(1, "in")
+    WS_BYTES.inc(len(data), "in")
+
+
+def _keepalive(ws, ping, kind):
+    """Register ws with the keepalive; ping() gets a ping onto the socket."""
+    def answered():
+        # simple_websocket's reader thread sets this on every pong.
+        answered, ws.pong_received = ws.pong_received, False
+        return answered
+
+    def reap():
+        DEAD_PEERS.inc(1, kind)
+        try:
+            # Wakes the connection's reader, and any send stuck on a full socket.
+            ws.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    return KEEPALIVE.add(ping, answered, reap)
+
+
+def _child_stats():
+    """(pid, state, memory, cpu) for every game process, attached or pooled."""
+    detached = {s.proc.pid for s in list(SESSIONS.values()) if s.ws is None}
+    for pid in list(GAMES) + (POOL.pids() if POOL else []):
+        state = ("pooled" if pid not in GAMES else
+                 "detached" if pid in detached else "attached")
+        yield pid, state, proc_memory(pid), proc_cpu_seconds(pid)
+
+
+def _session_counts():
+    sessions   = list(SESSIONS.values())
+    hibernated = sum(1 for s in sessions if s.snapshot)
+    detached   = sum(1 for s in sessions if s.ws is None and not s.snapshot)
+    return {("attached",): len(sessions) - detached - hibernated,
+            ("detached",): detached, ("hibernated",): hibernated,
+            ("inproc",): len(INPROC), ("pooled",): POOL.idle() if POOL else 0}
+
+
+def _self_status():
+    with open("/proc/self/status") as f:
+        fields = dict(line.split(":", 1) for line in f)
+    return {"rss": int(fields["VmRSS"].split()[0]) * 1024,
+            "threads": int(fields["Threads"])}
+
+
+metrics.Gauge("dungeon_sessions", "Games by state.", ["state"],
+              collect=_session_counts)
+metrics.Gauge("dungeon_child_rss_bytes", "Resident memory of each game process.",
+              ["pid", "state"],
+              collect=lambda: {(pid, state): mem["rss_kb"] * 1024
+                               for pid, state, mem, _ in _child_stats() if mem})
+metrics.Gauge("dungeon_child_unique_bytes",
+              "Memory only this game process uses (what one more player costs).",
+              ["pid", "state"],
+              collect=lambda: {(pid, state): mem["unique_kb"] * 1024
+                               for pid, state, mem, _ in _child_stats() if mem})
+metrics.Counter("dungeon_child_cpu_seconds_total", "CPU time of each game process.",
+                ["pid", "state"],
+                collect=lambda: {(pid, state): cpu
+                                 for pid, state, _, cpu in _child_stats() if cpu is not None})
+metrics.Counter("dungeon_pty_reads_total", "Reads from game PTYs.",
+                collect=lambda: {(): HUB.reads})
+metrics.Counter("dungeon_pty_bytes_total", "Bytes read from game PTYs.",
+                collect=lambda: {(): HUB.bytes})
+metrics.Counter("dungeon_resumes_total", "Reconnects by result: resumed or missed.",
+                ["result"],
+                collect=lambda: {("resumed",): RESUMES["resumed"],
+                                 ("missed",): RESUMES["missed"]})
+metrics.Counter("dungeon_hibernations_total",
+                "Games saved to disk and stopped, and restored from disk.", ["event"],
+                collect=lambda: {("saved",): HIBERNATION["saved"],
+                                 ("restored",): HIBERNATION["restored"]})
+SNAPSHOT_BYTES = metrics.Histogram(
+    "dungeon_snapshot_bytes", "Size of hibernation snapshots.",
+    buckets=(2048, 4096, 8192, 16384, 32768, 65536, 131072))
+OUTPUT_BACKLOG = metrics.Histogram(
+    "dungeon_output_backlog_bytes", "Bytes queued for a socket when its sender took them.",
+    buckets=(256, 1024, 4096, 16384, 65536, 262144))
+OUTPUT_COLLAPSES = metrics.Counter(
+    "dungeon_output_collapses_total",
+    "Socket queues over DUNGEON_OUTPUT_QUEUE cut to their last clear or a repaint.",
+    ["kind"])
+OUTPUT_DROPPED_BYTES = metrics.Counter(
+    "dungeon_output_dropped_bytes_total", "Output never sent because its queue collapsed.")
+metrics.Gauge("dungeon_output_queued_bytes", "Output waiting for slow sockets.",
+              collect=lambda: {(): sum(s.queued for s in list(SESSIONS.values()))})
+DEAD_PEERS = metrics.Counter(
+    "dungeon_dead_peers_total",
+    "Connections closed for leaving DUNGEON_PING_MISSES pings unanswered.", ["kind"])
+metrics.Counter("dungeon_keepalive_pings_total", "Keepalive pings, sent and unanswered.",
+                ["result"],
+                collect=lambda: {("sent",): KEEPALIVE.pings,
+                                 ("missed",): KEEPALIVE.missed})
+metrics.Gauge("dungeon_watchers", "Spectators connected to /watch.",
+              collect=lambda: {(): FANOUT.watchers()})
+metrics.Counter("dungeon_fanout_bytes_total",
+                "Spectator output: framed once (published), and sent to watchers.",
+                ["stage"],
+                collect=lambda: {("published",): FANOUT.bytes, ("sent",): FANOUT.sent})
+metrics.Counter("dungeon_fanout_resyncs_total",
+                "Spectators that fell behind and were sent a repaint instead.",
+                collect=lambda: {(): FANOUT.resyncs})
+ADMIT_WAIT_SECONDS = metrics.Histogram(
+    "dungeon_admission_wait_seconds", "Time new games queued before they could start.",
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300))
+metrics.Counter("dungeon_admissions_total",
+                "New games by admission result: admitted, queued (then admitted or "
+                "not), rejected_ip, rejected_full or abandoned.", ["result"],
+                collect=lambda: {(k,): v for k, v in ADMISSION.results.items()}
+                if ADMISSION else {})
+metrics.Gauge("dungeon_admission_waiting", "Connections queued for a game.",
+              collect=lambda: {(): len(ADMISSION._waiting)} if ADMISSION else {})
+metrics.Gauge("dungeon_admission_budget_games",
+              "Games that fit in memory now, including those running.",
+              collect=lambda: {(): ADMISSION.budget()}
+              if ADMISSION and ADMISSION.budget() is not None else {})
+metrics.Gauge("dungeon_admission_game_bytes",
+              "Memory one more game is expected to take (measured unique memory).",
+              collect=lambda: {(): ADMISSION.cost()} if ADMISSION else {})
+metrics.Gauge("dungeon_mem_available_bytes", "Memory the machine or cgroup can still give.",
+              collect=lambda: {(): admission.mem_available()}
+              if admission.mem_available() is not None else {})
+metrics.Gauge("dungeon_admission_limit", "Configured admission limits (0 is off).",
+              ["limit"],
+              collect=lambda: {("max_games",): MAX_GAMES,
+                               ("reserve_bytes",): MEM_RESERVE,
+                               ("ip_sessions",): IP_SESSIONS,
+                               ("spawn_rate",): SPAWN_RATE,
+                               ("ip_spawn_rate_per_min",): IP_SPAWN_RATE,
+                               ("queue",): ADMIT_QUEUE} if ADMISSION else {})
+RESTORE_SECONDS = metrics.Histogram(
+    "dungeon_restore_seconds",
+    "From the keystroke that wakes a hibernated game to its first output.")
+metrics.Gauge("process_resident_memory_bytes", "Resident memory of the server.",
+              collect=lambda: {(): _self_status()["rss"]})
+metrics.Gauge("process_threads", "Threads in the server process.",
+              collect=lambda: {(): _self_status()["threads"]})
+metrics.Counter("process_cpu_seconds_total", "CPU time of the server process.",
+                collect=lambda: {(): proc_cpu_seconds("self")})
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Warm pool
+# ─────────────────────────────────────────────────────────────────────────────
+
+class WarmPool:
+    """
+    Idle game processes already sitting at the title screen on their own PTY.
+
+    acquire() hands one out instantly (a hit) or returns None (a miss) so the
+    caller can cold-start instead.  Either way the refill thread is woken to
+    top the pool back up in the background, off the request path.
+    """
+
+    def __init__(self, size):
+        self.size   = size
+        self.hits   = 0
+        self.misses = 0
+        self._idle  = collections.deque()
+        self._lock  = threading.Lock()
+        self._wake  = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._refill, daemon=True).start()
+        self._wake.set()
+
+    def acquire(self):
+        with self._lock:
+            while self._idle:
+                proc, master_fd = self._idle.popleft()
+                if proc.poll() is None:
+                    self.hits += 1
+                    self._wake.set()
+                    return proc, master_fd
+                stop_game(proc, master_fd)
+            self.misses += 1
+        self._wake.set()
+        return None
+
+    def idle(self):
+        return len(self._idle)
+
+    def pids(self):
+        return [proc.pid for proc, _ in list(self._idle)]
+
+    def shutdown(self):
+        with self._lock:
+            while self._idle:
+                stop_game(*self._idle.popleft())
+
+    def _refill(self):
+        while True:
+            # Also wake periodically so a pooled game that died is replaced.
+            self._wake.wait(timeout=5)
+            self._wake.clear()
+            with self._lock:
+                for proc, master_fd in list(self._idle):
+                    if proc.poll() is not None:
+                        self._idle.remove((proc, master_fd))
+                        stop_game(proc, master_fd)
+            while len(self._idle) < self.size:
+                try:
+                    game = spawn_game()
+                except OSError:
+                    break   # out of PTYs or processes; try again later
+                with self._lock:
+                    self._idle.append(game)
+
+
+POOL = WarmPool(POOL_SIZE) if POOL_SIZE > 0 and HOSTING == "pty" else None
+
+
+class _Timing:
+    """Running time-to-first-byte figures for /stats (and /metrics)."""
+
+    def __init__(self, source):
+        self.source = source
+        self.count = 0
+        self.total = 0.0
+        self.last  = 0.0
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.last   = seconds
+        FIRST_OUTPUT_SECONDS.observe(seconds, self.source)
+
+    def as_dict(self):
+        avg = self.total / self.count if self.count else 0.0
+        return {"count": self.count,
+                "avg_ms": round(avg * 1000, 2),
+                "last_ms": round(self.last * 1000, 2)}
+
+
+TTFB = {source: _Timing(source) for source in ("warm", "cold", "inproc")}
+
+# pid → proc for every game a browser is playing, attached or detached.
+GAMES = {}
+
+# The one thread that reads every attached game's PTY.
+HUB = IOHub(window=COALESCE_MS / 1000, max_bytes=COALESCE_BYTES)
 
-    stop = threading.Event()
+# Sends every game's output to its spectators (/watch/<id>).
+FANOUT = fanout.Fanout()
 
-    def pty_reader():
-        """Read PTY output and forward to the browser."""
-        while not stop.is_set():
+# Pings every WebSocket and closes the ones whose browser is gone.
+KEEPALIVE = keepalive.Keepalive(PING_INTERVAL, PING_MISSES)
+
+# Lets new games start, or queues them, by memory and per-address limits.
+ADMISSION = admission.Admission(
+    games=lambda: len(GAMES) + len(INPROC),
+    costs=lambda: [m["unique_kb"] * 1024 for m in map(proc_memory, list(GAMES)) if m],
+    max_games=MAX_GAMES, reserve=MEM_RESERVE, session_bytes=SESSION_BYTES,
+    per_ip=IP_SESSIONS, rate=SPAWN_RATE, ip_rate=IP_SPAWN_RATE,
+    queue_max=ADMIT_QUEUE) if ADMIT else None
+
+# Writes recordings off the hub thread (see recorder.py).
+RECORDER = recorder.Recorder(RECORD_DIR, RECORD_ROTATE) if RECORD else None
+
+
+def memory_report():
+    """Unique vs shared memory per game, and what that means for capacity."""
+    sessions = []
+    detached = {s.proc.pid for s in list(SESSIONS.values()) if s.ws is None}
+    for pid in list(GAMES) + (POOL.pids() if POOL else []):
+        state = ("pooled" if pid not in GAMES else
+                 "detached" if pid in detached else "attached")
+        mem = proc_memory(pid)
+        if mem:
+            sessions.append({"pid": pid, "state": state, **mem})
+    report = {"spawn": SPAWN_MODE, "sessions": sessions}
+    if sessions:
+        avg_unique = sum(s["unique_kb"] for s in sessions) / len(sessions)
+        avg_rss    = sum(s["rss_kb"] for s in sessions) / len(sessions)
+        report["avg_unique_kb"] = round(avg_unique)
+        report["avg_rss_kb"]    = round(avg_rss)
+        available = mem_available_kb()
+        if available is not None and avg_unique:
+            # Each extra player costs its unique pages; shared ones are paid.
+            report["mem_available_kb"] = available
+            report["more_players_fit"] = int(available // avg_unique)
+    return report
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Compression
+# ─────────────────────────────────────────────────────────────────────────────
+#
+# Flask-Sock accepts permessage-deflate whenever the browser offers it, with
+# context takeover: every message is compressed against the previous 32 kB
+# the connection sent.  RFC 7692 has no preset dictionaries (a browser's
+# inflater cannot be handed one), so the dictionary is delivered by priming
+# instead: it is the first message on the connection, compressed like any
+# other, and the page drops messages that start with NUL.
+
+def deflate_dictionary(limit=32 * 1024):
+    """
+    Text that recurs on the wire, as the PTY emits it (CRLF line ends).
+    Deflate only reaches back 32 kB and matches near the end are cheapest,
+    so the commonest pieces go last: prose, then room art, the map, and
+    the colour codes, prompt and rule lines shown on every screen.
+    """
+    tree  = ast.parse(GAME_PATH.read_text(encoding="utf-8"))
+    prose = sorted({node.value for node in ast.walk(tree)
+                    if isinstance(node, ast.Constant) and isinstance(node.value, str)
+                    and len(node.value) >= 24})
+    art   = [dungeon_ascii_art.render_room_art(rid)
+             for rid in sorted(dungeon_ascii_art.ROOM_ART, reverse=True)]
+    C     = dungeon_game.C
+    codes = [v for k, v in vars(C).items() if k.isupper()]
+    chrome = codes + [dungeon_game.hr(), dungeon_game.colored("  > ", C.CYAN)]
+    text  = "\n".join(prose + art + [dungeon_game.MAP_ART] + chrome)
+    data  = text.replace("\r\n", "\n").replace("\n", "\r\n").encode()
+    return data[-limit:].decode("utf-8", "ignore")
+
+
+PRIME = "\x00PRIME\n" + deflate_dictionary() if DEFLATE_PRIME else None
+
+DEFLATE = {"negotiated": 0, "primed": 0}
+
+
+def offers_deflate(extensions):
+    """Whether a Sec-WebSocket-Extensions header offers permessage-deflate."""
+    return any(ext.split(";")[0].strip() == "permessage-deflate"
+               for ext in extensions.split(","))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Resumable sessions
+# ─────────────────────────────────────────────────────────────────────────────
+
+# dungeon_game.clear(): output before it is of no use to a page behind on it.
+HOME, CLEAR = b"\x1b[H", b"\x1b[2J"
+
+
+class Session:
+    """
+    One game and the WebSocket currently showing it, if any.
+
+    Output passes through a ring buffer indexed by its offset in the stream
+    (UTF-8 bytes as sent, or raw bytes in binary mode).  The page counts the
+    same bytes, so on reconnect it says how far it got and is sent only the
+    rest.  Control messages to the page start with NUL and are not counted.
+
+    A vterm.Screen follows the output too.  When the page has fallen out of
+    the ring, or the bytes it missed outweigh a repaint, it gets the
+    screen's repaint instead of a replay.
+
+    A game left idle at its room prompt can hibernate: it saves itself and
+    exits, and the session keeps its ring, screen and socket with no process
+    behind them until the next keystroke starts one on the snapshot.
+
+    Nothing is sent on the hub thread: output is queued for the socket and
+    the connection's request thread sends it (pump()), so a slow client
+    only ever delays itself.  A queue past OUTPUT_QUEUE bytes collapses to
+    the latest full screen, and the page is told where the stream resumes.
+
+    Spectators watch through a fanout.Channel, made when the first one
+    arrives: from then on each chunk of output is framed once for all of
+    them, and a newcomer starts from a repaint.
+    """
+
+    def __init__(self, proc, master_fd, binary, timing, started, cols=80, rows=24,
+                 window=None):
+        self.token     = secrets.token_urlsafe(16)
+        if WORKER_ID is not None:
+            self.token = f"{WORKER_ID}.{self.token}"    # routes reconnects here
+        self.watch_id  = secrets.token_urlsafe(6)       # public: for spectators
+        if WORKER_ID is not None:
+            self.watch_id = f"{WORKER_ID}.{self.watch_id}"
+        self.channel   = None       # spectators' fanout.Channel, once there are any
+        self.recording = RECORDER.record(secrets.token_hex(8), cols, rows) if RECORDER else None
+        self.proc      = proc
+        self.master_fd = master_fd
+        self.binary    = binary
+        self.decoder   = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.screen    = vterm.Screen(cols, rows)
+        self.ring      = bytearray()
+        self.end       = 0          # stream offset just past the ring
+        self.ws        = None
+        self.gone      = None       # set when the current socket should let go
+        self.queue     = []         # (stream offset or None for control, message)
+        self.queued    = 0          # bytes in queue
+        self.detached  = time.monotonic()
+        self.ended     = False
+        self.timing    = timing
+        self.started   = started
+        self.window    = window     # the hub's coalescing window for this game
+        self.lock      = threading.Lock()
+        self.wakeup    = threading.Condition(self.lock)   # queue or gone changed
+        self.ping_due  = False      # the keepalive wants a ping sent
+        self.last_input = time.monotonic()
+        self.asked     = None       # wall time the game was last asked to hibernate
+        self.parked    = threading.Event()   # set when an asked game saved or went on
+        self.snapshot  = None       # snapshot path while hibernated
+        self.woken     = None       # when a restore began, until its first output
+        self.redrawn   = threading.Event()   # set by a restored game's first output
+        self.last_output = 0.0
+        self.wake_lock = threading.Lock()
+        self.input_lock = threading.Lock()   # master_fd for writers; before lock
+        self.held      = []         # keys waiting for an ask's answer or a restore
+        self.line      = b""        # keys the game got since its last newline
+
+    @property
+    def start(self):
+        return self.end - len(self.ring)
+
+    def _queue(self, msg, offset=None):
+        """Queue stream bytes at offset, or a control message; lock held."""
+        self.queue.append((offset, msg))
+        self.queued += len(msg)
+        if self.queued > OUTPUT["peak_bytes"]:
+            OUTPUT["peak_bytes"] = self.queued
+        if offset is not None and self.queued > OUTPUT_QUEUE:
+            self._collapse()
+        self.wakeup.notify()
+
+    def _collapse(self):
+        """
+        The socket is OUTPUT_QUEUE bytes behind: replace the queue with what
+        follows its last clear, or with a repaint of the screen when there
+        is no clear or too much follows it.  Control messages in what goes
+        are kept, but for the SESSION and SCREEN ones this supersedes.
+        Lock held.
+        """
+        before, keep, cut = self.queued, None, len(self.queue)
+        for i in range(len(self.queue) - 1, -1, -1):
+            offset, msg = self.queue[i]
+            at = msg.rfind(CLEAR) if offset is not None else -1
+            if at >= 0:
+                if msg.endswith(HOME, 0, at):
+                    at -= len(HOME)
+                keep = [(offset + at, msg[at:])] + self.queue[i + 1:]
+                if sum(len(m) for _, m in keep) > OUTPUT_QUEUE:
+                    keep = None
+                else:
+                    cut = i
+                break
+        control = [(offset, msg) for offset, msg in self.queue[:cut] if offset is None
+                   and not msg.startswith(("\x00SESSION:", "\x00SCREEN:"))]
+        if keep is not None:
+            seen = keep[0][0]
+            OUTPUT_COLLAPSES.inc(1, "clear")
+        else:
+            seen = max(self.start, self.end - len(self.screen.pending.encode("utf-8")))
+            paint = self.screen.repaint()
+            keep = [(None, "\x00SCREEN:" + paint)]
+            if self.end > seen:
+                keep.append((seen, bytes(self.ring[seen - self.start:])))
+            OUTPUT_COLLAPSES.inc(1, "repaint")
+            REPAINTS["sent"] += 1
+            REPAINTS["bytes"] += len(paint)
+        keep[:0] = control
+        if RESUME_GRACE > 0:
+            keep.insert(0, (None, f"\x00SESSION:{self.token}:{seen}"))
+        self.queue  = keep
+        self.queued = sum(len(m) for _, m in keep)
+        OUTPUT_DROPPED_BYTES.inc(max(0, before - self.queued))
+
+    def pump(self, ws, gone):
+        """
+        Request thread: send ws what is queued for it until gone is set, or
+        until the game's END has gone out.
+        """
+        while True:
+            with self.lock:
+                while not self.queue and not self.ping_due and not gone.is_set():
+                    self.wakeup.wait()
+                if gone.is_set():
+                    return
+                batch, depth = self.queue, self.queued
+                self.queue, self.queued = [], 0
+                ping, self.ping_due = self.ping_due, False
+            if ping:
+                try:
+                    ws.sock.sendall(keepalive.PING)
+                except OSError:
+                    gone.set()
+                    return
+            if not batch:
+                continue
+            OUTPUT_BACKLOG.observe(depth)
+            # Stream bytes queued back to back go out as one message.
+            messages = []
+            for offset, msg in batch:
+                if offset is not None and messages and messages[-1][0] is not None:
+                    messages[-1][1] += msg
+                else:
+                    messages.append([offset, msg if offset is None else bytearray(msg)])
+            for offset, msg in messages:
+                try:
+                    if offset is None:
+                        ws.send(msg)
+                    else:
+                        ws.send(bytes(msg) if self.binary else msg.decode("utf-8"))
+                except Exception:
+                    gone.set()
+                    return
+                if msg == "\x00END":
+                    gone.set()
+                    return
+                if offset is not None or msg.startswith("\x00SCREEN:"):
+                    _sent(msg)
+                if offset is not None:
+                    if self.timing:
+                        self.timing.add(time.monotonic() - self.started)
+                        self.timing = None
+
+    def ping(self):
+        """Keepalive thread: have pump() send the socket a ping."""
+        with self.lock:
+            self.ping_due = True
+            self.wakeup.notify_all()
+
+    def let_go(self, gone):
+        """The socket gone belongs to is finished with: stop its pump()."""
+        with self.lock:
+            gone.set()
+            self.wakeup.notify_all()
+
+    def output(self, data):
+        """Hub thread: buffer PTY output and forward it if someone watches."""
+        self.last_output = time.monotonic()
+        if self.asked is not None:
+            # Output after an ask: the game went on, it did not save.
+            self.asked = None
+            self.parked.set()
+        if b"\n" in data:
+            # The game moved on to a new line: keys before it, such as
+            # those that skipped its typing, are no part of the next one.
+            self.line = b""
+        if self.woken:
+            RESTORE_SECONDS.observe(self.last_output - self.woken)
+            HIBERNATION["restore_s"] += self.last_output - self.woken
+            self.woken = None
+            self.redrawn.set()
+        text = self.decoder.decode(data)
+        if not self.binary:
+            if not text:
+                return
+            data = text.encode("utf-8")
+        with self.lock:
+            self.screen.feed(text)
+            if self.channel and text:
+                FANOUT.publish(self.channel, text)
+            if self.recording and text:
+                # A clear starts a new screen: keyframe it for seeking.
+                # Screens sent as diffs do not clear, so every so often
+                # one is keyframed anyway.
+                key = CLEAR in data or self.recording.keyframe_due()
+                self.recording.output(text, self._screen_now() if key else None)
+            self.ring += data
+            self.end  += len(data)
+            excess = len(self.ring) - RESUME_BUFFER
+            if excess > 0:
+                # Keep the ring starting on a character boundary.
+                while not self.binary and excess < len(self.ring) \
+                        and 0x80 <= self.ring[excess] < 0xC0:
+                    excess += 1
+                del self.ring[:excess]
+            if self.ws:
+                self._queue(data, self.end - len(data))
+
+    def finish(self):
+        """Hub thread: the game exited, or hibernated when asked to."""
+        if self.asked is not None and self._park():
+            return
+        with self.lock:
+            self.ended = True
+            if self.ws:
+                self._queue("\x00END")
+
+    def attach(self, ws, seen):
+        """
+        Make ws this session's socket and queue what it has not seen.
+        Returns an Event that is set when ws should be let go.
+        """
+        with self.lock:
+            if self.gone:
+                self.gone.set()     # a stale socket still held it: take over
+                self.wakeup.notify_all()
+            self.ws, self.gone, self.detached = ws, threading.Event(), None
+            self.queue, self.queued = [], 0
+            paint = None
+            missed = self.end - seen if self.start <= seen <= self.end else None
+            if missed is None or missed > 4096:
+                paint = self.screen.repaint().encode("utf-8")
+                if missed is not None and missed <= len(paint):
+                    paint = None
+            if paint is not None:
+                # The stream resumes after the repaint, at the start of any
+                # escape sequence the screen is still waiting to complete.
+                seen = self.end - len(self.screen.pending.encode("utf-8"))
+            if RESUME_GRACE > 0:
+                self._queue(f"\x00SESSION:{self.token}:{seen}")
+            self._queue(f"\x00WATCH:{self.watch_id}")
+            if paint is not None:
+                self._queue("\x00SCREEN:" + paint.decode("utf-8"))
+                REPAINTS["sent"] += 1
+                REPAINTS["bytes"] += len(paint)
+            missed = bytes(self.ring[seen - self.start:])
+            if missed:
+                self._queue(missed, seen)
+            return self.gone
+
+    def watch(self, sock):
+        """Add a spectator on sock; returns its fanout.Watcher."""
+        with self.lock:
+            if self.channel is None:
+                self.channel = FANOUT.channel(self._watch_snapshot)
+            return FANOUT.add(self.channel, sock, ["\x00SCREEN:" + self._screen_now()],
+                              self.channel.end)
+
+    def _screen_now(self):
+        """The screen, and any escape sequence it is part-way into; lock held."""
+        return self.screen.repaint() + self.screen.pending
+
+    def _watch_snapshot(self):
+        with self.lock:
+            return ["\x00SCREEN:" + self._screen_now()], self.channel.end
+
+    def resize(self, cols, rows):
+        """The page's terminal changed size."""
+        with self.lock:
+            self.screen.resize(cols, rows)
+            if self.recording:
+                self.recording.resize(cols, rows)
+            proc, master_fd = self.proc, self.master_fd
+        if master_fd is not None:    # a hibernated game wakes at screen size
+            resize_game(proc, master_fd, rows, cols)
+
+    def write(self, data):
+        """
+        Keystrokes for the game.  While it is hibernated, or asked to and
+        has not answered, they are held and wake() passes them on from its
+        own thread, so the socket's receive loop never waits.
+        """
+        self.last_input = time.monotonic()
+        with self.input_lock:
+            if self.snapshot or self.held or self.asked is not None:
+                waking = not self.held      # else a wake() is on its way
+                self.held.append(data)
+            else:
+                os.write(self.master_fd, data)
+                self._typed(data)
+                return
+        if waking:
+            threading.Thread(target=self.wake, daemon=True).start()
+
+    def _typed(self, data):
+        """The game process was given data; input_lock held."""
+        newline = max(data.rfind(b"\r"), data.rfind(b"\n"))
+        self.line = data[newline + 1:] if newline >= 0 else (self.line + data)[-4096:]
+
+    # ── hibernation ─────────────────────────────────────────────────────────
+    def hibernate(self):
+        """Ask the game to save itself; it only does at its room prompt."""
+        with self.input_lock:
+            self.asked = time.time()
+            self.parked.clear()
+        try:
+            self.proc.send_signal(signal.SIGUSR1)
+        except ProcessLookupError:
+            pass
+
+    def _park(self):
+        """Hub thread: keep the session on the snapshot the game just left."""
+        saved = dungeon_game.snapshot_path(self.proc.pid, HIBERNATE_DIR)
+        try:
+            if os.stat(saved).st_mtime < self.asked - 1:
+                return False        # left by an earlier process with this pid
+            path = os.path.join(HIBERNATE_DIR, f"{secrets.token_hex(8)}.snap")
+            os.replace(saved, path)
+            size = os.stat(path).st_size
+        except OSError:
+            return False
+        with self.input_lock, self.lock:
+            proc, master_fd = self.proc, self.master_fd
+            self.snapshot, self.master_fd = path, None
+        GAMES.pop(proc.pid, None)
+        threading.Thread(target=stop_game, args=(proc, master_fd), daemon=True).start()
+        HIBERNATION["saved"] += 1
+        HIBERNATION["bytes"] += size
+        SNAPSHOT_BYTES.observe(size)
+        self.parked.set()           # a wake() waiting on it restores the game
+        return True
+
+    def wake(self):
+        """
+        Start a game process on the snapshot, if hibernated; the stream
+        carries on.  Then give it the keys held for it, after the line the
+        player was part-way through when it saved, which the old process
+        took with it.
+        """
+        with self.wake_lock:
+            if self.asked is not None:
+                # Just asked to hibernate: see whether it did before choosing
+                # which process these keys are for.
+                self.parked.wait(max(0.0, self.asked + 2 - time.time()))
+            line = b""
+            if self.snapshot:
+                line = self.line    # before the redraw moves it on
+                self._restore()
+            with self.input_lock:
+                held, self.held = line + b"".join(self.held), []
+                if held and self.master_fd is not None:
+                    os.write(self.master_fd, held)
+                    self._typed(held)
+
+    def _restore(self):
+        t0 = time.monotonic()
+        proc, master_fd = spawn_game(self.screen.cols, self.screen.rows, self.snapshot)
+        self.redrawn.clear()
+        with self.lock:
+            self.proc, self.master_fd = proc, master_fd
+            self.snapshot, self.asked, self.woken = None, None, t0
+            self.line = b""         # a new process: nothing typed to it yet
+        HIBERNATION["restored"] += 1
+        GAMES[proc.pid] = proc
+        HUB.add(master_fd, self.output, self.finish, window=self.window)
+        # Hold the keys until the room is redrawn and the game waits at
+        # its prompt again, so their echo follows the redraw.
+        if self.redrawn.wait(5):
+            while time.monotonic() - self.last_output < 0.05:
+                time.sleep(0.01)
+
+    def detach(self, ws):
+        """ws went away; keep the game if no newer socket took it over."""
+        with self.lock:
+            if self.ws is ws:
+                self.ws, self.detached = None, time.monotonic()
+                self.queue, self.queued = [], 0
+
+
+# resume token → Session for every PTY game a browser is playing.
+SESSIONS = {}
+RESUMES  = {"resumed": 0, "missed": 0, "expired": 0, "evicted": 0}
+REPAINTS = {"sent": 0, "bytes": 0}
+OUTPUT   = {"peak_bytes": 0}     # deepest any socket's queue has been
+HIBERNATION = {"saved": 0, "restored": 0, "bytes": 0, "restore_s": 0.0}
+
+
+def end_session(session, reason):
+    """Stop a session's game and forget it.  Safe to call more than once."""
+    if SESSIONS.pop(session.token, None) is None:
+        return
+    SESSION_ENDS.inc(1, reason)
+    if session.channel:
+        FANOUT.publish(session.channel, "\x00END")
+        FANOUT.close(session.channel)
+    if session.recording:
+        RECORDER.close(session.recording)
+    if session.snapshot:
+        try:
+            os.unlink(session.snapshot)
+        except OSError:
+            pass
+        return
+    HUB.remove(session.master_fd)
+    GAMES.pop(session.proc.pid, None)
+    stop_game(session.proc, session.master_fd)
+    if ADMISSION:
+        ADMISSION.wake()     # its memory is free: the line can move
+
+
+def reap_sessions():
+    """
+    End detached sessions past their grace period, games that exited while
+    detached, and the longest-detached ones beyond RESUME_MAX, or one more
+    while new games are queued for lack of room.
+    """
+    now = time.monotonic()
+    detached = sorted((s for s in list(SESSIONS.values()) if s.ws is None),
+                      key=lambda s: s.detached)
+    for i, s in enumerate(detached):
+        if s.ended:
+            end_session(s, "game_exit")
+        elif now - s.detached > RESUME_GRACE:
+            RESUMES["expired"] += 1
+            end_session(s, "expired")
+        elif len(detached) - i > RESUME_MAX:
+            RESUMES["evicted"] += 1
+            end_session(s, "evicted")
+    if ADMISSION and ADMISSION.blocked():
+        # Players are waiting for room a detached game is holding: a game
+        # someone is playing beats one that may never be resumed.
+        for s in detached:
+            if s.token in SESSIONS and not s.snapshot:
+                RESUMES["evicted"] += 1
+                end_session(s, "evicted")
+                break
+
+
+def hibernate_idle():
+    """
+    Ask games with no input for HIBERNATE_AFTER seconds to hibernate, and
+    ask again each HIBERNATE_AFTER while they are somewhere they cannot.
+    """
+    if HIBERNATE_AFTER <= 0:
+        return
+    now, wall = time.monotonic(), time.time()
+    for s in list(SESSIONS.values()):
+        if s.snapshot or s.ended or now - s.last_input < HIBERNATE_AFTER:
+            continue
+        if s.asked is None or wall - s.asked >= HIBERNATE_AFTER:
+            s.hibernate()
+
+
+def prepare_hibernate_dir():
+    """
+    Create the snapshot directory and drop snapshots no session owns.  A
+    directory someone else owns or can write to turns hibernation off.
+    """
+    global HIBERNATE_AFTER
+    try:
+        dungeon_game.private_dir(HIBERNATE_DIR)
+    except OSError as e:
+        print(f"  Hibernation off: {e}", file=sys.stderr)
+        HIBERNATE_AFTER = 0
+        return
+    for path in Path(HIBERNATE_DIR).glob("*.snap*"):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _reaper():
+    while True:
+        time.sleep(5)
+        reap_sessions()
+        hibernate_idle()
+
+
+def session_report():
+    """Attached/detached counts and what detached games cost."""
+    sessions = list(SESSIONS.values())
+    detached = [s for s in sessions if s.ws is None]
+    mem = [proc_memory(s.proc.pid) for s in detached]
+    return {
+        "attached": len(sessions) - len(detached),
+        "detached": len(detached),
+        "max_detached": RESUME_MAX,
+        "grace_s": RESUME_GRACE,
+        "buffer_bytes": sum(len(s.ring) for s in sessions),
+        "detached_unique_kb": sum(m["unique_kb"] for m in mem if m),
+        **RESUMES,
+        "screens": screen_report(sessions),
+        "hibernation": hibernation_report(sessions),
+        "output": output_report(sessions),
+    }
+
+
+def output_report(sessions):
+    """Output waiting for slow sockets and what collapsing it saved."""
+    return {
+        "queue_limit_bytes": OUTPUT_QUEUE,
+        "queued_bytes": sum(s.queued for s in sessions),
+        "peak_bytes": OUTPUT["peak_bytes"],
+        "collapsed_to_clear": OUTPUT_COLLAPSES.values.get(("clear",), 0),
+        "collapsed_to_repaint": OUTPUT_COLLAPSES.values.get(("repaint",), 0),
+        "dropped_bytes": OUTPUT_DROPPED_BYTES.values.get((), 0),
+    }
+
+
+def hibernation_report(sessions):
+    """Hibernated games now, what their snapshots take, and restore cost."""
+    disk = 0
+    for s in sessions:
+        try:
+            disk += os.stat(s.snapshot).st_size if s.snapshot else 0
+        except OSError:
+            pass
+    saved, restored = HIBERNATION["saved"], HIBERNATION["restored"]
+    return {
+        "after_s": HIBERNATE_AFTER,
+        "hibernated": sum(1 for s in sessions if s.snapshot),
+        "disk_bytes": disk,
+        "saved": saved,
+        "restored": restored,
+        "avg_snapshot_bytes": round(HIBERNATION["bytes"] / saved) if saved else 0,
+        "avg_restore_ms": round(HIBERNATION["restore_s"] * 1000 / restored, 1)
+                          if restored else 0.0,
+    }
+
+
+def screen_report(sessions):
+    """Memory and parse cost of the sessions' screen models."""
+    fed     = sum(s.screen.fed for s in sessions)
+    parse_s = sum(s.screen.parse_s for s in sessions)
+    return {
+        "memory_kb": round(sum(s.screen.memory_bytes() for s in sessions) / 1024, 1),
+        "parsed_kchars": round(fed / 1000, 1),
+        "parse_ms": round(parse_s * 1000, 1),
+        "us_per_kchar": round(parse_s * 1e6 / fed * 1000, 1) if fed else 0.0,
+        "repaints": REPAINTS["sent"],
+        "repaint_bytes": REPAINTS["bytes"],
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# In-process hosting
+# ─────────────────────────────────────────────────────────────────────────────
+
+class Hangup(Exception):
+    """The browser went away; unwinds a game thread out of any prompt."""
+
+
+class WebConsole(dungeon_game.Console):
+    """
+    A game's console when it runs inside the server instead of on a PTY.
+    Does the PTY's job by hand: CRLF translation on output, and a cooked-mode
+    line discipline (echo, backspace, Enter, ^C) on keys fed by the bridge.
+    """
+
+    def __init__(self, send):
+        super().__init__()
+        self._send   = send
+        self._keys   = collections.deque()
+        self._ready  = threading.Condition()
+        self._closed = False
+        self.sent    = 0
+        self.size    = None        # the page's terminal, once it says
+        self.client_typing = CLIENT_TYPING
+        self.diff_screens = DIFF_SCREENS
+        self.alt_screen = True     # xterm.js
+
+    # ── bridge side ──────────────────────────────────────────────────────────
+    def feed(self, data):
+        with self._ready:
+            if data.startswith("\x1b"):
+                return   # arrow/function keys mean nothing at a line prompt
+            self._keys.extend(data)
+            self._ready.notify()
+
+    def hangup(self):
+        with self._ready:
+            self._closed = True
+            self._ready.notify_all()
+
+    # ── game side ────────────────────────────────────────────────────────────
+    def emit(self, text):
+        """Send one composed screen (see dungeon_game.Console) as one message."""
+        if self._closed:
+            raise Hangup()
+        try:
+            self._send(text.replace("\n", "\r\n"))
+        except Exception:
+            self.hangup()
+            raise Hangup()
+        self.sent += len(text)
+
+    def sleep(self, seconds):
+        self.flush()
+        with self._ready:
+            if self._ready.wait_for(lambda: self._closed, timeout=seconds):
+                raise Hangup()
+
+    def terminal_size(self):
+        return self.size
+
+    def keys(self):
+        return contextlib.nullcontext()   # feed() already hears every key
+
+    def own_echo(self):
+        return contextlib.nullcontext()   # readline() does the echo
+
+    def pressed(self, seconds):
+        self.flush()
+        with self._ready:
+            self._ready.wait_for(lambda: self._keys or self._closed, timeout=seconds)
+            if self._closed:
+                raise Hangup()
+            if not self._keys:
+                return False
+            keys, self._keys = "".join(self._keys), collections.deque()
+        if "\x03" in keys:
+            self.write("^C\n")
+            raise KeyboardInterrupt
+        return True
+
+    def readline(self, prompt=""):
+        self.skipping = False
+        self.write(prompt)
+        line = []
+        while True:
+            self.flush()             # the prompt, or the echo of the last key
+            with self._ready:
+                self._ready.wait_for(lambda: self._keys or self._closed)
+                if self._closed:
+                    raise Hangup()
+                ch = self._keys.popleft()
+            if ch in ("\r", "\n"):
+                self.write("\n")
+                return "".join(line)
+            if ch in ("\x7f", "\b"):
+                if line:
+                    line.pop()
+                    self.write("\b \b")
+            elif ch == "\x03":
+                self.write("^C\n")
+                raise KeyboardInterrupt
+            elif ch == "\x04" and not line:
+                raise EOFError
+            elif ch.isprintable():
+                line.append(ch)
+                self.write(ch)
+
+
+def run_inproc(console):
+    """Game thread body: play one full game on `console`."""
+    dungeon_game.use_console(console)
+    try:
+        dungeon_game.main()
+    except (Hangup, EOFError, SystemExit):
+        pass
+
+
+def host_inproc(ws):
+    """Bridge a browser to a Game running on a thread in this process."""
+    started = time.monotonic()
+    timing  = TTFB["inproc"]
+    first   = [True]
+
+    sending = threading.Lock()     # the game thread and the keepalive both write
+
+    def send(text):
+        with sending:
+            ws.send(text)
+        _sent(text)
+        if first[0]:
+            timing.add(time.monotonic() - started)
+            first[0] = False
+
+    def ping():
+        # Runs on the shared keepalive thread, so it must never wait: if the
+        # game thread is mid-send, or the socket is full, this ping is
+        # skipped and goes unanswered.  A peer stuck that way is reaped after
+        # PING_MISSES of them, and the shutdown frees the game's send too.
+        if not sending.acquire(blocking=False):
+            return
+        try:
+            if ws.sock.send(keepalive.PING, socket.MSG_DONTWAIT) < len(keepalive.PING):
+                ws.sock.shutdown(socket.SHUT_RDWR)     # half a frame: cannot go on
+        except BlockingIOError:
+            pass
+        finally:
+            sending.release()
+
+    console = WebConsole(send)
+    INPROC.add(console)
+    if ADMISSION:
+        ADMISSION.spawned()
+    peer = _keepalive(ws, ping, "inproc")
+
+    def game():
+        try:
+            run_inproc(console)
+        finally:
+            console.hangup()
             try:
-                r, _, _ = select.select([master_fd], [], [], 0.05)
-                if r:
-                    data = os.read(master_fd, 4096)
-                    ws.send(data.decode("utf-8", errors="replace"))
-            except OSError:
+                ws.close()   # unblocks the receive() below
+            except Exception:
+                pass
+
+    threading.Thread(target=game, daemon=True).start()
+    try:
+        while True:
+            data = ws.receive()
+            if data is None:
                 break
-        stop.set()
+            _received(data)
+            if data.startswith("\x00RESIZE:"):
+                RESIZES.inc()
+                _, c, r = data.split(":")
+                console.size = (int(c), int(r))
+            else:
+                console.feed(data)
+    except Exception:
+        pass   # genuine disconnect
+    finally:
+        KEEPALIVE.remove(peer)
+        console.hangup()
+        INPROC.discard(console)
+
+
+# WebConsoles of the games currently running in-process.
+INPROC = set()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Routes
+# ─────────────────────────────────────────────────────────────────────────────
+
+def send_asset(asset):
+    status, headers, body = assets.respond(asset, request.headers)
+    STATIC_RESPONSES.inc(1, status, headers.get("Content-Encoding", "identity"))
+    return Response(body, status=status, headers=headers)
+
+
+@app.route("/")
+def index():
+    return send_asset(PAGE)
+
+
+@app.route("/static/<name>")
+def static_asset(name):
+    asset = STATIC.get(name)
+    if asset is None:
+        return Response("Not Found", status=404, mimetype="text/plain")
+    return send_asset(asset)
+
+
+@app.route("/replay/<name>")
+def replay(name):
+    """
+    /replay/<id> is the player page; /replay/<id>.json the recording's
+    size, length and keyframe times; /replay/<id>.cast?t=<s> the cast from
+    the last keyframe at or before t.
+    """
+    rec_id, _, kind = name.partition(".")
+    if not RECORDER or not rec_id.isalnum():
+        return Response("Not Found", status=404, mimetype="text/plain")
+    if kind == "":
+        return send_asset(REPLAY_PAGE)
+    if kind == "json":
+        found = recorder.info(RECORD_DIR, rec_id)
+        return jsonify(found) if found else Response("Not Found", status=404)
+    if kind == "cast":
+        try:
+            start = float(request.args.get("t", "0"))
+        except ValueError:
+            start = 0.0
+        lines = list(recorder.seek(RECORD_DIR, rec_id, start))
+        if lines:
+            return Response("\n".join(lines) + "\n", mimetype="application/x-asciicast")
+    return Response("Not Found", status=404, mimetype="text/plain")
+
+
+@app.route("/healthz")
+def healthz():
+    """Liveness for the platform's health check: cheap, no page render."""
+    if not HUB.is_alive():
+        return Response("hub thread down\n", status=503, mimetype="text/plain")
+    return Response("ok\n", mimetype="text/plain")
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/stats")
+def stats():
+    pool = None
+    if POOL:
+        pool = {"size": POOL.size, "idle": POOL.idle(),
+                "hits": POOL.hits, "misses": POOL.misses}
+    return jsonify(hosting=HOSTING,
+                   worker=WORKER_ID,
+                   inproc_sessions=len(INPROC),
+                   hub=HUB.stats(),
+                   fanout=FANOUT.stats(),
+                   keepalive=KEEPALIVE.stats(),
+                   admission=ADMISSION.stats() if ADMISSION else None,
+                   recording=RECORDER.stats() if RECORDER else None,
+                   pool=pool,
+                   ttfb={k: v.as_dict() for k, v in TTFB.items()},
+                   deflate={**DEFLATE,
+                            "prime_bytes": len(PRIME.encode()) if PRIME else 0},
+                   sessions=session_report(),
+                   memory=memory_report())
+
+
+def client_ip():
+    """The address a request came from, for per-address limits."""
+    if TRUST_PROXY:
+        fly = request.headers.get("Fly-Client-IP", "").strip()
+        if fly:
+            return fly
+        hops = [h.strip() for h in request.headers.get("X-Forwarded-For", "").split(",")]
+        hops = [h for h in hops if h]
+        if hops:
+            return hops[-min(TRUST_PROXY, len(hops))]
+    return request.remote_addr or ""
+
+
+def admit(ws, ip):
+    """
+    Wait for room to start a new game, telling the page its place in line
+    ("\x00QUEUE:<place>:<waiting>", place 0 once it is in).  False if the
+    page was turned away ("\x00FULL:ip" or "\x00FULL:queue") or left.
+    """
+    if not ADMISSION:
+        return True
+    t0, queued = time.monotonic(), [False]
+
+    def notify(place, waiting):
+        queued[0] = True
+        try:
+            ws.send(f"\x00QUEUE:{place}:{waiting}")
+        except Exception:
+            pass             # gone: alive() will say so
+
+    result = ADMISSION.enter(ip, notify, lambda: ws.connected)
+    if result == "admitted":
+        if queued[0]:
+            ADMIT_WAIT_SECONDS.observe(time.monotonic() - t0)
+        return True
+    if result in ("ip", "full"):
+        try:
+            ws.send("\x00FULL:" + ("ip" if result == "ip" else "queue"))
+        except Exception:
+            pass
+    return False
+
+
+@sock.route("/ws")
+def game_ws(ws):
+    """
+    Attach one game process per WebSocket connection.
+    Bridge: browser keystrokes → PTY stdin, PTY stdout → browser xterm.js.
+
+    A warm process is taken from the pool when one is idle; its title screen
+    is already waiting in the PTY and the browser's RESIZE is applied when it
+    arrives.  Otherwise a game is cold-started as before.
+
+    Design: PTY output is read, and coalesced into frames, by the shared
+    I/O hub thread; one daemon thread per session handles keystrokes and
+    the request thread sends the output queued for it.  ws_reader uses blocking
+    ws.receive() (no timeout) so the session never drops due to idle time
+    between keystrokes; a browser that vanished without closing is found by
+    the keepalive's pings instead.
+
+    Sessions are resumable: the page is told a resume token, and when the
+    socket drops the game is only detached.  A later /ws?resume=<token>
+    &seen=<bytes> within RESUME_GRACE reattaches it and replays the output
+    the page missed from the session's ring buffer.
+    """
+    if offers_deflate(request.headers.get("Sec-WebSocket-Extensions", "")):
+        DEFLATE["negotiated"] += 1
+        if PRIME:
+            ws.send(PRIME)
+            DEFLATE["primed"] += 1
+
+    ip = client_ip()
+    if HOSTING == "inproc":
+        if not admit(ws, ip):
+            return
+        try:
+            return host_inproc(ws)
+        finally:
+            if ADMISSION:
+                ADMISSION.leave(ip)
+
+    session = SESSIONS.get(request.args.get("resume", ""))
+    if session and not session.ended:
+        started = time.monotonic()
+        RESUMES["resumed"] += 1
+        if ADMISSION:
+            ADMISSION.join(ip)
+        try:
+            seen = int(request.args.get("seen", "0"))
+        except ValueError:
+            seen = -1
+    else:
+        if request.args.get("resume"):
+            RESUMES["missed"] += 1   # expired, evicted, or another server's
+        if not admit(ws, ip):
+            return
+        started = time.monotonic()
+        try:
+            session = start_session(ws, started)
+        except BaseException:
+            if ADMISSION:
+                ADMISSION.leave(ip)
+            raise
+        finally:
+            if ADMISSION:
+                ADMISSION.spawned()
+        seen = 0
+    gone = session.attach(ws, seen)
+    peer = _keepalive(ws, session.ping, "game")
+    # Why this connection ends, unless the game exiting or a takeover
+    # explains it: a failed send leaves "error" in place.
+    why = ["error"]
 
     def ws_reader():
         """Read browser keystrokes and forward to PTY.
         Uses blocking receive() with no timeout — the session must never
         disconnect just because the player hasn't typed for a while."""
-        while not stop.is_set():
+        while not gone.is_set():
             try:
                 data = ws.receive()   # blocks until data or real close
                 if data is None:
+                    why[0] = "client_close"
                     break
+                _received(data)
                 if data.startswith("\x00RESIZE:"):
+                    RESIZES.inc()
                     _, c, r = data.split(":")
-                    set_winsize(master_fd, int(r), int(c))
+                    session.resize(int(c), int(r))
                 else:
-                    os.write(master_fd, data.encode())
+                    session.write(data.encode())
+            except ConnectionClosed:
+                why[0] = "client_close"
+                break
             except Exception:
-                break   # genuine disconnect or PTY gone
-        stop.set()
+                break   # broken socket or PTY gone
+        session.let_go(gone)
 
-    pty_thread = threading.Thread(target=pty_reader, daemon=True)
-    ws_thread  = threading.Thread(target=ws_reader,  daemon=True)
-    pty_thread.start()
+    ws_thread = threading.Thread(target=ws_reader, daemon=True)
     ws_thread.start()
 
     try:
-        # Block until the game exits or either I/O thread signals done.
-        # stop.wait() releases as soon as stop is set, so cleanup is prompt.
-        while not stop.is_set() and proc.poll() is None:
-            stop.wait(timeout=0.5)
+        # Send the game's output until it exits (the hub sees EOF on the
+        # PTY), the browser goes away or another socket resumes this
+        # session.  No timeout: an idle session costs no wakeups.
+        session.pump(ws, gone)
     finally:
-        stop.set()
-        proc.terminate()
-        try:
-            proc.wait(timeout=2)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-        try:
-            os.close(master_fd)
-        except OSError:
-            pass
+        KEEPALIVE.remove(peer)
+        if ADMISSION:
+            ADMISSION.leave(ip)
+        if peer.dead:
+            why[0] = "dead_peer"
+        if session.ended:
+            CONNECTION_ENDS.inc(1, "game_exit")
+            end_session(session, "game_exit")
+        elif session.ws is not ws:
+            CONNECTION_ENDS.inc(1, "takeover")
+        else:
+            CONNECTION_ENDS.inc(1, why[0])
+            if RESUME_GRACE > 0:
+                # Keep the game for a reconnect; the reaper ends it after
+                # RESUME_GRACE or when too many are detached.
+                session.detach(ws)
+                if sum(1 for s in list(SESSIONS.values()) if s.ws is None) > RESUME_MAX:
+                    reap_sessions()
+            else:
+                end_session(session, "disconnect")
         # Returning from game_ws() causes flask-sock to close the WebSocket,
         # which unblocks ws_reader's ws.receive() so that thread also exits.
 
 
+@sock.route("/watch/<watch_id>")
+def watch_ws(ws, watch_id):
+    """
+    A read-only view of a running game (the player's page is told its
+    watch id).  The spectator gets a repaint of the current screen, then
+    the game's output as it happens, sent by the fan-out thread straight
+    to the socket; this thread only reads, to notice the close.
+    """
+    session = next((s for s in list(SESSIONS.values()) if s.watch_id == watch_id), None)
+    if session is None or session.ended:
+        ws.send("\x00END")
+        return
+    watcher = session.watch(ws.sock)
+    peer = _keepalive(ws, lambda: FANOUT.ping(watcher), "watch")
+    try:
+        while not watcher.done.is_set():
+            data = ws.receive()     # spectators' keys and resizes go nowhere
+            if data is not None:
+                _received(data)
+    except ConnectionClosed:
+        pass
+    finally:
+        KEEPALIVE.remove(peer)
+        FANOUT.remove(watcher)
+
+
+def start_session(ws, started):
+    """Take a warm game or cold-start one and register it as a Session."""
+    t0   = time.monotonic()
+    warm = POOL.acquire() if POOL else None
+    cols, rows = 80, 24     # warm games start at 80x24 until the RESIZE
+
+    if warm:
+        proc, master_fd = warm
+        timing = TTFB["warm"]
+        SPAWN_SECONDS.observe(time.monotonic() - t0, "warm")
+    else:
+        # Wait for the browser's first resize before starting the game so the
+        # subprocess sees the real terminal dimensions from the very first
+        # render.
+        try:
+            first = ws.receive(timeout=3)
+            if first and first.startswith("\x00RESIZE:"):
+                _received(first)
+                RESIZES.inc()
+                _, c, r = first.split(":")
+                cols, rows = int(c), int(r)
+        except Exception:
+            pass  # use defaults if no resize arrives in time
+        t0 = time.monotonic()
+        proc, master_fd = spawn_game(cols, rows)
+        timing = TTFB["cold"]
+        SPAWN_SECONDS.observe(time.monotonic() - t0, "cold")
+
+    binary  = request.args.get("frames", FRAMES) == "binary"
+    # ?coalesce=0 opts a connection out, e.g. for keystroke latency tests.
+    window  = 0 if request.args.get("coalesce") == "0" else None
+    session = Session(proc, master_fd, binary, timing, started, cols, rows, window)
+    SESSIONS[session.token] = session
+    GAMES[proc.pid] = proc
+    HUB.add(master_fd, session.output, session.finish, window=window)
+    return session
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Entry point
 # ─────────────────────────────────────────────────────────────────────────────
 
+def start_services():
+    """Background threads and helper processes of one serving process."""
+    HUB.start()
+    FANOUT.start()
+    KEEPALIVE.start()
+    if RECORDER:
+        RECORDER.start()
+        atexit.register(RECORDER.flush)
+    threading.Thread(target=_reaper, name="reaper", daemon=True).start()
+    if ZYGOTE:
+        ZYGOTE.start()
+        atexit.register(ZYGOTE.shutdown)
+    if POOL:
+        POOL.start()
+        atexit.register(POOL.shutdown)
+
+
+def run_worker(index, chan):
+    """Body of worker `index` under workers.Master."""
+    global WORKER_ID
+    WORKER_ID = index
+    start_services()
+    try:
+        workers.serve_connections(app, chan)
+    finally:
+        # The worker ends in os._exit(), which skips atexit.
+        if POOL:
+            POOL.shutdown()
+        if ZYGOTE:
+            ZYGOTE.shutdown()
+        if RECORDER:
+            RECORDER.flush()
+
+
 if __name__ == "__main__":
-    import sys
     # Cloud platforms inject $PORT; fall back to CLI arg or 5000
     port = int(os.environ.get("PORT", sys.argv[1] if len(sys.argv) > 1 else 5000))
     print(f"\n  Dungeon of the Forgotten King — Web Server")
     print(f"  ─────────────────────────────────────────")
     print(f"  Local:   http://localhost:{port}")
     print(f"  Network: http://0.0.0.0:{port}")
+    if HOSTING == "inproc":
+        print("  Hosting: in-process")
+    else:
+        print(f"  Pool:    {POOL_SIZE} warm game(s), spawn mode: {SPAWN_MODE}")
+    if WORKERS > 1:
+        print(f"  Workers: {WORKERS}")
     print(f"\n  Press Ctrl+C to stop.\n")
-    app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
+    if HOSTING != "inproc" and HIBERNATE_AFTER > 0:
+        prepare_hibernate_dir()
+    if WORKERS > 1:
+        workers.Master(port, WORKERS, run_worker).run()
+    else:
+        start_services()
+        app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
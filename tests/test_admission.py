@@ -0,0 +1,75 @@
+"""admission: the token bucket and who enter() lets in."""
+
+import threading
+import time
+
+import pytest
+
+import admission
+
+
+@pytest.fixture(autouse=True)
+def plenty_of_memory(monkeypatch):
+    monkeypatch.setattr(admission, "mem_available", lambda: None)
+
+
+def gate(running, **kw):
+    """An Admission counting len(running) games and no measurable memory."""
+    return admission.Admission(lambda: len(running), lambda: [], **kw)
+
+
+def never(*_):
+    raise AssertionError("should not have queued")
+
+
+def test_bucket():
+    b = admission.Bucket(rate=2, burst=2)
+    now = b.stamp
+    for _ in range(2):
+        assert b.ready(now)
+        b.take()
+    assert not b.ready(now)
+    assert b.wait() == pytest.approx(0.5)
+    assert b.ready(now + 0.5)
+
+
+def test_per_address_limit():
+    a = gate([], per_ip=2)
+    assert a.enter("1.1.1.1", never, lambda: True) == "admitted"
+    a.join("1.1.1.1")                                # a resumed game
+    assert a.enter("1.1.1.1", never, lambda: True) == "ip"
+    assert a.enter("2.2.2.2", never, lambda: True) == "admitted"
+    a.leave("1.1.1.1")
+    assert a.enter("1.1.1.1", never, lambda: True) == "admitted"
+    assert a.stats()["rejected_ip"] == 1
+
+
+def test_waits_in_line_until_a_game_ends():
+    running = ["one"]
+    a = gate(running, max_games=1)
+    places = []
+    result = []
+    t = threading.Thread(target=lambda: result.append(
+        a.enter("1.1.1.1", lambda place, n: places.append(place), lambda: True)))
+    t.start()
+    deadline = time.monotonic() + 5
+    while not places and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert places == [1] and a.stats()["waiting"] == 1
+    running.clear()
+    a.wake()
+    t.join(5)
+    assert result == ["admitted"] and places == [1, 0]
+
+
+def test_leaving_the_line():
+    a = gate(["one"], max_games=1)
+    assert a.enter("1.1.1.1", lambda *_: None, lambda: False) == "abandoned"
+    assert a.stats()["waiting"] == 0
+
+
+def test_full_line():
+    a = gate(["one"], max_games=1, queue_max=1)
+    a._waiting.append(admission._Ticket("3.3.3.3"))  # someone already waiting
+    assert a.enter("2.2.2.2", never, lambda: True) == "full"
+    assert a.stats()["rejected_full"] == 1
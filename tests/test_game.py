@@ -0,0 +1,89 @@
+"""Whole games on HeadlessConsole: the quit path, and screens sent by difference."""
+
+import random
+import re
+
+import dungeon_game
+import vterm
+
+ANSI = re.compile(r"\x1b\[[0-9;?]*[@-~]")
+SIZE = (100, 60)                              # every screen fits: none scroll
+
+
+def play(moves, size=SIZE, diff=True, seed=7):
+    """Play to the end, typing `moves` at the room prompt; (game, console, prompts)."""
+    moves, prompts = list(moves), []
+
+    def respond(con, prompt):
+        shown = ANSI.sub("", prompt).strip()
+        prompts.append(shown)
+        if len(prompts) > 200:
+            return None                       # lost: end the game with EOF
+        if "hero's name" in shown:
+            return "Tester"
+        if shown.startswith("Quit?"):
+            return "y"
+        if shown == ">":
+            return moves.pop(0) if moves else "q"
+        return ""                             # [Press Enter to continue]
+
+    con = dungeon_game.HeadlessConsole(respond, size=size)
+    con.diff_screens = diff
+    con.client_typing = False
+    random.seed(seed)
+    game = dungeon_game.Game(con)
+    game.run()
+    return game, con, prompts
+
+
+def terminal(con, size=SIZE):
+    """What a terminal that was sent the console's output shows."""
+    screen = vterm.Screen(*size)
+    screen.history = []                       # its scrollback since the last clear
+    screen.feed("".join(con.output).replace("\n", "\r\n"))
+    return screen
+
+
+def test_quit_ends_the_run():
+    game, con, prompts = play(["m", "?"])
+    assert game.over and not game.won
+    assert prompts[0] == "Enter your hero's name:"
+    assert prompts[-1] == "Quit? (y/n):"
+    assert "The dungeon claims another soul" in terminal(con).text()
+
+
+def test_eof_ends_the_game():
+    con = dungeon_game.HeadlessConsole(["Tester"], size=SIZE)
+    random.seed(7)
+    try:
+        dungeon_game.Game(con).run()
+    except EOFError:
+        pass
+    else:
+        raise AssertionError("ran out of input without an EOFError")
+    assert con.inputs == 1
+
+
+def test_diffs_draw_what_the_game_drew():
+    _, diffed, _ = play(["m", "?", "x"])
+    _, whole, _ = play(["m", "?", "x"], diff=False)
+    shown = terminal(diffed)
+    assert shown.text() == terminal(whole).text()
+    assert shown.text() == diffed.screen.text()          # the model is right
+    assert diffed.bytes < whole.bytes
+
+
+def test_screens_that_scroll_keep_their_scrollback():
+    for size in [(80, 24), (100, 30), (120, 45)]:
+        _, diffed, _ = play(["m", "?", "x", "l"], size=size)
+        _, whole, _ = play(["m", "?", "x", "l"], size=size, diff=False)
+        shown, wanted = terminal(diffed, size), terminal(whole, size)
+        assert shown.text() == wanted.text()
+        assert shown.history == wanted.history
+        assert diffed.bytes < whole.bytes
+
+
+def test_no_size_sends_screens_whole():
+    _, con, _ = play(["m"], size=None)
+    assert con.screen is None
+    assert "".join(con.output).count(dungeon_game.CLEAR) > 1
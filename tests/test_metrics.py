@@ -0,0 +1,39 @@
+"""metrics: the Prometheus text format."""
+
+import pytest
+
+import metrics
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(metrics, "REGISTRY", [])
+
+
+def test_counter_and_gauge():
+    c = metrics.Counter("dungeon_test_total", "Things.", ["kind"])
+    c.inc(1, "a")
+    c.inc(2, "a")
+    c.inc(1, 'b"\n')
+    metrics.Gauge("dungeon_test_level", "Level.", collect=lambda: {(): 2.0})
+    assert metrics.render() == (
+        "# HELP dungeon_test_total Things.\n"
+        "# TYPE dungeon_test_total counter\n"
+        'dungeon_test_total{kind="a"} 3\n'
+        'dungeon_test_total{kind="b\\"\\n"} 1\n'
+        "# HELP dungeon_test_level Level.\n"
+        "# TYPE dungeon_test_level gauge\n"
+        "dungeon_test_level 2\n")
+
+
+def test_histogram():
+    h = metrics.Histogram("dungeon_test_seconds", "Time.", buckets=(0.1, 1))
+    for v in (0.05, 0.5, 0.5, 3):
+        h.observe(v)
+    assert h.render()[2:] == [
+        'dungeon_test_seconds_bucket{le="0.1"} 1',
+        'dungeon_test_seconds_bucket{le="1"} 3',
+        'dungeon_test_seconds_bucket{le="+Inf"} 4',
+        "dungeon_test_seconds_sum 4.05",
+        "dungeon_test_seconds_count 4",
+    ]
@@ -0,0 +1,49 @@
+"""server.Session's output queue: collapsing a slow socket's backlog."""
+
+import threading
+
+import pytest
+
+import vterm
+
+pytest.importorskip("flask")
+import server
+
+
+def session():
+    """A Session with just its output queue: no game behind it."""
+    s = server.Session.__new__(server.Session)
+    s.queue, s.queued, s.token, s.end = [], 0, "tok", 0
+    s.ring = bytearray()
+    s.screen = vterm.Screen(80, 24)
+    s.wakeup = threading.Condition()
+    return s
+
+
+def fill(s, screens, size=1000):
+    offset = 0
+    for _ in range(screens):
+        msg = server.CLEAR + b"x" * size
+        s._queue(msg, offset)
+        offset += len(msg)
+
+
+def test_collapse_keeps_control_messages():
+    s = session()
+    with s.wakeup:
+        s._queue("\x00SESSION:tok:0")
+        s._queue("\x00WATCH:w1")
+        fill(s, 200)
+    control = [m for offset, m in s.queue if offset is None]
+    assert "\x00WATCH:w1" in control
+    assert sum(m.startswith("\x00SESSION:") for m in control) <= 1
+    assert s.queued <= server.OUTPUT_QUEUE + 1100
+
+
+def test_collapse_to_a_repaint_keeps_them_too():
+    s = session()
+    with s.wakeup:
+        s._queue("\x00WATCH:w1")
+        s._queue(b"y" * (server.OUTPUT_QUEUE + 1), 0)     # no clear to cut at
+    assert [m for _, m in s.queue if isinstance(m, str)][-2:] == [
+        "\x00WATCH:w1", "\x00SCREEN:" + s.screen.repaint()]
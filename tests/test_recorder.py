@@ -0,0 +1,86 @@
+"""recorder: segments, keyframes and seeking."""
+
+import json
+import random
+
+import recorder
+
+
+def record(directory, rotate=2000, seed=1, events=400):
+    """A finished recording with resizes, keyframes and several segments."""
+    rng = random.Random(seed)
+    rec_ = recorder.Recorder(directory, rotate=rotate)
+    rec = rec_.record("game", 80, 24)
+    for i in range(events):
+        if rng.random() < 0.03:
+            rec.resize(rng.choice([80, 100]), 30)
+        key = rng.random() < 0.1
+        rec.output("é" + "x" * rng.randint(1, 100), screen=f"screen {i}" if key else None)
+        rec.started -= 0.1                       # a tenth of a second an event
+        if rng.random() < 0.05:
+            rec_._write(rec)
+    rec_.close(rec)
+    rec_._write(rec)
+    return rec_
+
+
+def scanned(directory, start):
+    """seek() worked out the slow way, from every event."""
+    frame = None
+    for k in recorder.keyframes(directory, "game"):
+        if k["t"] <= start:
+            frame = k
+    lines = list(recorder.cast_lines(directory, "game"))
+    if frame is None:
+        return lines
+    size = "80x24"
+    for line in lines[1:frame["event"] + 1]:
+        event = json.loads(line)
+        if event[1] == "r":
+            size = event[2]
+    out = [lines[0]]
+    if size != "80x24":
+        out.append(json.dumps([frame["t"], "r", size], separators=(",", ":")))
+    out.append(json.dumps([frame["t"], "o", frame["screen"]],
+                          ensure_ascii=False, separators=(",", ":")))
+    return out + lines[frame["event"] + 1:]
+
+
+def test_segments_are_compressed(tmp_path):
+    rec_ = record(tmp_path)
+    assert rec_.rotations > 3
+    assert not list(tmp_path.glob("*.cast")) and not list(tmp_path.glob("*.idx"))
+    lines = list(recorder.cast_lines(tmp_path, "game"))
+    assert json.loads(lines[0])["width"] == 80
+    assert sum(1 for line in lines[1:] if json.loads(line)[1] == "o") == 400
+    assert recorder.recordings(tmp_path) == {"game": sum(
+        p.stat().st_size for p in tmp_path.iterdir())}
+
+
+def test_seek_matches_reading_from_the_start(tmp_path):
+    record(tmp_path)
+    frames = recorder.keyframes(tmp_path, "game")
+    assert len(frames) > 20
+    for start in [0, frames[0]["t"], frames[7]["t"] + 0.05, 20.0, 39.0, 1000]:
+        assert list(recorder.seek(tmp_path, "game", start)) == scanned(tmp_path, start)
+
+
+def test_seek_while_recording(tmp_path):
+    rec_ = recorder.Recorder(tmp_path, rotate=1 << 20)
+    rec = rec_.record("game", 80, 24)
+    rec.output("\x1b[H\x1b[2Jfirst", screen="first")
+    rec_._write(rec)
+    rec.output(" more")
+    rec_._write(rec)
+    lines = list(recorder.seek(tmp_path, "game", 10))
+    assert [json.loads(line)[2] for line in lines[1:]] == ["first", " more"]
+
+
+def test_info(tmp_path):
+    record(tmp_path, events=50)
+    found = recorder.info(tmp_path, "game")
+    assert found["header"]["height"] == 24
+    last = [json.loads(line) for line in recorder.cast_lines(tmp_path, "game")][-1]
+    assert found["duration"] == last[0] > 4.5                # from the index, not a scan
+    assert found["keyframes"] == [k["t"] for k in recorder.keyframes(tmp_path, "game")]
+    assert recorder.info(tmp_path, "missing") is None
@@ -0,0 +1,49 @@
+"""server.Session's keystrokes: around a hibernation ask."""
+
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+import server
+
+
+@pytest.fixture
+def session():
+    """A Session whose game is the write end of a pipe."""
+    s = server.Session.__new__(server.Session)
+    read_fd, s.master_fd = os.pipe()
+    s.snapshot, s.asked, s.held, s.line = None, None, [], b""
+    s.input_lock, s.wake_lock = threading.Lock(), threading.Lock()
+    s.parked = threading.Event()
+    yield s, read_fd
+    os.close(read_fd)
+    os.close(s.master_fd)
+
+
+def test_the_line_being_typed(session):
+    s, read_fd = session
+    s.write(b"look\rx")
+    s.write(b"\x7fm")
+    assert s.line == b"x\x7fm"
+    assert os.read(read_fd, 100) == b"look\rx\x7fm"
+
+
+def test_keys_during_an_ask_do_not_wait(session):
+    s, read_fd = session
+    s.asked = time.time()
+    t0 = time.monotonic()
+    s.write(b"m")
+    s.write(b"\r")
+    assert time.monotonic() - t0 < 0.5              # held, not waited for
+    assert s.held == [b"m", b"\r"]
+    s.asked = None                                   # the game went on
+    s.parked.set()
+    deadline = time.monotonic() + 5
+    while s.held and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with s.input_lock:                               # wake() is done with them
+        pass
+    assert os.read(read_fd, 100) == b"m\r" and s.line == b""
@@ -0,0 +1,64 @@
+"""A game on a PTY, as server.py hosts it: keys typed ahead keep its screens right."""
+
+import codecs
+import fcntl
+import os
+import select
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+import vterm
+
+pty = pytest.importorskip("pty")
+termios = pytest.importorskip("termios")
+
+ROOT = Path(__file__).resolve().parent.parent
+COLS, ROWS = 100, 60
+
+
+def play(keys, ahead, diff="1"):
+    """What the terminal shows after typing keys one at a time, or all at once."""
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.chdir(ROOT)
+        os.environ.update(TERM="xterm-256color", DUNGEON_DIFF=diff,
+                          DUNGEON_CLIENT_TYPING="1", DUNGEON_HIBERNATE_DIR="")
+        os.execv(sys.executable, [sys.executable, "-c",
+                 "import random; random.seed(3); import dungeon_game; dungeon_game.main()"])
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", ROWS, COLS, 0, 0))
+    screen = vterm.Screen(COLS, ROWS)
+    decode = codecs.getincrementaldecoder("utf-8")("replace").decode
+
+    def settle(quiet=0.4):
+        while select.select([fd], [], [], quiet)[0]:
+            try:
+                data = os.read(fd, 65536)
+            except OSError:
+                return
+            if not data:
+                return
+            screen.feed(decode(data))
+
+    try:
+        settle(1.0)
+        for key in ["Tester\r", "\r", "\r"] + ([] if ahead else keys):
+            os.write(fd, key.encode())
+            settle()
+        if ahead:
+            os.write(fd, "".join(keys).encode())
+            settle(1.0)
+    finally:
+        os.kill(pid, 9)
+        os.waitpid(pid, 0)
+        os.close(fd)
+    return screen.text()
+
+
+def test_typed_ahead_matches_typed_slowly():
+    keys = ["?\r", "\r", "j\r\r", "m\r"]
+    slowly = play(keys, ahead=False)
+    assert "Commands:" in slowly
+    assert play(keys, ahead=True) == slowly
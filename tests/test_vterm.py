@@ -0,0 +1,113 @@
+"""vterm.Screen: diff() and repaint() redraw exactly the screen they describe."""
+
+import random
+
+import vterm
+
+
+def same(a, b):
+    # The right half of a wide character whose left half was overwritten
+    # is blank on a terminal; the model may keep it as a FILLER.
+    assert a.text() == b.text()
+    assert [r.replace(vterm.FILLER, " ") for r in a.chars] == \
+        [r.replace(vterm.FILLER, " ") for r in b.chars]
+    assert a.attrs == b.attrs
+    assert a.state == b.state
+    assert (a.y, min(a.x, a.cols - 1)) == (b.y, min(b.x, b.cols - 1))
+
+
+def screen(text, cols=40, rows=12):
+    s = vterm.Screen(cols, rows)
+    s.feed(text)
+    return s
+
+
+def round_trip(before, after, cols=40, rows=12):
+    """Feed old's terminal new.diff(old); it must then show new."""
+    old = screen(before, cols, rows)
+    new = old.copy()
+    new.feed(after)
+    shown = old.copy()
+    shown.feed(new.diff(old))
+    same(shown, new)
+    return new.diff(old)
+
+
+def test_nothing_changed():
+    assert round_trip("\x1b[H\x1b[2Jhello", "\x1b[H\x1b[2Jhello") == ""
+
+
+def test_one_word_changes():
+    out = round_trip("\x1b[H\x1b[2JHP 10/20\r\nroom", "\x1b[H\x1b[2JHP  9/20\r\nroom")
+    assert "room" not in out
+
+
+def test_rows_get_shorter_and_colours_change():
+    round_trip("\x1b[H\x1b[2J\x1b[31mlong red line here\x1b[0m\r\nkeep",
+               "\x1b[H\x1b[2J\x1b[1;32mshort\x1b[0m\r\nkeep\x1b[7m")
+
+
+def test_wide_characters():
+    round_trip("\x1b[H\x1b[2Jab世界cd", "\x1b[H\x1b[2Jabx界cd")
+    round_trip("\x1b[H\x1b[2Jabxyzcd", "\x1b[H\x1b[2Jab世界cd")
+
+
+def test_random_screens():
+    rng = random.Random(1)
+    words = ["goblin", "HP", "\x1b[31m", "\x1b[0m", "\x1b[1;33m", "██",
+             "世", " ", "\r\n", "\x1b[K", "\x1b[5;10H", "\x1b[2J"]
+    for _ in range(200):
+        before = "".join(rng.choice(words) for _ in range(rng.randint(0, 60)))
+        after = "".join(rng.choice(words) for _ in range(rng.randint(0, 60)))
+        round_trip(before, "\x1b[H\x1b[2J" + after)
+        round_trip(before, after)
+
+
+def test_repaint_redraws_the_screen():
+    s = screen("\x1b[H\x1b[2J\x1b[1;31mTitle\x1b[0m\r\n  世 ok\x1b[3;5H\x1b[4m")
+    same(screen(s.repaint()), s)
+
+
+def test_repaint_on_the_alternate_screen():
+    s = screen("main text\x1b[?1049h\x1b[H\x1b[2Jmap")
+    shown = screen(s.repaint())
+    assert shown.alt and shown.text() == "map"
+    assert shown.main_screen().text() == s.main_screen().text() == "main text"
+
+
+def test_leaving_the_alternate_screen_restores_the_main_one():
+    s = screen("under\x1b[?1049h\x1b[H\x1b[2Joverlay\x1b[?1049l")
+    assert not s.alt and s.text() == "under"
+
+
+def test_resize_keeps_the_cursor_row():
+    s = screen("\r\n".join(f"line {i}" for i in range(12)))
+    s.resize(30, 6)
+    assert s.text().splitlines()[-1] == "line 11" and s.y == 5
+
+
+def test_margins_insert_and_delete():
+    s = screen("\r\n".join(f"line {i}" for i in range(6)), rows=6)
+    s.history = []
+    s.feed("\x1b[1;2r\x1b[2H\n\n")                 # scrolls only the top two rows
+    assert [c.rstrip() for c, _ in s.history] == ["line 0", "line 1"]
+    assert s.text().splitlines()[2:] == ["line 2", "line 3", "line 4", "line 5"]
+    s.feed("\x1b[r\x1b[2L")
+    assert s.text().splitlines()[4:] == ["line 2", "line 3"]
+    s.feed("\x1b[3M")
+    assert s.text().splitlines() == ["", "line 2", "line 3"] and s.scrolled == 2
+
+
+def test_scroll_diff():
+    rng = random.Random(2)
+    rows = [f"\x1b[3{i % 8}mrow {i}\x1b[0m" for i in range(40)]
+    for _ in range(50):
+        old = screen("\x1b[H\x1b[2J\x1b[3J" + "\r\n".join(rng.sample(rows, rng.randint(1, 30))))
+        new = old.copy()
+        new.history = []
+        new.feed("\x1b[H\x1b[2J\x1b[3J" + "\r\n".join(rng.sample(rows, rng.randint(13, 30))))
+        shown = old.copy()
+        shown.history = []
+        shown.feed(new.scroll_diff(old, new.history))
+        same(shown, new)
+        assert shown.history == new.history and shown.scrolled == new.scrolled
@@ -0,0 +1,25 @@
+"""workers: which worker a request belongs to."""
+
+import pytest
+
+import workers
+
+
+@pytest.mark.parametrize("head, index", [
+    (b"GET /ws?resume=2.Xy9abc HTTP/1.1\r\nHost: x\r\n", 2),
+    (b"GET /watch/1.abc HTTP/1.1\r\n", 1),
+    (b"GET /metrics?worker=3 HTTP/1.1\r\n", 3),
+    (b"GET /ws?resume=7.Xy9 HTTP/1.1\r\n", None),       # no such worker
+    (b"GET /ws?resume=Xy9 HTTP/1.1\r\n", None),         # a token from one worker
+    (b"GET / HTTP/1.1\r\n", None),
+    (b"GET", None),
+    (b"", None),
+])
+def test_route(head, index):
+    assert workers.route(head, 4) == index
+
+
+def test_count():
+    assert workers.count("3") == 3
+    assert workers.count("0") == 1
+    assert workers.count("auto") >= 1
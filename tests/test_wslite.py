@@ -0,0 +1,75 @@
+"""wslite: handshake keys, frames and whole messages."""
+
+import asyncio
+
+import pytest
+
+import wslite
+
+
+class Writer:
+    def __init__(self):
+        self.sent = []
+
+    def write(self, data):
+        self.sent.append(data)
+
+
+def read(data, **kw):
+    """read_message() over `data`; (opcode, payload, what it wrote back)."""
+    async def go():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        writer = Writer()
+        op, payload = await wslite.read_message(reader, writer, **kw)
+        return op, payload, writer.sent
+    return asyncio.run(go())
+
+
+def test_accept_key():
+    # RFC 6455 section 1.3.
+    assert wslite.accept_key("dGhlIHNhbXBsZSBub25jZQ==") == "s3pPLMBiTxaQ9kYGzzhZRbK+xOo="
+
+
+@pytest.mark.parametrize("size", [0, 125, 126, 65535, 65536])
+def test_masked_frames_round_trip(size):
+    payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+    op, got, _ = read(wslite.encode_frame(wslite.OP_BINARY, payload, mask=True))
+    assert (op, got) == (wslite.OP_BINARY, payload)
+
+
+def test_fragments_and_a_ping_between_them():
+    data = (wslite.encode_frame(wslite.OP_TEXT, b"hel", mask=True, fin=False)
+            + wslite.encode_frame(wslite.OP_PING, b"!", mask=True)
+            + wslite.encode_frame(wslite.OP_CONT, b"lo", mask=True))
+    op, got, sent = read(data)
+    assert (op, got) == (wslite.OP_TEXT, b"hello")
+    assert sent == [wslite.encode_frame(wslite.OP_PONG, b"!")]
+
+
+def test_compressed_message():
+    out = wslite.PerMessageDeflate()
+    data = wslite.encode_frame(wslite.OP_TEXT, b"forgotten " * 50, mask=True, deflate=out)
+    assert len(data) < 100
+    op, got, _ = read(data, deflate=wslite.PerMessageDeflate())
+    assert got == b"forgotten " * 50
+
+
+def test_compressed_frame_without_deflate():
+    data = wslite.encode_frame(wslite.OP_TEXT, b"x", mask=True,
+                               deflate=wslite.PerMessageDeflate())
+    with pytest.raises(wslite.ProtocolError):
+        read(data)
+
+
+def test_oversize_frame():
+    head = bytes([0x82, 0xFF]) + (wslite.MAX_MESSAGE + 1).to_bytes(8, "big")
+    with pytest.raises(wslite.ProtocolError):
+        read(head)
+
+
+def test_close_and_eof():
+    op, _, sent = read(wslite.encode_frame(wslite.OP_CLOSE, b"\x03\xe8", mask=True))
+    assert op == wslite.OP_CLOSE and sent == [wslite.encode_frame(wslite.OP_CLOSE, b"\x03\xe8")]
+    assert read(b"")[0] == wslite.OP_CLOSE
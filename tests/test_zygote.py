@@ -0,0 +1,79 @@
+"""zygote: games forked from the preloaded parent, and handles on them."""
+
+import os
+import select
+import signal
+import time
+
+import pytest
+
+import zygote
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+
+
+@pytest.fixture
+def zyg():
+    z = zygote.Zygote()
+    z.start()
+    yield z
+    z.shutdown()
+
+
+def read_until(fd, text, timeout=10):
+    out = b""
+    while text.encode() not in out:
+        if not select.select([fd], [], [], timeout)[0]:
+            break
+        try:
+            out += os.read(fd, 65536)
+        except OSError:
+            break
+    return out.decode("utf-8", "replace")
+
+
+def test_spawn_kill_and_reap(zyg):
+    child, master_fd = zyg.spawn(100, 40)
+    try:
+        assert "hero's name" in read_until(master_fd, "hero's name")
+        assert child.poll() is None
+        child.terminate()
+        assert child.wait(5) == -1
+        assert child.pidfd is None                   # closed once it exited
+        child.send_signal(signal.SIGKILL)            # gone: a no-op, never a stray kill
+    finally:
+        os.close(master_fd)
+
+
+def test_hangup_ends_the_game_and_the_zygote_reaps_it(zyg):
+    child, master_fd = zyg.spawn(80, 24)
+    read_until(master_fd, "hero's name")
+    os.close(master_fd)                              # hangs the game up
+    assert child.wait(5) == -1
+    deadline = time.monotonic() + 5
+    while os.path.exists(f"/proc/{child.pid}") and time.monotonic() < deadline:
+        time.sleep(0.05)                             # a zombie until reaped
+    assert not os.path.exists(f"/proc/{child.pid}")
+
+
+def test_games_use_the_alternate_screen_without_term(monkeypatch):
+    # The zygote imports the game before a fork sets TERM for it.
+    monkeypatch.delenv("TERM", raising=False)
+    monkeypatch.setenv("DUNGEON_DIFF", "1")
+    z = zygote.Zygote()
+    z.start()
+    try:
+        child, master_fd = z.spawn(100, 40)
+        try:
+            read_until(master_fd, "hero's name")
+            os.write(master_fd, b"Tess\r")
+            read_until(master_fd, "Press Enter")
+            os.write(master_fd, b"\r")
+            read_until(master_fd, "> ")
+            os.write(master_fd, b"m\r")
+            assert "\x1b[?1049h" in read_until(master_fd, "\x1b[?1049h")
+        finally:
+            child.terminate()
+            os.close(master_fd)
+    finally:
+        z.shutdown()
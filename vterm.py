@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Virtual terminal
+  A screen model that follows the ANSI subset the game writes: text, CR/LF,
+  backspace and tab, SGR colours, cursor moves, erase in display/line,
+  insert and delete line, scroll margins, the \033[H\033[2J\033[3J of
+  clear() and the alternate screen (\033[?1049h/l).  The server feeds it every session's output
+  and asks it for repaint(): the current screen as one compact
+  string, which is what a reconnecting page needs instead of a byte log
+  that clear() has mostly wiped.  The game keeps one too, of its own
+  terminal, and sends diff() against it instead of redrawing a screen
+  that has barely changed.
+
+  Each row is two strings of equal length: its characters and its
+  attributes, one code point per cell indexing a shared table of SGR
+  states.  A 100x40 screen is a few kilobytes whatever is on it.
+"""
+
+import re
+import time
+
+# A CSI sequence, an OSC string, a lone control character, or an ESC whose
+# sequence has not fully arrived yet (kept for the next feed()).
+_TOKEN = re.compile(
+    r"\x1b\[([0-9;?]*)([@-~])"
+    r"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"
+    r"|\x1b[()][0-9A-Za-z]|\x1b[=>78c]"
+    r"|([\r\n\b\t\x07\x00\x0e\x0f])"
+    r"|(\x1b(?:\[[0-9;?]*|\][^\x07\x1b]*|[()])?\Z)"
+    r"|\x1b"
+)
+
+# Characters xterm.js draws two cells wide (CJK and emoji blocks).
+_WIDE = re.compile(
+    "[\u1100-\u115f\u2e80-\u303e\u3041-\u33ff\u3400-\u4dbf\u4e00-\u9fff"
+    "\ua000-\ua4cf\uac00-\ud7a3\uf900-\ufaff\ufe30-\ufe4f\uff00-\uff60"
+    "\uffe0-\uffe6\U0001f300-\U0001f64f\U0001f680-\U0001f6ff"
+    "\U0001f900-\U0001f9ff\U00020000-\U0003fffd]"
+)
+
+# Right half of a wide character; never painted.
+FILLER = "\0"
+
+# SGR state: (intensity, italic, underline, blink, inverse, fg, bg) where
+# intensity is a set of "1"/"2" and fg/bg are SGR parameter strings.
+DEFAULT = (frozenset(), False, False, False, False, "", "")
+
+_ATTRS   = [DEFAULT]        # attribute id → state
+_ATTR_ID = {DEFAULT: 0}     # state → attribute id
+
+
+def _attr_id(state):
+    aid = _ATTR_ID.get(state)
+    if aid is None:
+        aid = _ATTR_ID[state] = len(_ATTRS)
+        _ATTRS.append(state)
+    return aid
+
+
+def _sgr(params, state):
+    """Apply one SGR parameter list to a state; returns the new state."""
+    inten, italic, under, blink, inverse, fg, bg = state
+    codes = params.split(";") if params else ["0"]
+    i = 0
+    while i < len(codes):
+        c = codes[i] or "0"
+        if c == "0":
+            inten, italic, under, blink, inverse, fg, bg = DEFAULT
+        elif c in ("1", "2"):
+            inten = inten | {c}
+        elif c == "22":
+            inten = frozenset()
+        elif c in ("3", "23"):
+            italic = c == "3"
+        elif c in ("4", "24"):
+            under = c == "4"
+        elif c in ("5", "25"):
+            blink = c == "5"
+        elif c in ("7", "27"):
+            inverse = c == "7"
+        elif c in ("38", "48"):
+            # 38;5;n or 38;2;r;g;b — keep the whole parameter group.
+            n = 3 if codes[i + 1:i + 2] == ["5"] else 5
+            group = ";".join(codes[i:i + n])
+            if c == "38":
+                fg = group
+            else:
+                bg = group
+            i += n - 1
+        elif c == "39":
+            fg = ""
+        elif c == "49":
+            bg = ""
+        elif c.isdigit():
+            n = int(c)
+            if 30 <= n <= 37 or 90 <= n <= 97:
+                fg = c
+            elif 40 <= n <= 47 or 100 <= n <= 107:
+                bg = c
+        i += 1
+    return (frozenset(inten), italic, under, blink, inverse, fg, bg)
+
+
+def sgr_string(state):
+    """The escape that sets state from scratch."""
+    inten, italic, under, blink, inverse, fg, bg = state
+    codes = ["0"] + sorted(inten)
+    codes += [c for c, on in (("3", italic), ("4", under), ("5", blink),
+                              ("7", inverse)) if on]
+    codes += [c for c in (fg, bg) if c]
+    return "\x1b[" + ";".join(codes) + "m"
+
+
+class Screen:
+    """
+    feed(text) from one thread at a time; repaint() returns a string that
+    redraws the screen, attributes and cursor on a freshly reset terminal.
+    """
+
+    def __init__(self, cols=80, rows=24):
+        self.cols  = cols
+        self.rows  = rows
+        self.chars = [" " * cols for _ in range(rows)]
+        self.attrs = ["\0" * cols for _ in range(rows)]
+        self.x = self.y = 0
+        self.top, self.bottom = 0, rows - 1     # scroll margins
+        self.state   = DEFAULT
+        self.aid     = 0
+        self.scrolled = 0       # lines scrolled off the top since the last \033[3J
+        self.history = None     # a list to collect those lines in, (chars, attrs) each
+        self.alt     = False    # on the alternate screen
+        self._main   = None     # the main screen meanwhile: chars, attrs, x, y, scrolled
+        self._tail   = ""       # an escape sequence split across feeds
+        self.fed     = 0        # characters parsed so far
+        self.parse_s = 0.0      # time spent in feed()
+
+    # ── input ───────────────────────────────────────────────────────────────
+    def feed(self, text):
+        t0 = time.perf_counter()
+        if self._tail:
+            text, self._tail = self._tail + text, ""
+        self.fed += len(text)
+        if text.isprintable():             # slow_print: one glyph at a time
+            self._print(text)
+            self.parse_s += time.perf_counter() - t0
+            return
+        pos = 0
+        for m in _TOKEN.finditer(text):
+            if m.start() > pos:
+                self._print(text[pos:m.start()])
+            pos = m.end()
+            params, final, ctrl, partial = m.groups()
+            if final:
+                self._csi(params, final)
+            elif ctrl:
+                self._control(ctrl)
+            elif partial is not None:
+                self._tail = partial
+        if pos < len(text):
+            self._print(text[pos:])
+        self.parse_s += time.perf_counter() - t0
+
+    @property
+    def pending(self):
+        """Characters of an unfinished escape sequence held for next feed()."""
+        return self._tail
+
+    def _print(self, run):
+        if _WIDE.search(run):
+            run = _WIDE.sub(lambda m: m.group() + FILLER, run)
+        while run:
+            if self.x >= self.cols:          # autowrap
+                self.x = 0
+                self._linefeed()
+            n = min(len(run), self.cols - self.x)
+            self._put(self.y, self.x, run[:n], chr(self.aid) * n)
+            self.x += n
+            run = run[n:]
+
+    def _put(self, y, x, chars, attrs):
+        n = len(chars)
+        row, arow = self.chars[y], self.attrs[y]
+        self.chars[y] = row[:x] + chars + row[x + n:]
+        self.attrs[y] = arow[:x] + attrs + arow[x + n:]
+
+    def _blank(self, y, start, end):
+        end = min(end, self.cols)
+        if end > start:
+            self._put(y, start, " " * (end - start), "\0" * (end - start))
+
+    def _linefeed(self):
+        if self.y != self.bottom:
+            self.y = min(self.y + 1, self.rows - 1)
+            return
+        if self.top == 0:
+            # Like xterm: what scrolls off the top of the screen is kept,
+            # margins or not.
+            if self.history is not None and not self.alt:
+                self.history.append((self.chars[0], self.attrs[0]))
+            self.scrolled += 1
+        self._lines(self.top, -1)
+
+    def _lines(self, y, n):
+        """Insert n blank lines at row y (delete -n if negative) within the margins."""
+        end = self.bottom + 1
+        n = max(-(end - y), min(n, end - y))
+        if n > 0:
+            self.chars[y:end] = [" " * self.cols] * n + self.chars[y:end - n]
+            self.attrs[y:end] = ["\0" * self.cols] * n + self.attrs[y:end - n]
+        else:
+            self.chars[y:end] = self.chars[y - n:end] + [" " * self.cols] * -n
+            self.attrs[y:end] = self.attrs[y - n:end] + ["\0" * self.cols] * -n
+
+    def _control(self, c):
+        if c == "\n":
+            self._linefeed()
+        elif c == "\r":
+            self.x = 0
+        elif c == "\b":
+            self.x = max(0, min(self.x, self.cols - 1) - 1)
+        elif c == "\t":
+            self.x = min(self.cols - 1, (self.x // 8 + 1) * 8)
+
+    def _csi(self, params, final):
+        if params.startswith("?"):
+            if params == "?1049" and final in "hl":
+                self._alternate(final == "h")
+            return                           # other private modes: not modelled
+        if final == "m":
+            self.state = _sgr(params, self.state)
+            self.aid   = _attr_id(self.state)
+            return
+        args = [int(p) if p.isdigit() else 0 for p in params.split(";")] if params else []
+        n = (args[0] if args else 0) or 1
+        if final in "Hf":
+            row = (args[0] if args else 0) or 1
+            col = (args[1] if len(args) > 1 else 0) or 1
+            self.y = min(row, self.rows) - 1
+            self.x = min(col, self.cols) - 1
+        elif final == "A":
+            self.y = max(0, self.y - n)
+        elif final in "Be":
+            self.y = min(self.rows - 1, self.y + n)
+        elif final in "Ca":
+            self.x = min(self.cols - 1, self.x + n)
+        elif final == "D":
+            self.x = max(0, min(self.x, self.cols - 1) - n)
+        elif final in "G`":
+            self.x = min(n, self.cols) - 1
+        elif final == "d":
+            self.y = min(n, self.rows) - 1
+        elif final == "J":
+            mode = args[0] if args else 0
+            if mode == 0:
+                self._blank(self.y, self.x, self.cols)
+                for y in range(self.y + 1, self.rows):
+                    self._blank(y, 0, self.cols)
+            elif mode == 1:
+                for y in range(self.y):
+                    self._blank(y, 0, self.cols)
+                self._blank(self.y, 0, self.x + 1)
+            elif mode == 2:
+                for y in range(self.rows):
+                    self._blank(y, 0, self.cols)
+            elif mode == 3:
+                self.scrolled = 0    # no scrollback is kept, only counted
+                if self.history:
+                    self.history.clear()
+        elif final in "LM":
+            if self.top <= self.y <= self.bottom:
+                self._lines(self.y, n if final == "L" else -n)
+                self.x = 0
+        elif final == "r":
+            top = (args[0] if args else 0) or 1
+            bottom = (args[1] if len(args) > 1 else 0) or self.rows
+            if top < bottom <= self.rows:
+                self.top, self.bottom = top - 1, bottom - 1
+                self.x = self.y = 0
+        elif final == "K":
+            mode = args[0] if args else 0
+            if mode == 0:
+                self._blank(self.y, self.x, self.cols)
+            elif mode == 1:
+                self._blank(self.y, 0, self.x + 1)
+            else:
+                self._blank(self.y, 0, self.cols)
+
+    def _alternate(self, on):
+        """Enter (saving the cursor and clearing it) or leave the alternate screen."""
+        if on and not self.alt:
+            self._main = (self.chars, self.attrs, self.x, self.y, self.scrolled)
+            self.chars = [" " * self.cols for _ in range(self.rows)]
+            self.attrs = ["\0" * self.cols for _ in range(self.rows)]
+            self.scrolled = 0
+        elif not on and self.alt:
+            self.chars, self.attrs, self.x, self.y, self.scrolled = self._main
+            self._main = None
+        self.alt = on
+
+    def main_screen(self):
+        """The main screen as it is, or as leaving the alternate one brings it back."""
+        main = self.copy()
+        if main.alt:
+            main._alternate(False)
+        return main
+
+    # ── output ──────────────────────────────────────────────────────────────
+    def resize(self, cols, rows):
+        """Follow a window size change; the game redraws on its own."""
+        if self._main is not None:
+            main = self.main_screen()
+            main.resize(cols, rows)
+            self._main = (main.chars, main.attrs, main.x, main.y, main.scrolled)
+        if cols != self.cols:
+            self.chars = [(r + " " * cols)[:cols] for r in self.chars]
+            self.attrs = [(a + "\0" * cols)[:cols] for a in self.attrs]
+        if rows < self.rows:
+            # Like xterm: drop lines from the top so the cursor row stays.
+            drop = max(0, self.y + 1 - rows)
+            self.chars = self.chars[drop:drop + rows]
+            self.attrs = self.attrs[drop:drop + rows]
+            self.y -= drop
+        else:
+            self.chars += [" " * cols for _ in range(rows - self.rows)]
+            self.attrs += ["\0" * cols for _ in range(rows - self.rows)]
+        self.cols, self.rows = cols, rows
+        self.top, self.bottom = 0, rows - 1
+        self.x = min(self.x, cols)
+        self.y = min(self.y, rows - 1)
+
+    def repaint(self):
+        """
+        Clear, every non-blank row with minimal SGR changes, then cursor.
+        On the alternate screen, the main screen is painted first.
+        """
+        out = ["\x1b[H\x1b[2J"]
+        if self.alt:
+            chars, attrs = self._main[:2]
+            self._paint(out, chars, attrs)
+            out.append("\x1b[?1049h")
+        self._paint(out, self.chars, self.attrs)
+        out.append(sgr_string(self.state))
+        out.append(f"\x1b[{self.y + 1};{min(self.x, self.cols - 1) + 1}H")
+        return "".join(out)
+
+    def _paint(self, out, rows, arows):
+        for y, (chars, attrs) in enumerate(zip(rows, arows)):
+            if chars.strip(" ") or attrs.strip("\0"):
+                out.append(f"\x1b[{y + 1}H")
+                self._row(out, chars, attrs)
+
+    def _row(self, out, chars, attrs):
+        """One row from where the cursor is, up to its last non-blank cell;
+        its last attributes are left set."""
+        end = self.cols
+        while end and chars[end - 1] == " " and attrs[end - 1] == "\0":
+            end -= 1
+        current, start = None, 0
+        for x in range(end + 1):
+            a = attrs[x] if x < end else None
+            if a != current:
+                if x > start:
+                    out.append(chars[start:x].replace(FILLER, ""))
+                if a is not None:
+                    out.append(sgr_string(_ATTRS[ord(a)]))
+                current, start = a, x
+
+    def diff(self, old):
+        """
+        What turns a terminal showing `old` (a screen of the same size) into
+        this one: each row's run of changed cells, reached by cursor
+        addressing, with erase-to-end where the row now ends sooner, then
+        this screen's attributes and cursor.  "" if nothing changed.
+        """
+        out, current = [], None
+        for y in range(self.rows):
+            chars, attrs = self.chars[y], self.attrs[y]
+            ochars, oattrs = old.chars[y], old.attrs[y]
+            if chars == ochars and attrs == oattrs:
+                continue
+            start, end = 0, self.cols
+            while chars[start] == ochars[start] and attrs[start] == oattrs[start]:
+                start += 1
+            while chars[end - 1] == ochars[end - 1] and attrs[end - 1] == oattrs[end - 1]:
+                end -= 1
+            # Never start or stop inside a wide character, old or new.
+            if start and FILLER in (chars[start], ochars[start]):
+                start -= 1
+            if end < self.cols and FILLER in (chars[end], ochars[end]):
+                end += 1
+            last = self.cols
+            while last > start and chars[last - 1] == " " and attrs[last - 1] == "\0":
+                last -= 1
+            erase = end > last
+            stop = last if erase else end
+            out.append(f"\x1b[{y + 1};{start + 1}H")
+            run = start
+            for x in range(start, stop + 1):
+                a = attrs[x] if x < stop else None
+                if a != current or a is None:
+                    if x > run:
+                        out.append(chars[run:x].replace(FILLER, ""))
+                    if a is not None:
+                        out.append(sgr_string(_ATTRS[ord(a)]))
+                        current = a
+                    run = x
+            if erase:
+                if current != "\0":
+                    out.append(sgr_string(DEFAULT))
+                    current = "\0"
+                out.append("\x1b[K")
+        if out or self.state != old.state:
+            if current != chr(self.aid):
+                out.append(sgr_string(self.state))
+        if out or (self.y, self.x) != (old.y, old.x):
+            out.append(f"\x1b[{self.y + 1};{min(self.x, self.cols - 1) + 1}H")
+        return "".join(out)
+
+    def scroll_diff(self, old, lines):
+        """
+        What turns a terminal showing `old` into this screen with `lines`
+        ((chars, attrs) rows that scrolled off its top, as history collects
+        them) in its scrollback.  The scrollback is wiped and the lines
+        scrolled out through two rows at the top, kept apart by margins, so
+        old's other rows stay; these are then moved up or down to where
+        they line up best with this screen, and diff() does the rest.
+        """
+        out = [sgr_string(DEFAULT), "\x1b[3J\x1b[1;2r\x1b[2K\x1b[2H\x1b[2K\x1b[H"]
+        for i, (chars, attrs) in enumerate(lines):
+            if i:
+                out.append("\r\n")
+            self._row(out, chars, attrs)
+            if attrs.rstrip("\0"):
+                out.append(sgr_string(DEFAULT))   # scrolled-in rows are blank
+        out.append("\n\n\x1b[r")
+        mid = old.copy()
+        mid.top, mid.bottom = 0, self.rows - 1
+        mid.x = mid.y = 0
+        mid.state = DEFAULT
+        for y in (0, 1):
+            mid._blank(y, 0, self.cols)
+        new, had = list(zip(self.chars, self.attrs)), list(zip(mid.chars, mid.attrs))
+        blank = (" " * self.cols, "\0" * self.cols)
+        best, shift = -1, 0
+        for n in sorted(range(1 - self.rows, self.rows), key=abs):
+            moved = [blank] * n + had[:self.rows - n] if n >= 0 else had[-n:] + [blank] * -n
+            same = sum(a == b != blank for a, b in zip(new, moved))
+            if same > best:
+                best, shift = same, n
+        if shift:
+            mid._lines(0, shift)
+            out.append(f"\x1b[{shift}L" if shift > 0 else f"\x1b[{-shift}M")
+        out.append(self.diff(mid))
+        return "".join(out)
+
+    def copy(self):
+        """A screen showing what this one does, to be fed on its own."""
+        other = Screen.__new__(Screen)
+        other.__dict__.update(self.__dict__)
+        other.chars = list(self.chars)
+        other.attrs = list(self.attrs)
+        if self._main is not None:
+            chars, attrs, *rest = self._main
+            other._main = (list(chars), list(attrs), *rest)
+        return other
+
+    def text(self):
+        """Plain text of the screen, trailing blanks trimmed."""
+        return "\n".join(r.replace(FILLER, "").rstrip() for r in self.chars).rstrip("\n")
+
+    def memory_bytes(self):
+        """Approximate size of the screen's own storage."""
+        import sys
+        return sum(sys.getsizeof(r) for r in self.chars) + \
+            sum(sys.getsizeof(a) for a in self.attrs)
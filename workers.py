@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Workers
+  Pre-fork serving for server.py on more than one core.  A master process
+  owns the listening socket and forks N workers, each a complete server.py
+  (its own I/O hub, pool, zygote and sessions) behind one GIL of its own.
+
+  A game's PTY lives in the worker that started it, so a reconnect (or a
+  spectator) must reach that worker.  Resume tokens and watch ids start
+  with the worker's index ("2.Xy9…"); the master peeks at each request
+  line without consuming it and hands the connection itself to the right
+  worker over a Unix socket (SCM_RIGHTS), so the worker reads the request
+  from the start as if it had accepted it.  New games and plain pages go round-robin; ?worker=N
+  pins a request, e.g. to scrape one worker's /metrics.
+  Started by server.py when DUNGEON_WORKERS is above 1.
+"""
+
+import os
+import selectors
+import signal
+import socket
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+# Bytes of a request the master looks at, and how long it waits for a
+# request line before routing the connection anywhere.
+PEEK_BYTES   = 4096
+PEEK_TIMEOUT = 2.0
+
+
+def count(setting):
+    """DUNGEON_WORKERS as a number: "auto" is one per CPU we may run on."""
+    if setting == "auto":
+        try:
+            return len(os.sched_getaffinity(0))
+        except AttributeError:
+            return os.cpu_count() or 1
+    return max(1, int(setting))
+
+
+def route(head, workers):
+    """Worker index a request belongs to, from its first bytes, or None."""
+    parts = head.split(b"\r\n", 1)[0].decode("latin-1").split()
+    if len(parts) < 2:
+        return None
+    url = urlsplit(parts[1])
+    query = parse_qs(url.query)
+    watched = url.path[len("/watch/"):] if url.path.startswith("/watch/") else ""
+    for value in (query.get("resume", [""])[0].split(".", 1)[0],
+                  watched.split(".", 1)[0],
+                  query.get("worker", [""])[0]):
+        if value.isdigit() and int(value) < workers:
+            return int(value)
+    return None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Worker process
+# ─────────────────────────────────────────────────────────────────────────────
+
+def serve_connections(app, chan):
+    """
+    Worker main loop: run every connection the master sends through a
+    threaded werkzeug server.  Returns when the master goes away.
+    """
+    from werkzeug.serving import make_server
+
+    # Its own listener (loopback, any port) is never accepted on; the
+    # server is only used for process_request(): a thread per connection.
+    srv = make_server("127.0.0.1", 0, app, threaded=True)
+    while True:
+        try:
+            msg, fds, _, _ = socket.recv_fds(chan, 16, 8)
+        except InterruptedError:
+            continue
+        if not msg:
+            break
+        for fd in fds:
+            conn = socket.socket(fileno=fd)
+            conn.setblocking(True)
+            try:
+                addr = conn.getpeername()
+            except OSError:
+                conn.close()
+                continue
+            srv.process_request(conn, addr)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Master process
+# ─────────────────────────────────────────────────────────────────────────────
+
+class Master:
+    """
+    Listens on port and forks `workers` children running
+    worker_main(index, chan); restarts any that die.  run() returns on
+    SIGINT or SIGTERM after stopping them.
+    """
+
+    def __init__(self, port, workers, worker_main):
+        self.port        = port
+        self.count       = workers
+        self.worker_main = worker_main
+        self.pids        = {}      # index → pid
+        self.chans       = {}      # index → master's end of the fd channel
+        self.next        = 0       # round-robin position
+        self.routed      = [0] * workers
+        self._stop       = False
+
+    def _fork(self, index):
+        ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                ours.close()
+                for other in self.chans.values():
+                    other.close()
+                self._listener.close()
+                signal.signal(signal.SIGTERM, signal.default_int_handler)
+                signal.signal(signal.SIGINT, signal.default_int_handler)
+                self.worker_main(index, theirs)
+            except KeyboardInterrupt:
+                pass
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdout.flush()
+                os._exit(code)
+        theirs.close()
+        old = self.chans.pop(index, None)
+        if old:
+            old.close()
+        self.pids[index], self.chans[index] = pid, ours
+
+    def _dispatch(self, conn, index):
+        if index is None:
+            index = self.next
+            self.next = (self.next + 1) % self.count
+        try:
+            socket.send_fds(self.chans[index], [b"c"], [conn.fileno()])
+            self.routed[index] += 1
+        except OSError:
+            pass            # worker restarting: the client retries
+        conn.close()
+
+    def _reap(self):
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            for index, p in list(self.pids.items()):
+                if p == pid and not self._stop:
+                    print(f"  worker {index} (pid {pid}) exited; restarting", file=sys.stderr)
+                    self._fork(index)
+
+    def _shutdown(self, *_):
+        self._stop = True
+
+    def _peek(self, conn):
+        """Route conn if its request line is in; True when it is done with."""
+        try:
+            head = conn.recv(PEEK_BYTES, socket.MSG_PEEK)
+        except BlockingIOError:
+            return False
+        except OSError:
+            head = b""
+        if not head:
+            conn.close()            # closed before saying anything
+            return True
+        if b"\r\n" in head or len(head) == PEEK_BYTES:
+            self._dispatch(conn, route(head, self.count))
+            return True
+        return False
+
+    def run(self):
+        self._listener = socket.create_server(("0.0.0.0", self.port), backlog=1024)
+        self._listener.setblocking(False)
+        for i in range(self.count):
+            self._fork(i)
+        signal.signal(signal.SIGTERM, self._shutdown)
+        signal.signal(signal.SIGINT, self._shutdown)
+
+        sel = selectors.DefaultSelector()
+        sel.register(self._listener, selectors.EVENT_READ)
+        # Connections that sent part of a request line: peeking again only
+        # when more arrives is not possible (the bytes stay readable), so
+        # these are polled until it completes or PEEK_TIMEOUT passes.
+        partial = {}
+        try:
+            while not self._stop:
+                for key, _ in sel.select(0.01 if partial else 0.5):
+                    if key.fileobj is self._listener:
+                        while True:
+                            try:
+                                conn, _ = self._listener.accept()
+                            except (BlockingIOError, InterruptedError):
+                                break
+                            conn.setblocking(False)
+                            sel.register(conn, selectors.EVENT_READ,
+                                         time.monotonic() + PEEK_TIMEOUT)
+                        continue
+                    conn = key.fileobj
+                    sel.unregister(conn)
+                    if not self._peek(conn):
+                        partial[conn] = key.data
+                now = time.monotonic()
+                for conn, deadline in list(partial.items()):
+                    if self._peek(conn):
+                        del partial[conn]
+                    elif now > deadline:
+                        del partial[conn]
+                        self._dispatch(conn, None)
+                for key in list(sel.get_map().values()):
+                    if key.data and now > key.data:   # silent since connecting
+                        sel.unregister(key.fileobj)
+                        key.fileobj.close()
+                self._reap()
+        finally:
+            for pid in self.pids.values():
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            for pid in self.pids.values():
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    pass
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Minimal WebSocket (RFC 6455)
+  Just enough of the protocol for aserver.py and the benchmark clients:
+  the opening handshake, (fragmented) data frames, ping/pong and close,
+  plus permessage-deflate (RFC 7692) on the server side.
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+import zlib
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONT   = 0x0
+OP_TEXT   = 0x1
+OP_BINARY = 0x2
+OP_CLOSE  = 0x8
+OP_PING   = 0x9
+OP_PONG   = 0xA
+
+MAX_MESSAGE = 1 << 20
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def accept_key(key):
+    digest = hashlib.sha1((key + GUID).encode()).digest()
+    return base64.b64encode(digest).decode()
+
+
+def handshake_response(key, deflate=None):
+    ext = f"Sec-WebSocket-Extensions: {deflate.response}\r\n" if deflate else ""
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept_key(key)}\r\n"
+        f"{ext}"
+        "\r\n"
+    ).encode()
+
+
+class PerMessageDeflate:
+    """
+    permessage-deflate with context takeover in both directions: each
+    message is compressed against everything sent before it, so a redrawn
+    room costs a few back-references.  raw/wire count outgoing bytes.
+    """
+
+    def __init__(self, level=6):
+        self._c   = zlib.compressobj(level, zlib.DEFLATED, -15)
+        self._d   = zlib.decompressobj(-15)
+        self.raw  = 0
+        self.wire = 0
+        self.response = "permessage-deflate"
+
+    def compress(self, payload):
+        data = self._c.compress(payload) + self._c.flush(zlib.Z_SYNC_FLUSH)
+        data = data[:-4]   # the 00 00 ff ff tail is implied (RFC 7692 7.2.1)
+        self.raw  += len(payload)
+        self.wire += len(data)
+        return data
+
+    def decompress(self, payload):
+        data = self._d.decompress(payload + b"\x00\x00\xff\xff", MAX_MESSAGE)
+        if self._d.unconsumed_tail:
+            raise ProtocolError("message too large")
+        return data
+
+
+def negotiate_deflate(offer):
+    """
+    A PerMessageDeflate for a Sec-WebSocket-Extensions offer, or None.
+    Offers that shrink our window or forbid our context takeover are
+    declined rather than honoured; browsers send neither.
+    """
+    for ext in offer.split(","):
+        name, *params = [p.strip() for p in ext.split(";")]
+        if name != "permessage-deflate":
+            continue
+        params = dict((p.split("=", 1) + [""])[:2] for p in params)
+        bits = params.pop("server_max_window_bits", None)
+        params.pop("client_max_window_bits", None)
+        params.pop("client_no_context_takeover", None)
+        if params or bits not in (None, "", "15"):
+            continue
+        deflate = PerMessageDeflate()
+        if bits is not None:
+            # RFC 7692 7.1.2.1: an accepted limit is echoed back.
+            deflate.response += "; server_max_window_bits=15"
+        return deflate
+    return None
+
+
+def _mask(data, key):
+    n = len(data)
+    if not n:
+        return data
+    k = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(k, "big")).to_bytes(n, "big")
+
+
+def encode_frame(opcode, payload, mask=False, fin=True, deflate=None):
+    """One frame; clients must mask, servers must not.  Data frames only
+    are compressed when a PerMessageDeflate is given."""
+    rsv1 = 0
+    if deflate and opcode in (OP_TEXT, OP_BINARY):
+        payload, rsv1 = deflate.compress(payload), 0x40
+    head = bytearray([(0x80 if fin else 0) | rsv1 | opcode])
+    n = len(payload)
+    mbit = 0x80 if mask else 0
+    if n < 126:
+        head.append(mbit | n)
+    elif n < 1 << 16:
+        head.append(mbit | 126)
+        head += struct.pack("!H", n)
+    else:
+        head.append(mbit | 127)
+        head += struct.pack("!Q", n)
+    if mask:
+        key = os.urandom(4)
+        return bytes(head) + key + _mask(payload, key)
+    return bytes(head) + payload
+
+
+async def read_frame(reader):
+    """Returns (fin, rsv1, opcode, payload) with the payload unmasked."""
+    b0, b1 = await reader.readexactly(2)
+    fin, rsv1, opcode = bool(b0 & 0x80), bool(b0 & 0x40), b0 & 0x0F
+    n = b1 & 0x7F
+    if n == 126:
+        n, = struct.unpack("!H", await reader.readexactly(2))
+    elif n == 127:
+        n, = struct.unpack("!Q", await reader.readexactly(8))
+    if n > MAX_MESSAGE:
+        raise ProtocolError("frame too large")
+    key = await reader.readexactly(4) if b1 & 0x80 else None
+    payload = await reader.readexactly(n)
+    if key:
+        payload = _mask(payload, key)
+    return fin, rsv1, opcode, payload
+
+
+async def read_message(reader, writer, mask=False, deflate=None, on_pong=None):
+    """
+    Next complete data message as (opcode, payload).  Pings are answered on
+    the way, and on_pong() is called for each pong; a close (or EOF) comes
+    back as (OP_CLOSE, b"").
+    """
+    parts, first_op, compressed = [], None, False
+    while True:
+        try:
+            fin, rsv1, opcode, payload = await read_frame(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return OP_CLOSE, b""
+        if opcode == OP_PING:
+            writer.write(encode_frame(OP_PONG, payload, mask))
+            continue
+        if opcode == OP_PONG:
+            if on_pong:
+                on_pong()
+            continue
+        if opcode == OP_CLOSE:
+            try:
+                writer.write(encode_frame(OP_CLOSE, payload[:2], mask))
+            except Exception:
+                pass
+            return OP_CLOSE, b""
+        if opcode != OP_CONT:
+            first_op, compressed = opcode, rsv1
+        parts.append(payload)
+        if sum(len(p) for p in parts) > MAX_MESSAGE:
+            raise ProtocolError("message too large")
+        if fin:
+            data = b"".join(parts)
+            if compressed:
+                if not deflate:
+                    raise ProtocolError("compressed frame without permessage-deflate")
+                data = deflate.decompress(data)
+            return first_op, data
+
+
+async def read_headers(reader):
+    """Request/status line and a lower-cased header dict of an HTTP head."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            k, _, v = line.partition(":")
+            headers[k.strip().lower()] = v.strip()
+    return lines[0], headers
+
+
+async def connect(host, port, path="/ws"):
+    """Client side: open a WebSocket and return (reader, writer)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n"
+        "\r\n"
+    ).encode())
+    status, headers = await read_headers(reader)
+    if " 101 " not in status or headers.get("sec-websocket-accept") != accept_key(key):
+        writer.close()
+        raise ProtocolError(f"handshake refused: {status}")
+    return reader, writer
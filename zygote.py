@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+  DUNGEON OF THE FORGOTTEN KING — Zygote
+  Preloads the game once and forks every session from that warm parent, so
+  ITEMS, ENEMIES, the journal, the map and all of ROOM_ART stay shared
+  copy-on-write between players instead of being rebuilt per interpreter.
+  Started by server.py when DUNGEON_SPAWN=zygote; not meant to be run by hand.
+"""
+
+import fcntl
+import gc
+import importlib
+import os
+import pty
+import random
+import select
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import termios
+import threading
+import time
+import traceback
+from pathlib import Path
+
+ZYGOTE_PATH = Path(__file__)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Zygote process
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _child(slave_fd, cols, rows, restore=None):
+    """Runs in the forked session process.  Never returns."""
+    code = 0
+    try:
+        os.setsid()
+        # Make the PTY our controlling terminal: resizes then deliver SIGWINCH
+        # and a closed master hangs the game up, exactly like a real terminal.
+        fcntl.ioctl(slave_fd, termios.TIOCSCTTY, 0)
+        for fd in (0, 1, 2):
+            os.dup2(slave_fd, fd)
+        if slave_fd > 2:
+            os.close(slave_fd)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        os.environ["TERM"] = "xterm-256color"
+        if cols and rows:
+            os.environ["COLUMNS"] = str(cols)
+            os.environ["LINES"] = str(rows)
+        if restore:
+            os.environ["DUNGEON_RESTORE"] = restore
+        # Every fork inherits the zygote's RNG state; without a reseed all
+        # players would roll the same crits and loot.
+        random.seed()
+        gc.enable()
+
+        import dungeon_game
+        dungeon_game.main()
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 0
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+        except Exception:
+            pass
+        os._exit(code)
+
+
+def _reap(signum, frame):
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if not pid:
+            return
+
+
+def serve(sock):
+    """
+    Zygote main loop: one "cols rows [snapshot]" request in, one pid, master
+    fd and pidfd out.
+    """
+    # Preload: shared with every fork.
+    for name in ("dungeon_ascii_art", "dungeon_game"):
+        importlib.import_module(name)
+
+    # Children are reaped here as they exit.  The server holds a pidfd for
+    # each, so it never signals a pid that has since been reused.
+    signal.signal(signal.SIGCHLD, _reap)
+    # Ctrl+C on the server's terminal reaches us too; the server shuts us
+    # down by closing the socket instead.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # Move everything loaded so far out of the collector's reach.  A child's
+    # GC passes then never touch (and so never copy) these pages.
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+
+    while True:
+        req = sock.recv(4096)
+        if not req:
+            break
+        cols, rows, *restore = req.decode().split(None, 2)
+        cols, rows = int(cols), int(rows)
+        master_fd, slave_fd = pty.openpty()
+        fcntl.ioctl(master_fd, termios.TIOCSWINSZ,
+                    struct.pack("HHHH", rows or 24, cols or 80, 0, 0))
+        # No reaping until the pidfd is open: the pid is the child's till then.
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
+        pid = os.fork()
+        if pid == 0:
+            sock.close()
+            os.close(master_fd)
+            _child(slave_fd, cols, rows, *restore)
+        fds = [master_fd]
+        if hasattr(os, "pidfd_open"):
+            fds.append(os.pidfd_open(pid))
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+        os.close(slave_fd)
+        socket.send_fds(sock, [b"%d\n" % pid], fds)
+        for fd in fds:
+            os.close(fd)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Server side
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ZygoteChild:
+    """
+    A session forked by the zygote.  It is not our child, so this mirrors the
+    small part of subprocess.Popen that server.py uses, driven by a pidfd:
+    it turns readable when the process exits, and signals sent through it
+    can never reach another process that was given the same pid.  Without
+    pidfds (before Linux 5.3) it falls back to the pid.
+    """
+
+    def __init__(self, pid, pidfd=None):
+        self.pid        = pid
+        self.pidfd      = pidfd
+        self.returncode = None
+
+    def _exited(self, timeout):
+        if self.pidfd is None:
+            try:
+                os.kill(self.pid, 0)
+                return False
+            except ProcessLookupError:
+                return True
+        waiter = select.poll()
+        waiter.register(self.pidfd, select.POLLIN)
+        return bool(waiter.poll(None if timeout is None else timeout * 1000))
+
+    def poll(self, timeout=0):
+        if self.returncode is None and self._exited(timeout):
+            self.returncode = -1       # real exit status went to the zygote
+            self.close()
+        return self.returncode
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll(0.02) is None:
+            if deadline is not None and time.monotonic() > deadline:
+                raise subprocess.TimeoutExpired(str(self.pid), timeout)
+            if self.pidfd is None:
+                time.sleep(0.02)
+        return self.returncode
+
+    def send_signal(self, sig):
+        if self.poll() is None:
+            if self.pidfd is None:
+                os.kill(self.pid, sig)
+            else:
+                signal.pidfd_send_signal(self.pidfd, sig)
+
+    def close(self):
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+
+    def __del__(self):
+        self.close()
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+class Zygote:
+    """Handle on the zygote process, restarting it if it ever goes away."""
+
+    def __init__(self):
+        self.proc  = None
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.proc = subprocess.Popen(
+            [sys.executable, "-u", str(ZYGOTE_PATH), str(theirs.fileno())],
+            pass_fds=(theirs.fileno(),),
+            cwd=str(ZYGOTE_PATH.parent),
+        )
+        theirs.close()
+        self._sock = ours
+
+    def spawn(self, cols=None, rows=None, restore=None):
+        """Fork a new game, or one resumed from a snapshot; returns
+        (ZygoteChild, master_fd)."""
+        with self._lock:
+            for attempt in (1, 2):
+                if self.proc is None or self.proc.poll() is not None:
+                    self.start()
+                try:
+                    req = b"%d %d" % (cols or 0, rows or 0)
+                    if restore:
+                        req += b" " + os.fsencode(restore)
+                    self._sock.sendall(req)
+                    msg, fds, _, _ = socket.recv_fds(self._sock, 64, 2)
+                    if msg and fds:
+                        return ZygoteChild(int(msg), *fds[1:]), fds[0]
+                except OSError:
+                    if attempt == 2:
+                        raise
+                self.shutdown()
+            raise OSError("zygote did not return a session")
+
+    def shutdown(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+        if self.proc and self.proc.poll() is None:
+            try:
+                self.proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+
+if __name__ == "__main__":
+    serve(socket.socket(fileno=int(sys.argv[1])))